@@ -51,6 +51,8 @@ from .ctf_comp import _read_ctf_comp, write_ctf_comp
 from .open import fiff_open
 from .pick import (
     _DATA_CH_TYPES_SPLIT,
+    _ch_table_key,
+    _ChannelTable,
     _contains_ch_type,
     _picks_to_idx,
     channel_type,
@@ -917,7 +919,9 @@ class ContainsMixin:
         info = self if isinstance(self, Info) else self.info
         none = "data" if only_data_chs else "all"
         picks = _picks_to_idx(info, picks, none, (), allow_empty=False)
-        ch_types = [channel_type(info, pick) for pick in picks]
+        ch_types = info._ch_table.types[picks].tolist()
+        if None in ch_types:  # raises an informative error
+            channel_type(info, picks[ch_types.index(None)])
         if only_data_chs:
             ch_types = [
                 ch_type for ch_type in ch_types if ch_type in _DATA_CH_TYPES_SPLIT
@@ -1853,11 +1857,49 @@ class Info(ValidatedDict, SetChannelsMixin, MontageMixin, ContainsMixin):
                 result[k] = hms
             else:
                 result[k] = deepcopy(v, memodict)
+        for key in ("_ch_table_cache", "_ch_table_checked"):
+            if key in self.__dict__:  # immutable
+                setattr(result, key, self.__dict__[key])
         result._unlocked = False
         return result
 
-    def _check_consistency(self, prepend_error=""):
-        """Do some self-consistency checks and datatype tweaks."""
+    @property
+    def _ch_table(self):
+        """Columnar view of the channels, cached until they change."""
+        chs = self["chs"]
+        table = self.__dict__.get("_ch_table_cache")
+        # channels can be modified in place through references held anywhere,
+        # so unless their number changed, compare their contents
+        if table is None or len(table.key) != len(chs):
+            table = self._ch_table_cache = _ChannelTable(chs)
+        else:
+            key = _ch_table_key(chs)
+            if table.key != key:
+                table = self._ch_table_cache = _ChannelTable(chs, key)
+        return table
+
+    def __setitem__(self, key, val):
+        """Set a member."""
+        super().__setitem__(key, val)
+        if key in ("chs", "ch_names", "nchan"):
+            self._clear_ch_table()
+
+    def __delitem__(self, key):
+        """Delete a member."""
+        self._clear_ch_table()
+        super().__delitem__(key)
+
+    def _clear_ch_table(self):
+        for key in ("_ch_table_cache", "_ch_table_checked"):
+            self.__dict__.pop(key, None)
+
+    def _check_consistency(self, prepend_error="", *, skip_checked_chs=False):
+        """Do some self-consistency checks and datatype tweaks.
+
+        With ``skip_checked_chs=True``, the channels are only checked if the
+        channel table changed since the last check, and ``_ch_table_checked``
+        holds the current channel table afterward.
+        """
         meas_date = self.get("meas_date")
         if meas_date is not None:
             if (
@@ -1870,15 +1912,17 @@ class Info(ValidatedDict, SetChannelsMixin, MontageMixin, ContainsMixin):
                     f" or None, got {repr(self['meas_date'])!r}"
                 )
 
-        chs = [ch["ch_name"] for ch in self["chs"]]
-        if (
-            len(self["ch_names"]) != len(chs)
-            or any(ch_1 != ch_2 for ch_1, ch_2 in zip(self["ch_names"], chs))
-            or self["nchan"] != len(chs)
-        ):
+        if skip_checked_chs:
+            table = self._ch_table
+            chs = table.names
+            check_chs = self.__dict__.get("_ch_table_checked") is not table
+        else:
+            chs = [ch["ch_name"] for ch in self["chs"]]
+            check_chs = True
+        if list(self["ch_names"]) != chs or self["nchan"] != len(chs):
             raise RuntimeError(
-                f"{prepend_error}info channel name inconsistency detected, please "
-                "notify MNE-Python developers"
+                f"{prepend_error}info channel name inconsistency detected, "
+                "please notify MNE-Python developers"
             )
 
         # make sure we have the proper datatypes
@@ -1893,6 +1937,8 @@ class Info(ValidatedDict, SetChannelsMixin, MontageMixin, ContainsMixin):
                 if key not in proj:
                     raise RuntimeError(f"Projection incomplete, missing {key}")
 
+        if not check_chs:
+            return
         # Ensure info['chs'] has immutable entries (copies much faster)
         for ci, ch in enumerate(self["chs"]):
             _check_ch_keys(ch, ci)
@@ -1913,6 +1959,7 @@ class Info(ValidatedDict, SetChannelsMixin, MontageMixin, ContainsMixin):
             self["ch_names"] = _unique_channel_names(self["ch_names"])
             for idx, ch_name in enumerate(self["ch_names"]):
                 self["chs"][idx]["ch_name"] = ch_name
+        self._ch_table_checked = self._ch_table
 
     def _update_redundant(self):
         """Update the redundant entries."""
@@ -2032,13 +2079,20 @@ def write_fiducials(
 
 
 @verbose
-def read_info(fname, verbose=None):
+def read_info(fname, *, header_only=False, verbose=None):
     """Read measurement info from a file.
 
     Parameters
     ----------
     fname : path-like
         File name.
+    header_only : bool
+        If True, stop reading the file once the measurement info has been read,
+        without indexing the data that follow. This is much faster for large
+        files and gives the same info for files written by MNE-Python or
+        MaxFilter, which store the measurement info before the data.
+
+        .. versionadded:: 1.10
     %(verbose)s
 
     Returns
@@ -2047,7 +2101,7 @@ def read_info(fname, verbose=None):
     """
     check_fname(fname, "Info", (".fif", ".fif.gz"))
     fname = _check_fname(fname, must_exist=True, overwrite="read")
-    f, tree, _ = fiff_open(fname)
+    f, tree, _ = fiff_open(fname, header_only=header_only)
     with f as fid:
         info = read_meas_info(fid, tree)[0]
     return info
@@ -2,6 +2,11 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from gzip import GzipFile
 from io import SEEK_SET, BytesIO
 from pathlib import Path
@@ -9,7 +14,15 @@ from pathlib import Path
 import numpy as np
 from scipy.sparse import issparse
 
-from ..utils import _check_fname, _file_like, _validate_type, logger, verbose, warn
+from ..utils import (
+    _check_fname,
+    _file_like,
+    _validate_type,
+    get_config,
+    logger,
+    verbose,
+    warn,
+)
 from .constants import FIFF
 from .tag import Tag, _call_dict_names, _matrix_info, _read_tag_header, read_tag
 from .tree import dir_tree_find, make_dir_tree
@@ -45,7 +58,7 @@ def _fiff_get_fid(fname):
         fid.seek(0)
     else:
         _validate_type(fname, Path, "fname", extra="or file-like")
-        if fname.suffixes[-1] == ".gz":
+        if fname.suffix == ".gz":
             logger.debug("Using gzip I/O")
             fid = GzipFile(fname, "rb")  # Open in binary mode
         else:
@@ -54,6 +67,71 @@ def _fiff_get_fid(fname):
     return fid
 
 
+class _FidPool:
+    """A bounded pool of open FIF file handles, evicted least-recently-used first.
+
+    Reading many short segments from many files (e.g., a concatenation of
+    thousands of raw files) otherwise opens and closes a file for every read.
+    Handles are only kept open while the pool holds fewer than ``max_size`` of
+    them, so the number of file descriptors stays bounded. The pool is disabled
+    unless the ``MNE_FIF_FID_POOL_SIZE`` config variable is set.
+    """
+
+    def __init__(self):
+        self.max_size = None  # read lazily from the config
+        self._lock = threading.Lock()
+        self._fids = OrderedDict()  # (fname, stat key) -> list of idle handles
+
+    def _get_max_size(self):
+        if self.max_size is None:
+            self.max_size = int(get_config("MNE_FIF_FID_POOL_SIZE", "0"))
+        return self.max_size
+
+    @contextmanager
+    def open(self, fname):
+        """Check out a handle, returning it to the pool when done."""
+        if _file_like(fname) or self._get_max_size() <= 0:
+            with _fiff_get_fid(fname) as fid:
+                yield fid
+            return
+        # a file that has been replaced since it was opened must be re-opened
+        stat = os.stat(fname)
+        key = (str(fname), stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            idle = self._fids.get(key, [])
+            fid = idle.pop() if idle else None
+        if fid is None:
+            fid = _fiff_get_fid(fname)
+        try:
+            yield fid
+        except BaseException:
+            fid.close()
+            raise
+        with self._lock:
+            self._fids.setdefault(key, []).append(fid)
+            self._fids.move_to_end(key)
+            self._evict(self.max_size)
+
+    def _evict(self, max_size):
+        n_open = sum(len(fids) for fids in self._fids.values())
+        while n_open > max_size:
+            key = next(iter(self._fids))
+            fids = self._fids[key]
+            if fids:
+                fids.pop(0).close()
+                n_open -= 1
+            if not fids:
+                del self._fids[key]
+
+    def clear(self):
+        """Close all idle handles."""
+        with self._lock:
+            self._evict(0)
+
+
+_fid_pool = _FidPool()
+
+
 def _get_next_fname(fid, fname, tree):
     """Get the next filename in split files."""
     _validate_type(fname, (Path, None), "fname")
@@ -104,8 +182,18 @@ def _get_next_fname(fid, fname, tree):
     return next_fname
 
 
+# Blocks holding data, reading just the header stops when one of them starts
+_DATA_BLOCKS = (
+    FIFF.FIFFB_RAW_DATA,
+    FIFF.FIFFB_CONTINUOUS_DATA,
+    FIFF.FIFFB_IAS_RAW_DATA,
+    FIFF.FIFFB_EVOKED,
+    FIFF.FIFFB_MNE_EPOCHS,
+)
+
+
 @verbose
-def fiff_open(fname, preload=False, verbose=None):
+def fiff_open(fname, preload=False, *, header_only=False, verbose=None):
     """Open a FIF file.
 
     Parameters
@@ -116,6 +204,12 @@ def fiff_open(fname, preload=False, verbose=None):
         If True, all data from the file is read into a memory buffer. This
         requires more memory, but can be faster for I/O operations that require
         frequent seeks.
+    header_only : bool
+        If True, only the tags up to the start of the first data block (raw
+        data, evoked data or epochs) following the measurement info are read,
+        so the tree contains the measurement info but (almost) none of the data.
+
+        .. versionadded:: 1.10
     %(verbose)s
 
     Returns
@@ -127,16 +221,23 @@ def fiff_open(fname, preload=False, verbose=None):
         lists and tags.
     directory : list
         A list of tags.
+
+    Notes
+    -----
+    If the ``MNE_FIF_INDEX_DIR`` config variable is set (see
+    :func:`mne.set_config`), the parsed tag directory and tree of files
+    opened by path are stored in that directory and reused when the same
+    file (same path, size, and modification time) is opened again.
     """
     fid = _fiff_get_fid(fname)
     try:
-        return _fiff_open(fname, fid, preload)
+        return _fiff_open(fname, fid, preload, header_only=header_only)
     except Exception:
         fid.close()
         raise
 
 
-def _fiff_open(fname, fid, preload):
+def _fiff_open(fname, fid, preload, *, header_only=False):
     # do preloading of entire file
     if preload:
         # note that StringIO objects instantiated this way are read-only,
@@ -162,7 +263,21 @@ def _fiff_open(fname, fid, preload):
     if tag.kind != FIFF.FIFF_DIR_POINTER:
         raise ValueError(f"{prefix} have a directory pointer")
 
+    if header_only:
+        logger.debug(f"    Creating tag directory for the header of {fname}...")
+        directory = _read_header_directory(fid)
+        tree, _ = make_dir_tree(fid, directory, indent=1)
+        fid.seek(0)
+        return fid, tree, directory
+
     #   Read or create the directory tree
+    index_fname, index_key = _get_fif_index_fname(fname)
+    if index_fname is not None:
+        out = _read_fif_index(index_fname, index_key)
+        if out is not None:
+            logger.debug(f"    Using cached tag directory for {fname}")
+            fid.seek(0)
+            return (fid,) + out
     logger.debug(f"    Creating tag directory for {fname}...")
 
     dirpos = int(tag.data.item())
@@ -192,6 +307,8 @@ def _fiff_open(fname, fid, preload):
             directory.append(tag)
 
     tree, _ = make_dir_tree(fid, directory, indent=1)
+    if index_fname is not None:
+        _write_fif_index(index_fname, index_key, tree, directory)
 
     logger.debug("[done]")
 
@@ -201,6 +318,130 @@ def _fiff_open(fname, fid, preload):
     return fid, tree, directory
 
 
+def _read_header_directory(fid):
+    """Scan the tags up to the start of the data after the measurement info."""
+    pos = 0
+    directory = list()
+    info_read = False
+    while pos is not None:
+        tag = _read_tag_header(fid, pos)
+        if tag is None:
+            break
+        directory.append(tag)
+        if tag.kind in (FIFF.FIFF_BLOCK_START, FIFF.FIFF_BLOCK_END):
+            block = int(read_tag(fid, pos).data.item())
+            if tag.kind == FIFF.FIFF_BLOCK_END and block == FIFF.FIFFB_MEAS_INFO:
+                info_read = True
+            elif info_read and block in _DATA_BLOCKS:  # a start, the data follow
+                break
+        pos = tag.next_pos
+    return directory
+
+
+def _get_fif_index_fname(fname):
+    """Get the index cache filename and key for a FIF file (if enabled)."""
+    index_dir = get_config("MNE_FIF_INDEX_DIR", None)
+    if index_dir is None or not isinstance(fname, Path):
+        return None, None
+    fname = fname.resolve()
+    stat = fname.stat()
+    index_key = np.array([stat.st_size, stat.st_mtime_ns], np.int64)
+    name = hashlib.sha1(str(fname).encode("utf-8")).hexdigest()
+    return Path(index_dir).expanduser() / f"{name}-idx.npz", index_key
+
+
+# id structs are stored as (version, machid[0], machid[1], secs, usecs), with all
+# -1 meaning "None"
+_NO_ID = np.full(5, -1, np.int64)
+
+
+def _id_to_array(id_):
+    if id_ is None:
+        return _NO_ID
+    return np.array(
+        [id_["version"], *id_["machid"], id_["secs"], id_["usecs"]], np.int64
+    )
+
+
+def _array_to_id(arr):
+    if (arr == _NO_ID).all():
+        return None
+    return dict(
+        version=int(arr[0]),
+        machid=arr[1:3].astype(">i4"),
+        secs=int(arr[3]),
+        usecs=int(arr[4]),
+    )
+
+
+def _write_fif_index(index_fname, index_key, tree, directory):
+    """Write the tag directory and tree of a FIF file to the index cache."""
+    tag_idx = {id(tag): ti for ti, tag in enumerate(directory)}
+    nodes, ents = list(), list()
+    stack = [tree]
+    while stack:  # depth-first, children in order
+        node = stack.pop()
+        this_ents = node["directory"] if node["nent"] else []
+        nodes.append(
+            [node["block"], node["nchild"], len(this_ents)]
+            + list(_id_to_array(node["id"]))
+            + list(_id_to_array(node["parent_id"]))
+        )
+        ents.extend(tag_idx[id(tag)] for tag in this_ents)
+        stack.extend(node["children"][::-1])
+    index_fname.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fname = index_fname.with_name(f"{index_fname.stem}-{os.getpid()}.tmp.npz")
+    try:
+        np.savez(
+            tmp_fname,
+            key=index_key,
+            directory=np.array(
+                [[t.kind, t.type, t.size, t.next, t.pos] for t in directory],
+                np.int64,
+            ).reshape(-1, 5),
+            nodes=np.array(nodes, np.int64).reshape(-1, 13),
+            ents=np.array(ents, np.int64),
+        )
+        os.replace(tmp_fname, index_fname)
+    except OSError as exp:
+        logger.debug(f"    Could not write FIF index cache {index_fname}: {exp}")
+        tmp_fname.unlink(missing_ok=True)
+
+
+def _read_fif_index(index_fname, index_key):
+    """Read the tag directory and tree of a FIF file from the index cache."""
+    try:
+        with np.load(index_fname, allow_pickle=False) as npz:
+            if not np.array_equal(npz["key"], index_key):
+                return None
+            dir_arr, nodes, ents = npz["directory"], npz["nodes"], npz["ents"]
+    except Exception:  # missing, stale, or corrupted
+        return None
+    directory = [
+        Tag(kind=int(k), type=int(t), size=int(s), next=int(n), pos=int(p))
+        for k, t, s, n, p in dir_arr
+    ]
+    ni, ei = 0, 0
+
+    def _make_node():
+        nonlocal ni, ei
+        block, nchild, nent = (int(x) for x in nodes[ni, :3])
+        node = dict(
+            block=block,
+            id=_array_to_id(nodes[ni, 3:8]),
+            parent_id=_array_to_id(nodes[ni, 8:13]),
+            nent=nent,
+            nchild=nchild,
+            directory=[directory[e] for e in ents[ei : ei + nent]] or None,
+        )
+        ni += 1
+        ei += nent
+        node["children"] = [_make_node() for _ in range(nchild)]
+        return node
+
+    return _make_node(), directory
+
+
 @verbose
 def show_fiff(
     fname,
@@ -2,7 +2,9 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import operator
 import re
+from collections import OrderedDict
 from copy import deepcopy
 
 import numpy as np
@@ -218,6 +220,127 @@ _second_rules = {
 }
 
 
+_get_ch_table_entries = operator.itemgetter("ch_name", "kind", "coil_type", "unit")
+
+
+def _ch_table_key(chs):
+    """Get the channel entries a channel table is built from."""
+    try:
+        return list(map(_get_ch_table_entries, chs))
+    except KeyError:
+        return [
+            (
+                ch.get("ch_name"),
+                ch.get("kind"),
+                ch.get("coil_type", FIFF.FIFFV_COIL_NONE),
+                ch.get("unit"),
+            )
+            for ch in chs
+        ]
+
+
+class _ChannelTable:
+    """Columnar view of info["chs"] for vectorized picking.
+
+    Instances are cached by :class:`mne.Info` as long as the channel names,
+    kinds, coil types and units in ``key`` do not change, are shared by its
+    copies and must not be modified. Only the entries that channel types
+    depend on are included, ``loc`` for example is often modified in place.
+    """
+
+    _dtype = np.dtype([("kind", np.int64), ("coil_type", np.int64), ("unit", np.int64)])
+
+    def __init__(self, chs, key=None):
+        self.key = _ch_table_key(chs) if key is None else key
+        self.names = [entries[0] for entries in self.key]
+        self.idx = {name: ii for ii, name in enumerate(self.names)}
+        self.data = np.zeros(len(chs), self._dtype)
+        if len(chs):
+            self.data["kind"], self.data["coil_type"], self.data["unit"] = zip(
+                *(entries[1:] for entries in self.key)
+            )
+        self.data.flags.writeable = False
+        # channel types, None for unknown ones
+        self.types = np.full(len(chs), None, object)
+        for kind in np.unique(self.data["kind"]):
+            mask = self.data["kind"] == kind
+            ch_type = _first_rule.get(int(kind))
+            if ch_type in _second_rules:
+                key, second_rule = _second_rules[ch_type]
+                for val in np.unique(self.data[key][mask]):
+                    self.types[mask & (self.data[key] == val)] = second_rule.get(
+                        int(val)
+                    )
+            else:
+                self.types[mask] = ch_type
+        self.types.flags.writeable = False
+        self.type_picks = dict()
+        for ch_type in dict.fromkeys(self.types):
+            self.type_picks[ch_type] = np.where(self.types == ch_type)[0]
+            self.type_picks[ch_type].flags.writeable = False
+        self.picks = OrderedDict()  # see _get_cached_picks
+
+
+# Maximum number of pick results cached per channel table
+_PICKS_CACHE_SIZE = 128
+
+
+def _as_hashable(val):
+    if isinstance(val, list | np.ndarray):
+        val = tuple(val)
+        if not all(isinstance(v, str | int | np.integer) for v in val):
+            raise TypeError
+    hash(val)
+    return val
+
+
+def _get_picks_cache_key(info, exclude, kind, args):
+    """Get a key for caching the picks resolved from args, or None."""
+    from .meas_info import Info
+
+    if not isinstance(info, Info):
+        return None
+    if isinstance(exclude, str) and exclude == "bads":
+        exclude = ("bads",) + tuple(info.get("bads", []))
+    # the default of ref_meg in pick_types depends on the compensators
+    key = (kind, bool(info.get("comps")), exclude) + tuple(args)
+    try:
+        hash(key)
+    except TypeError:  # e.g., lists
+        try:
+            key = tuple(_as_hashable(val) for val in key)
+        except TypeError:
+            return None
+    return key
+
+
+def _get_cached_picks(table, key):
+    """Get a copy of cached picks, or None."""
+    if key is None:
+        return None
+    cache = table.picks
+    try:
+        picks = cache[key]
+    except KeyError:
+        return None
+    cache.move_to_end(key)
+    if isinstance(picks, tuple):  # with the kind
+        return (picks[0].copy(),) + picks[1:]
+    return picks.copy()
+
+
+def _cache_picks(table, key, picks):
+    """Cache picks, returning them."""
+    if key is not None:
+        cache = table.picks
+        cache[key] = (
+            (picks[0].copy(),) + picks[1:] if isinstance(picks, tuple) else picks.copy()
+        )
+        while len(cache) > _PICKS_CACHE_SIZE:
+            cache.popitem(last=False)
+    return picks
+
+
 @fill_doc
 def channel_type(info, idx):
     """Get channel type.
@@ -295,11 +418,13 @@ def pick_channels(ch_names, include, exclude=(), ordered=True, *, verbose=None):
         include = list(ch_names)
     if not isinstance(exclude, list):
         exclude = list(exclude)
+    name_idx = {name: ii for ii, name in enumerate(ch_names)}
+    exclude = set(exclude)
     sel, missing = list(), list()
     for name in include:
-        if name in ch_names:
+        if name in name_idx:
             if name not in exclude:
-                sel.append(ch_names.index(name))
+                sel.append(name_idx[name])
         else:
             missing.append(name)
     if len(missing) and ordered:
@@ -414,7 +539,7 @@ def _check_meg_type(meg, allow_auto=False):
 
 def _check_info_exclude(info, exclude):
     _validate_type(info, "info")
-    info._check_consistency()
+    info._check_consistency(skip_checked_chs=True)
     if exclude is None:
         raise ValueError('exclude must be a list of strings or "bads"')
     elif exclude == "bads":
@@ -477,6 +602,44 @@ def pick_types(
     _validate_type(meg, (bool, str), "meg")
 
     exclude = _check_info_exclude(info, exclude)
+    # the same picks get resolved over and over (e.g., for each epoch)
+    cache_key = _get_picks_cache_key(
+        info,
+        exclude,
+        "pick_types",
+        (
+            meg,
+            eeg,
+            stim,
+            eog,
+            ecg,
+            emg,
+            ref_meg,
+            misc,
+            resp,
+            chpi,
+            exci,
+            ias,
+            syst,
+            seeg,
+            dipole,
+            gof,
+            bio,
+            ecog,
+            fnirs,
+            csd,
+            dbs,
+            temperature,
+            gsr,
+            eyetrack,
+            include,
+            selection,
+        ),
+    )
+    table = info._ch_table_checked  # by _check_info_exclude
+    sel = _get_cached_picks(table, cache_key)
+    if sel is not None:
+        return sel
     nchan = info["nchan"]
     pick = np.zeros(nchan, dtype=bool)
 
@@ -552,10 +715,12 @@ def pick_types(
         for key in _FNIRS_CH_TYPES_SPLIT:
             param_dict[key] = fnirs
     warned = [False]
-    for k in range(nchan):
-        ch_type = channel_type(info, k)
+    chs = info["chs"]
+    for ch_type, idx in table.type_picks.items():
+        if ch_type is None:
+            channel_type(info, idx[0])  # raises an informative error
         try:
-            pick[k] = param_dict[ch_type]
+            pick[idx] = param_dict[ch_type]
         except KeyError:  # not so simple
             assert (
                 ch_type
@@ -563,35 +728,34 @@ def pick_types(
                 + _FNIRS_CH_TYPES_SPLIT
                 + _EYETRACK_CH_TYPES_SPLIT
             )
-            if ch_type in ("grad", "mag"):
-                pick[k] = _triage_meg_pick(info["chs"][k], meg)
-            elif ch_type == "ref_meg":
-                pick[k] = _triage_meg_pick(info["chs"][k], ref_meg)
-            elif ch_type in ("eyegaze", "pupil"):
-                pick[k] = _triage_eyetrack_pick(info["chs"][k], eyetrack)
-            else:  # ch_type in ('hbo', 'hbr')
-                pick[k] = _triage_fnirs_pick(info["chs"][k], fnirs, warned)
+            for k in idx:
+                if ch_type in ("grad", "mag"):
+                    pick[k] = _triage_meg_pick(chs[k], meg)
+                elif ch_type == "ref_meg":
+                    pick[k] = _triage_meg_pick(chs[k], ref_meg)
+                elif ch_type in ("eyegaze", "pupil"):
+                    pick[k] = _triage_eyetrack_pick(chs[k], eyetrack)
+                else:  # ch_type in ('hbo', 'hbr')
+                    pick[k] = _triage_fnirs_pick(chs[k], fnirs, warned)
 
     # restrict channels to selection if provided
     if selection is not None:
         # the selection only restricts these types of channels
         sel_kind = [FIFF.FIFFV_MEG_CH, FIFF.FIFFV_REF_MEG_CH, FIFF.FIFFV_EEG_CH]
-        for k in np.where(pick)[0]:
-            if (
-                info["chs"][k]["kind"] in sel_kind
-                and info["ch_names"][k] not in selection
-            ):
+        for k in np.where(pick & np.isin(table.data["kind"], sel_kind))[0]:
+            if table.names[k] not in selection:
                 pick[k] = False
 
-    myinclude = [info["ch_names"][k] for k in range(nchan) if pick[k]]
-    myinclude += include
-
-    if len(myinclude) == 0:
-        sel = np.array([], int)
-    else:
-        sel = pick_channels(info["ch_names"], myinclude, exclude, ordered=False)
+    # same as pick_channels(ch_names, myinclude, exclude, ordered=False)
+    _check_excludes_includes(include)
+    _check_excludes_includes(exclude)
+    for names, value in ((include, True), (exclude, False)):
+        for name in names:
+            if name in table.idx:
+                pick[table.idx[name]] = value
+    sel = np.where(pick)[0]
 
-    return sel
+    return _cache_picks(table, cache_key, sel)
 
 
 @verbose
@@ -868,9 +1032,8 @@ def channel_indices_by_type(info, picks=None):
     picks = _picks_to_idx(info, picks, none="all", exclude=(), allow_empty=True)
     for k in picks:
         ch_type = channel_type(info, k)
-        for key in idx_by_type.keys():
-            if ch_type == key:
-                idx_by_type[key].append(k)
+        if ch_type in idx_by_type:
+            idx_by_type[ch_type].append(k)
     return idx_by_type
 
 
@@ -951,6 +1114,8 @@ def _contains_ch_type(info, ch_type):
     has_ch_type : bool
         Whether the channel type is present or not.
     """
+    from .meas_info import Info
+
     _validate_type(ch_type, "str", "ch_type")
 
     meg_extras = list(_MEG_CH_TYPES_SPLIT)
@@ -967,6 +1132,10 @@ def _contains_ch_type(info, ch_type):
         raise ValueError(
             f'Cannot check for channels of type "{ch_type}" because info is None'
         )
+    if isinstance(info, Info):
+        type_picks = info._ch_table.type_picks
+        if None not in type_picks:
+            return ch_type in type_picks
     return any(ch_type == channel_type(info, ii) for ii in range(info["nchan"]))
 
 
@@ -997,9 +1166,10 @@ def _picks_by_type(info, meg_combined=False, ref_meg=False, exclude="bads"):
         meg_combined = _mag_grad_dependent(info)
 
     picks_list = {ch_type: list() for ch_type in _DATA_CH_TYPES_SPLIT}
+    types = info._ch_table_checked.types  # by _check_info_exclude
     for k in range(info["nchan"]):
-        if info["chs"][k]["ch_name"] not in exclude:
-            this_type = channel_type(info, k)
+        if info["ch_names"][k] not in exclude:
+            this_type = types[k]
             try:
                 picks_list[this_type].append(k)
             except KeyError:
@@ -1012,6 +1182,8 @@ def _picks_by_type(info, meg_combined=False, ref_meg=False, exclude="bads"):
                             picks_list["mag"].append(k)
                         elif ch["unit"] == FIFF.FIFF_UNIT_T_M:
                             picks_list["grad"].append(k)
+                elif this_type is None:
+                    channel_type(info, k)  # raises an informative error
                 else:
                     pass  # not a data channel type
     picks_list = [
@@ -1222,6 +1394,31 @@ def _picks_to_idx(
         info = _ensure_int(info, "info", "an int or Info")
         n_chan = info
     assert n_chan >= 0
+    # the same picks get resolved over and over (e.g., for each epoch), int
+    # arrays are quick to check though
+    table = cache_key = None
+    if isinstance(info, Info) and not isinstance(picks, np.ndarray):
+        # do the checks that a cached result would otherwise skip
+        info._check_consistency(skip_checked_chs=True)
+        table = info._ch_table_checked
+        _check_excludes_includes(exclude, info=info, allow_bads=True)
+        cache_key = _get_picks_cache_key(
+            info,
+            exclude,
+            "picks_to_idx",
+            (
+                type(picks),
+                picks,
+                none,
+                allow_empty,
+                with_ref_meg,
+                return_kind,
+                picks_on,
+            ),
+        )
+    out = _get_cached_picks(table, cache_key)
+    if out is not None:
+        return out
 
     orig_picks = picks
     # We do some extra_repr gymnastics to avoid calling repr(orig_picks) too
@@ -1287,8 +1484,8 @@ def _picks_to_idx(
         )
     picks %= n_chan  # ensure positive
     if return_kind:
-        return picks, picked_ch_type_or_generic
-    return picks
+        return _cache_picks(table, cache_key, (picks, picked_ch_type_or_generic))
+    return _cache_picks(table, cache_key, picks)
 
 
 def _picks_str_to_idx(
@@ -1310,8 +1507,14 @@ def _picks_str_to_idx(
         if picks[0] in ("all", "data", "data_or_ica"):
             if picks[0] == "all":
                 use_exclude = info["bads"] if exclude == "bads" else exclude
-                picks_generic = pick_channels(
-                    info["ch_names"], info["ch_names"], exclude=use_exclude
+                use_exclude = set(_check_excludes_includes(use_exclude))
+                picks_generic = np.array(
+                    [
+                        ii
+                        for ii, name in enumerate(info["ch_names"])
+                        if name not in use_exclude
+                    ],
+                    int,
                 )
             elif picks[0] == "data":
                 picks_generic = _pick_data_channels(
@@ -1331,10 +1534,11 @@ def _picks_str_to_idx(
 
     bad_names = []
     picks_name = list()
+    name_idx = info._ch_table.idx
     for pick in picks:
         try:
-            picks_name.append(info["ch_names"].index(pick))
-        except ValueError:
+            picks_name.append(name_idx[pick])
+        except KeyError:
             bad_names.append(pick)
 
     #
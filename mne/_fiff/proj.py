@@ -12,6 +12,7 @@ from ..defaults import _BORDER_DEFAULT, _EXTRAPOLATE_DEFAULT, _INTERPOLATION_DEF
 from ..fixes import _safe_svd
 from ..utils import (
     _check_option,
+    _ensure_writeable,
     _validate_type,
     fill_doc,
     logger,
@@ -338,9 +339,10 @@ class ProjMixin:
         self._projector, self.info = _projector, info
         if isinstance(self, BaseRaw | Evoked):
             if self.preload:
-                self._data = np.dot(self._projector, self._data)
+                self._data = _apply_projector(self._projector, self._data)
         else:  # BaseEpochs
             if self.preload:
+                _ensure_writeable(self)
                 for ii, e in enumerate(self._data):
                     self._data[ii] = self._project_epoch(e)
             else:
@@ -542,6 +544,18 @@ class ProjMixin:
         return self
 
 
+def _apply_projector(projector, data, n_chunk=10000):
+    """Apply a projector to data (in double precision)."""
+    if data.dtype in (np.float64, np.complex128):
+        return np.dot(projector, data)
+    # single precision data are projected in place, one chunk at a time
+    for start in range(0, data.shape[-1], n_chunk):
+        data[..., start : start + n_chunk] = (
+            projector @ data[..., start : start + n_chunk]
+        )
+    return data
+
+
 def _proj_equal(a, b, check_active=True):
     """Test if two projectors are equal."""
     equal = (
@@ -8,6 +8,7 @@ from ..defaults import DEFAULTS
 from ..utils import (
     _check_option,
     _check_preload,
+    _ensure_writeable,
     _on_missing,
     _validate_type,
     fill_doc,
@@ -26,6 +27,7 @@ def _check_before_reference(inst, ref_from, ref_to, ch_type):
     """Prepare instance for referencing."""
     # Check to see that data is preloaded
     _check_preload(inst, "Applying a reference")
+    _ensure_writeable(inst)
 
     ch_type = _get_ch_type(inst, ch_type)
     ch_dict = {**{type_: True for type_ in ch_type}, "meg": False, "ref_meg": False}
@@ -89,6 +91,7 @@ def _check_before_dict_reference(inst, ref_dict):
     """Prepare instance for dict-based referencing."""
     # Check to see that data is preloaded
     _check_preload(inst, "Applying a reference")
+    _ensure_writeable(inst)
 
     # Promote all values to list-like. This simplifies our logic and also helps catch
     # self-referencing cases like `{"Cz": ["Cz"]}`
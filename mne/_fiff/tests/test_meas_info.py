@@ -51,8 +51,10 @@ from mne._fiff.meas_info import (
     write_fiducials,
     write_info,
 )
+from mne._fiff.open import fiff_open
 from mne._fiff.proj import Projection
 from mne._fiff.tag import _coil_trans_to_loc, _loc_to_coil_trans
+from mne._fiff.tree import dir_tree_find
 from mne._fiff.write import DATE_NONE, _generate_meas_id
 from mne.channels import (
     equalize_channels,
@@ -353,6 +355,31 @@ def test_read_write_info(tmp_path):
         write_info(fname, info, overwrite=True)
 
 
+def test_read_info_header_only(tmp_path):
+    """Test reading only the header of a file."""
+    montage = make_standard_montage("standard_1020")
+    info = create_info(montage.ch_names[:20], 1000.0, "eeg")
+    info.set_montage(montage)
+    info["bads"] = info.ch_names[:2]
+    raw = RawArray(np.zeros((20, 20000)), info)
+    raw.set_eeg_reference(projection=True)
+    raw.set_annotations(Annotations([1.0], [0.5], ["x"]))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, buffer_size_sec=0.1)
+    info = read_info(fname)
+    info_header = read_info(fname, header_only=True)
+    assert_object_equal(info_header, info)
+    f, _, directory_full = fiff_open(fname)
+    f.close()
+    f, tree, directory = fiff_open(fname, header_only=True)
+    f.close()
+    assert len(directory) < len(directory_full) - 200  # no data buffers
+    assert len(dir_tree_find(tree, FIFF.FIFFB_RAW_DATA)) == 1
+    # also without any data blocks
+    write_info(tmp_path / "test-info.fif", info)
+    assert_object_equal(read_info(tmp_path / "test-info.fif", header_only=True), info)
+
+
 @testing.requires_testing_data
 def test_dir_warning():
     """Test that trying to read a bad filename emits a warning before an error."""
@@ -1209,6 +1236,33 @@ def test_pickle(fname_info, unlocked, protocol):
     assert info_un["bads"]._mne_info is info_un
 
 
+def test_info_copy_held_reference():
+    """Test that copies do not see changes made through held references."""
+    montage = make_standard_montage("standard_1020")
+    info = create_info(montage.ch_names[:10], 1000.0, "eeg")
+    info.set_montage(montage)
+    info = info.copy().copy()
+    chs, dig = info["chs"], info["dig"]
+    info_copy = info.copy()
+    chs[0]["loc"][:3] = 1.0
+    chs[1]["ch_name"] = "zzz"
+    dig[0]["r"][:] = 1.0
+    assert not np.allclose(info_copy["chs"][0]["loc"][:3], 1.0)
+    assert info_copy["chs"][1]["ch_name"] == info_copy.ch_names[1] != "zzz"
+    assert not np.allclose(info_copy["dig"][0]["r"], 1.0)
+    # same for members handed out through other accessors
+    info = info_copy.copy()
+    projs = info.get("projs")
+    info_2 = info.copy()
+    projs.append("foo")
+    assert info_2["projs"] == []
+    info = info_copy.copy()
+    members = dict(info.items())
+    info_copy = info.copy()
+    members["chs"][0]["loc"][:3] = 2.0
+    assert not np.allclose(info_copy["chs"][0]["loc"][:3], 2.0)
+
+
 def test_info_bad():
     """Test our info sanity checkers."""
     info = create_info(5, 1000.0, "eeg")
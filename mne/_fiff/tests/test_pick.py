@@ -145,6 +145,111 @@ def _assert_channel_types(info):
         assert a == b
 
 
+def test_channel_table():
+    """Test the cached columnar view of the channels."""
+    ch_types = ["mag", "grad", "eeg", "seeg", "hbo", "hbr", "stim", "misc"] * 3
+    ch_types += ["eyegaze", "pupil"]
+    info = create_info([f"CH{ii:02d}" for ii in range(len(ch_types))], 1000.0, ch_types)
+    table = info._ch_table
+    assert info._ch_table is table
+    assert not table.data.flags.writeable
+    assert_array_equal(table.types, ch_types)
+    assert table.idx["CH03"] == 3
+    for key in ("kind", "coil_type", "unit"):
+        assert_array_equal(table.data[key], [ch[key] for ch in info["chs"]])
+    assert_array_equal(pick_types(info, meg="grad"), [1, 9, 17])
+    assert_array_equal(pick_types(info, fnirs="hbr", include=["CH00"]), [0, 5, 13, 21])
+    info["bads"] = ["CH05"]
+    assert_array_equal(pick_types(info, fnirs="hbr"), [13, 21])
+    assert_array_equal(_picks_to_idx(info, ["CH07", "CH02"]), [7, 2])
+    assert_array_equal(_picks_to_idx(info, "all"), np.setdiff1d(range(26), [5]))
+    # the table is shared by copies and rebuilt when the channels are accessed
+    info._check_consistency()
+    assert info._ch_table_checked is info._ch_table
+    info_copy = info.copy()
+    assert info_copy._ch_table is info._ch_table
+    assert info_copy._ch_table_checked is info._ch_table
+    info["chs"][2]["kind"] = FIFF.FIFFV_MISC_CH
+    assert_array_equal(pick_types(info, eeg=True), [10, 18])
+    assert channel_type(info, 2) == "misc"
+    info_pick = pick_info(info, [3, 2])
+    assert info_pick._ch_table.names == ["CH03", "CH02"]
+    assert_array_equal(info_pick._ch_table.types, ["seeg", "misc"])
+    info["chs"][0]["kind"] = 12345
+    assert channel_type(info, 1) == "grad"
+    with pytest.raises(ValueError, match="Unknown channel type"):
+        pick_types(info, meg=True)
+    # changes through held references are seen too
+    info = create_info(["EEG1", "EEG2", "EOG"], 1000.0, ["eeg", "eeg", "eog"])
+    chs = info["chs"]
+    assert_array_equal(pick_types(info, eeg=True), [0, 1])
+    assert info.get_channel_types() == ["eeg", "eeg", "eog"]
+    chs[0]["kind"] = FIFF.FIFFV_MISC_CH
+    assert_array_equal(pick_types(info, eeg=True), [1])
+    assert info.get_channel_types() == ["misc", "eeg", "eog"]
+    assert channel_type(info, 0) == "misc"
+    chs[2]["ch_name"] = "foo"
+    with pytest.raises(RuntimeError, match="channel name inconsistency"):
+        pick_types(info, eeg=True)
+    chs[2]["ch_name"] = "EOG"
+    assert_array_equal(pick_types(info, eog=True), [2])
+    info._check_consistency()
+    info["ch_names"][2] = "foo"
+    with pytest.raises(RuntimeError, match="channel name inconsistency"):
+        info._check_consistency(skip_checked_chs=True)
+
+
+def test_picks_cache():
+    """Test caching of resolved picks."""
+    info = create_info(
+        ["EEG1", "EEG2", "EOG", "STI"], 1000.0, ["eeg"] * 2 + ["eog", "stim"]
+    )
+    cache = info._ch_table.picks
+    picks = _picks_to_idx(info, "data")
+    assert_array_equal(picks, [0, 1])
+    assert len(cache) == 2  # _picks_to_idx and pick_types
+    picks[:] = 3  # copies are returned
+    assert_array_equal(_picks_to_idx(info, "data"), [0, 1])
+    assert_array_equal(pick_types(info, eeg=True, include=["STI"]), [0, 1, 3])
+    assert_array_equal(pick_types(info, eeg=True, include=["STI"]), [0, 1, 3])
+    assert len(cache) == 3
+    # copies, e.g. of epochs, use the same cache with their own bads
+    info_copy = info.copy()
+    assert info_copy._ch_table.picks is cache
+    info_copy["bads"] = ["EEG2"]
+    assert_array_equal(_picks_to_idx(info_copy, "data"), [0])
+    assert_array_equal(_picks_to_idx(info, "data"), [0, 1])
+    assert len(cache) == 5  # _picks_to_idx and pick_types
+    # changing bads, in place or not, changes the picks
+    info["bads"].append("EEG1")
+    assert_array_equal(_picks_to_idx(info, "data"), [1])
+    assert_array_equal(_picks_to_idx(info, "data", exclude=()), [0, 1])
+    info["bads"] = []
+    assert_array_equal(_picks_to_idx(info, "eeg"), [0, 1])
+    # changing the channels drops the cache
+    info.set_channel_types(dict(EOG="eeg"))
+    assert info._ch_table.picks is not cache
+    assert_array_equal(_picks_to_idx(info, "eeg"), [0, 1, 2])
+    assert_array_equal(_picks_to_idx(info, "eeg", return_kind=True)[0], [0, 1, 2])
+    # errors are not cached
+    for _ in range(2):
+        with pytest.raises(TypeError, match="picks must be a list of int"):
+            _picks_to_idx(info, 1.0)
+        with pytest.raises(ValueError, match="must be of type bool"):
+            pick_types(info, eeg="yes")
+    # cached picks are still validated
+    assert_array_equal(pick_types(info, eeg=True, exclude=[]), [0, 1, 2])
+    with pytest.raises(ValueError, match="exclude must either be"):
+        pick_types(info, eeg=True, exclude="EEG1")
+    with pytest.raises(ValueError, match='it must be "bads"'):
+        _picks_to_idx(info, "eeg", exclude=None)
+    info["ch_names"][0] = "foo"
+    with pytest.raises(RuntimeError, match="channel name inconsistency"):
+        pick_types(info, eeg=True, exclude=[])
+    with pytest.raises(RuntimeError, match="channel name inconsistency"):
+        _picks_to_idx(info, "eeg")
+
+
 def test_pick_refs():
     """Test picking of reference sensors."""
     infos = list()
@@ -8,7 +8,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from mne import create_info, what
+from mne import create_info, make_fixed_length_epochs, what
 from mne.datasets import testing
 from mne.io import RawArray
 from mne.preprocessing import ICA
@@ -65,3 +65,17 @@ def test_what(tmp_path, verbose_debug):
     assert set(want_dict) == got
     fname = data_path / "MEG" / "sample" / "sample_audvis-ave_xfit.dip"
     assert what(fname) == "unknown"
+
+
+def test_what_header(tmp_path):
+    """Test identifying data files from their header."""
+    raw = RawArray(np.zeros((3, 2000)), create_info(3, 1000.0, "eeg"))
+    raw.save(tmp_path / "test_raw.fif")
+    epochs = make_fixed_length_epochs(raw, duration=0.5)
+    epochs.save(tmp_path / "test-epo.fif")
+    epochs.average().save(tmp_path / "test-ave.fif")
+    assert what(tmp_path / "test_raw.fif") == "raw"
+    assert what(tmp_path / "test-epo.fif") == "epochs"
+    assert what(tmp_path / "test-ave.fif") == "evoked"
+    (tmp_path / "test.txt").write_text("foo")
+    assert what(tmp_path / "test.txt") == "unknown"
@@ -6,6 +6,18 @@ from collections import OrderedDict
 from inspect import signature
 
 from ..utils import _check_fname, logger
+from .constants import FIFF
+from .open import fiff_open
+from .tree import dir_tree_find
+
+# Blocks identifying the type of files holding data
+_WHAT_BLOCKS = {
+    FIFF.FIFFB_RAW_DATA: "raw",
+    FIFF.FIFFB_CONTINUOUS_DATA: "raw",
+    FIFF.FIFFB_IAS_RAW_DATA: "raw",
+    FIFF.FIFFB_MNE_EPOCHS: "epochs",
+    FIFF.FIFFB_EVOKED: "evoked",
+}
 
 
 def what(fname):
@@ -23,6 +35,10 @@ def what(fname):
 
     Notes
     -----
+    Raw, epochs and evoked files are identified from their header, without
+    reading their data. Other types are identified by trying to read the file
+    with the corresponding reader.
+
     .. versionadded:: 0.19
     """
     from ..bem import read_bem_solution, read_bem_surfaces
@@ -40,6 +56,15 @@ def what(fname):
     from .meas_info import read_fiducials
 
     fname = _check_fname(fname, overwrite="read", must_exist=True)
+    try:
+        fid, tree, _ = fiff_open(fname, header_only=True, verbose="error")
+    except Exception as exp:
+        logger.debug(f"Not a FIF file: {exp}")
+    else:
+        fid.close()
+        for block, what in _WHAT_BLOCKS.items():
+            if len(dir_tree_find(tree, block)):
+                return what
     checks = OrderedDict()
     checks["raw"] = read_raw_fif
     checks["ica"] = read_ica
@@ -103,6 +103,30 @@ def _check_o_d_s_c(onset, duration, description, ch_names):
     return onset, duration, description, ch_names
 
 
+class _IntervalIndex:
+    """Sorted-endpoint index of annotation spans for overlap queries."""
+
+    def __init__(self, onset, duration):
+        self.order = np.argsort(onset, kind="stable")
+        self.starts = onset[self.order]
+        # if duration is NaN behave like a zero
+        self.ends = self.starts + np.nan_to_num(duration[self.order])
+        # all spans before the first running maximum exceeding tmin end before
+        # tmin, so together with the sorted starts this bounds the candidates
+        self.max_ends = np.maximum.accumulate(self.ends)
+
+    def overlapping(self, tmin, tmax, inclusive):
+        if inclusive:
+            lo = np.searchsorted(self.max_ends, tmin, side="left")
+            hi = np.searchsorted(self.starts, tmax, side="right")
+            keep = self.ends[lo:hi] >= tmin
+        else:
+            lo = np.searchsorted(self.max_ends, tmin, side="right")
+            hi = np.searchsorted(self.starts, tmax, side="left")
+            keep = self.ends[lo:hi] > tmin
+        return np.sort(self.order[lo:hi][keep])
+
+
 def _ndarray_ch_names(ch_names):
     # np.array(..., dtype=object) if all entries are empty will give
     # an empty array of shape (n_entries, 0) which is not helpful. So let's
@@ -276,6 +300,7 @@ class Annotations:
 
     def __init__(self, onset, duration, description, orig_time=None, ch_names=None):
         self._orig_time = _handle_meas_date(orig_time)
+        self._pending = None
         self.onset, self.duration, self.description, self.ch_names = _check_o_d_s_c(
             onset, duration, description, ch_names
         )
@@ -286,6 +311,52 @@ class Annotations:
         """The time base of the Annotations."""
         return self._orig_time
 
+    @property
+    def onset(self):
+        """The onsets of the annotations in seconds (array of float)."""
+        self._flush()
+        return self._onset
+
+    @onset.setter
+    def onset(self, onset):
+        self._flush()
+        self._onset = onset
+        self._index = None
+
+    @property
+    def duration(self):
+        """The durations of the annotations in seconds (array of float)."""
+        self._flush()
+        return self._duration
+
+    @duration.setter
+    def duration(self, duration):
+        self._flush()
+        self._duration = duration
+        self._index = None
+
+    @property
+    def description(self):
+        """The descriptions of the annotations (array of str)."""
+        self._flush()
+        return self._description
+
+    @description.setter
+    def description(self, description):
+        self._flush()
+        self._description = description
+
+    @property
+    def ch_names(self):
+        """The channel names of the annotations (array of tuple of str)."""
+        self._flush()
+        return self._ch_names
+
+    @ch_names.setter
+    def ch_names(self, ch_names):
+        self._flush()
+        self._ch_names = ch_names
+
     def __eq__(self, other):
         """Compare to another Annotations instance."""
         if not isinstance(other, Annotations):
@@ -402,17 +473,40 @@ class Annotations:
         The array-like support for arguments allows this to be used similarly
         to not only ``list.append``, but also
         `list.extend <https://docs.python.org/3/library/stdtypes.html#mutable-sequence-types>`__.
+
+        Appended annotations are buffered and only merged into the (sorted)
+        arrays the next time the annotations are used, so building a large set
+        of annotations with many calls to ``append`` takes linear time.
+
+        .. versionchanged:: 1.10
+           Appended annotations are buffered.
         """  # noqa: E501
         onset, duration, description, ch_names = _check_o_d_s_c(
             onset, duration, description, ch_names
         )
-        self.onset = np.append(self.onset, onset)
-        self.duration = np.append(self.duration, duration)
-        self.description = np.append(self.description, description)
-        self.ch_names = np.append(self.ch_names, ch_names)
-        self._sort()
+        # Buffer the new annotations, they get merged in (and sorted) only when
+        # the annotations are accessed next, so that repeated calls are cheap
+        if self._pending is None:
+            self._pending = ([], [], [], [])
+        for buf, val in zip(self._pending, (onset, duration, description)):
+            buf.extend(val.tolist())
+        self._pending[3].extend(ch_names)
         return self
 
+    def _flush(self):
+        """Merge the annotations buffered by append."""
+        if self._pending is None:
+            return
+        onset, duration, description, ch_names = self._pending
+        self._pending = None
+        self.onset = np.concatenate([self._onset, np.array(onset, float)])
+        self.duration = np.concatenate([self._duration, np.array(duration, float)])
+        self.description = np.concatenate(
+            [self._description, np.array(description, str)]
+        )
+        self.ch_names = np.concatenate([self._ch_names, _ndarray_ch_names(ch_names)])
+        self._sort()
+
     def copy(self):
         """Return a copy of the Annotations.
 
@@ -437,6 +531,45 @@ class Annotations:
         self.description = np.delete(self.description, idx)
         self.ch_names = np.delete(self.ch_names, idx)
 
+    def overlapping(self, tmin, tmax, *, inclusive=False):
+        """Get the annotations that overlap a time span.
+
+        Parameters
+        ----------
+        tmin : float
+            Start of the time span in seconds, in the same time base as
+            :attr:`onset`.
+        tmax : float
+            End of the time span in seconds.
+        inclusive : bool
+            If True, annotations that only touch the time span (i.e., end at
+            ``tmin`` or start at ``tmax``) are counted as overlapping as well.
+            Defaults to False.
+
+        Returns
+        -------
+        idx : ndarray of int
+            The sorted indices of the overlapping annotations.
+
+        Notes
+        -----
+        Annotations with a NaN duration are treated as instantaneous events.
+        The queries use an index of the annotation spans that is built on first
+        use and kept until the onsets or durations are changed (e.g. by
+        :meth:`append`, :meth:`delete` or :meth:`crop`). Setting individual
+        elements of :attr:`onset` or :attr:`duration` does not update the index;
+        assign the whole array instead.
+
+        .. versionadded:: 1.10
+        """
+        return self._get_index().overlapping(float(tmin), float(tmax), inclusive)
+
+    def _get_index(self):
+        self._flush()
+        if self._index is None:
+            self._index = _IntervalIndex(self.onset, self.duration)
+        return self._index
+
     @fill_doc
     def to_data_frame(self, time_format="datetime"):
         """Export annotations in tabular structure as a pandas DataFrame.
@@ -559,10 +692,11 @@ class Annotations:
 
     def _sort(self):
         """Sort in place."""
-        # instead of argsort here we use sorted so that it gives us
-        # the onset-then-duration hierarchy
-        vals = sorted(zip(self.onset, self.duration, range(len(self))))
-        order = list(list(zip(*vals))[-1]) if len(vals) else []
+        # lexsort is stable, so this gives us the onset-then-duration-then-index
+        # hierarchy
+        order = np.lexsort((self.duration, self.onset))
+        if (order == np.arange(len(order))).all():
+            return
         self.onset = self.onset[order]
         self.duration = self.duration[order]
         self.description = self.description[order]
@@ -619,36 +753,44 @@ class Annotations:
             )
         logger.debug(f"Cropping annotations {absolute_tmin} - {absolute_tmax}")
 
+        # Only look at the annotations near the crop window, the comparisons
+        # below are done at the (microsecond) resolution of timedelta so pad
+        # generously to be sure not to miss any
+        candidates = self.overlapping(
+            (absolute_tmin - offset).total_seconds() - 1e-3,
+            (absolute_tmax - offset).total_seconds() + 1e-3,
+            inclusive=True,
+        )
         onsets, durations, descriptions, ch_names = [], [], [], []
-        out_of_bounds, clip_left_elem, clip_right_elem = [], [], []
-        for idx, (onset, duration, description, ch) in enumerate(
-            zip(self.onset, self.duration, self.description, self.ch_names)
-        ):
+        out_of_bounds = np.ones(len(self), bool)
+        clip_left_elem = np.zeros(len(self), bool)
+        clip_right_elem = np.zeros(len(self), bool)
+        for idx in candidates:
+            onset, duration = self.onset[idx], self.duration[idx]
+            description, ch = self.description[idx], self.ch_names[idx]
             # if duration is NaN behave like a zero
             if np.isnan(duration):
                 duration = 0.0
             # convert to absolute times
             absolute_onset = timedelta(seconds=onset) + offset
             absolute_offset = absolute_onset + timedelta(seconds=duration)
-            out_of_bounds.append(
+            out_of_bounds[idx] = (
                 absolute_onset > absolute_tmax or absolute_offset < absolute_tmin
             )
-            if out_of_bounds[-1]:
-                clip_left_elem.append(False)
-                clip_right_elem.append(False)
+            if out_of_bounds[idx]:
                 logger.debug(
                     f"  [{idx}] Dropping "
                     f"({absolute_onset} - {absolute_offset}: {description})"
                 )
             else:
                 # clip the left side
-                clip_left_elem.append(absolute_onset < absolute_tmin)
-                if clip_left_elem[-1]:
+                clip_left_elem[idx] = absolute_onset < absolute_tmin
+                if clip_left_elem[idx]:
                     absolute_onset = absolute_tmin
-                clip_right_elem.append(absolute_offset > absolute_tmax)
-                if clip_right_elem[-1]:
+                clip_right_elem[idx] = absolute_offset > absolute_tmax
+                if clip_right_elem[idx]:
                     absolute_offset = absolute_tmax
-                if clip_left_elem[-1] or clip_right_elem[-1]:
+                if clip_left_elem[idx] or clip_right_elem[idx]:
                     durations.append((absolute_offset - absolute_onset).total_seconds())
                 else:
                     durations.append(duration)
@@ -668,10 +810,10 @@ class Annotations:
         self.ch_names = _ndarray_ch_names(ch_names)
 
         if emit_warning:
-            omitted = np.array(out_of_bounds).sum()
+            omitted = out_of_bounds.sum()
             if omitted > 0:
                 warn(f"Omitted {omitted} annotation(s) that were outside data range.")
-            limited = (np.array(clip_left_elem) | np.array(clip_right_elem)).sum()
+            limited = (clip_left_elem | clip_right_elem).sum()
             if limited > 0:
                 warn(
                     f"Limited {limited} annotation(s) that were expanding outside the"
@@ -714,6 +856,7 @@ class Annotations:
             for stim in mapping:
                 map_idx = [desc == stim for desc in self.description]
                 self.duration[map_idx] = mapping[stim]
+            self._index = None
 
         elif _is_numeric(mapping):
             self.duration = np.ones(self.description.shape) * mapping
@@ -978,20 +1121,26 @@ class EpochAnnotationsMixin:
         return self
 
 
-def _combine_annotations(
-    one, two, one_n_samples, one_first_samp, two_first_samp, sfreq
-):
-    """Combine a tuple of annotations."""
-    assert one is not None
-    assert two is not None
-    shift = one_n_samples / sfreq  # to the right by the number of samples
-    shift += one_first_samp / sfreq  # to the right by the offset
-    shift -= two_first_samp / sfreq  # undo its offset
-    onset = np.concatenate([one.onset, two.onset + shift])
-    duration = np.concatenate([one.duration, two.duration])
-    description = np.concatenate([one.description, two.description])
-    ch_names = np.concatenate([one.ch_names, two.ch_names])
-    return Annotations(onset, duration, description, one.orig_time, ch_names)
+def _combine_annotations(annotations, n_samples, one_first_samp, first_samps, sfreq):
+    """Combine the annotations of consecutive recordings.
+
+    ``annotations[0]`` is the reference. Each of the following ones is shifted to
+    the right by the corresponding number of preceding samples in ``n_samples``
+    and by the offset between the ``first_samps`` of the recordings.
+    """
+    assert len(annotations) == len(n_samples) + 1 == len(first_samps) + 1
+    assert all(annot is not None for annot in annotations)
+    onsets = [annotations[0].onset]
+    for annot, n_samp, first_samp in zip(annotations[1:], n_samples, first_samps):
+        shift = n_samp / sfreq  # to the right by the number of samples
+        shift += one_first_samp / sfreq  # to the right by the offset
+        shift -= first_samp / sfreq  # undo its offset
+        onsets.append(annot.onset + shift)
+    onset = np.concatenate(onsets)
+    duration = np.concatenate([annot.duration for annot in annotations])
+    description = np.concatenate([annot.description for annot in annotations])
+    ch_names = np.concatenate([annot.ch_names for annot in annotations])
+    return Annotations(onset, duration, description, annotations[0].orig_time, ch_names)
 
 
 def _handle_meas_date(meas_date):
@@ -1052,11 +1201,11 @@ def _annotations_starts_stops(raw, kinds, name="skip_by_annotation", invert=Fals
     if len(raw.annotations) == 0:
         onsets, ends = np.array([], int), np.array([], int)
     else:
-        idxs = [
-            idx
-            for idx, desc in enumerate(raw.annotations.description)
-            if any(desc.upper().startswith(kind.upper()) for kind in kinds)
-        ]
+        # match each distinct description only once
+        kinds = tuple(kind.upper() for kind in kinds)
+        descs, inverse = np.unique(raw.annotations.description, return_inverse=True)
+        matches = np.array([desc.upper().startswith(kinds) for desc in descs], bool)
+        idxs = np.where(matches[inverse.ravel()])[0]
         # onsets are already sorted
         onsets = raw.annotations.onset[idxs]
         onsets = _sync_onset(raw, onsets)
@@ -1413,12 +1562,11 @@ def _select_annotations_based_on_description(descriptions, event_id, regexp):
 
     event_id_ = dict()
     dropped = []
-    # Iterate over the sorted descriptions so that the Counter mapping
-    # is slightly less arbitrary
-    for desc in sorted(descriptions):
-        if desc in event_id_:
-            continue
-
+    # Work on integer codes into the sorted unique descriptions, so that each
+    # description only has to be matched once and the Counter mapping is
+    # slightly less arbitrary
+    uniques, codes = np.unique(np.asarray(descriptions, str), return_inverse=True)
+    for desc in uniques.tolist():
         if regexp_comp.match(desc) is None:
             continue
 
@@ -1434,7 +1582,8 @@ def _select_annotations_based_on_description(descriptions, event_id, regexp):
             else:
                 dropped.append(desc)
 
-    event_sel = [ii for ii, kk in enumerate(descriptions) if kk in event_id_]
+    used = np.array([desc in event_id_ for desc in uniques.tolist()], bool)
+    event_sel = np.where(used[codes.ravel()])[0]
 
     if len(event_sel) == 0 and regexp is not None:
         raise ValueError("Could not find any of the events you specified.")
@@ -1610,7 +1759,7 @@ def events_from_annotations(
         values = [event_id_[kk] for kk in annotations.description[event_sel]]
         inds = inds[event_sel]
     else:
-        inds = values = np.array([]).astype(int)
+        inds, values = [np.array([], int)], [np.array([], int)]
         for annot in annotations[event_sel]:
             annot_offset = annot["onset"] + annot["duration"]
             _onsets = np.arange(annot["onset"], annot_offset, chunk_duration)
@@ -1621,13 +1770,14 @@ def events_from_annotations(
                     _onsets, use_rounding=use_rounding, origin=annotations.orig_time
                 )
                 _inds += raw.first_samp
-                inds = np.append(inds, _inds)
+                inds.append(_inds)
                 _values = np.full(
                     shape=len(_inds),
                     fill_value=event_id_[annot["description"]],
                     dtype=int,
                 )
-                values = np.append(values, _values)
+                values.append(_values)
+        inds, values = np.concatenate(inds), np.concatenate(values)
 
     events = np.c_[inds, np.zeros(len(inds)), values].astype(int)
 
@@ -96,7 +96,13 @@ def rescale(data, times, baseline, mode="mean", copy=True, picks=None, verbose=N
 
     # technically this is inefficient when `picks` is given, but assuming
     # that we generally pick most channels for rescaling, it's not so bad
-    mean = np.mean(data[..., imin:imax], axis=-1, keepdims=True)
+    # (accumulate single precision data in double precision)
+    mean = np.mean(
+        data[..., imin:imax],
+        axis=-1,
+        keepdims=True,
+        dtype=np.result_type(data, np.float64),
+    )
 
     if mode == "mean":
 
@@ -51,6 +51,7 @@ from ..utils import (
     _check_fname,
     _check_option,
     _check_preload,
+    _ensure_writeable,
     _get_stim_channel,
     _on_missing,
     _validate_type,
@@ -887,6 +888,7 @@ class InterpolationMixin:
         )
 
         _check_preload(self, "interpolation")
+        _ensure_writeable(self)
         _validate_type(method, (dict, str, None), "method")
         method = _handle_default("interpolation_method", method)
         ch_types = self.get_channel_types(unique=True)
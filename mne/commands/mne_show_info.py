@@ -30,7 +30,7 @@ def run():
     if not fname.endswith(".fif"):
         raise ValueError(f"{fname} does not seem to be a .fif file.")
 
-    info = mne.io.read_info(fname)
+    info = mne.io.read_info(fname, header_only=True)
     print(f"File : {fname}")
     print(info)
 
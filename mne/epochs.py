@@ -6,6 +6,7 @@
 
 import json
 import operator
+import os
 import os.path as op
 from collections import Counter
 from copy import deepcopy
@@ -86,6 +87,7 @@ from .utils import (
     _check_time_format,
     _convert_times,
     _ensure_events,
+    _ensure_writeable,
     _gen_events,
     _on_missing,
     _path_like,
@@ -107,6 +109,72 @@ from .utils import (
 from .utils.docs import fill_doc
 from .viz import plot_drop_log, plot_epochs, plot_epochs_image, plot_topo_image_epochs
 
+# Maximum size of the raw data read at once for overlapping or adjacent epochs
+# when the data are not preloaded
+_EPOCHS_READ_BYTES = 64 * 1024**2
+
+
+def _is_memmap(data):
+    """Check if epochs data are backed by a memory-mapped file."""
+    return isinstance(data, np.memmap) and data.filename is not None
+
+
+def _chunk_slices(n_epochs, epoch_bytes):
+    """Get slices over epochs that bound the size of each block of epochs."""
+    step = max(_EPOCHS_READ_BYTES // max(epoch_bytes, 1), 1)
+    return [
+        slice(start, min(start + step, n_epochs)) for start in range(0, n_epochs, step)
+    ]
+
+
+def _memmap_chunks(data):
+    """Get slices over epochs that bound the size of each memmap block."""
+    if not _is_memmap(data) or len(data) == 0:
+        return [slice(None)]
+    return _chunk_slices(len(data), data[0].nbytes)
+
+
+def _rewrite_memmap(data, shape, fun=None, select=None):
+    """Rewrite memory-mapped epochs to a new shape within their own file.
+
+    Output epoch ``ii`` is ``fun(data[select[ii]])``, computed in blocks of
+    epochs. Blocks are written front to back when epochs shrink (``select``
+    must then be increasing) and back to front when they grow, so input that
+    has not been read yet is never overwritten.
+    """
+    assert _is_memmap(data)
+    select = np.arange(len(data)) if select is None else np.asarray(select)
+    assert len(select) == shape[0]
+    in_bytes = data.itemsize * int(np.prod(data.shape[1:]))
+    out_bytes = data.itemsize * int(np.prod(shape[1:]))
+    if out_bytes == 0 or shape[0] == 0:
+        return np.empty(shape, data.dtype)
+    grow = out_bytes > in_bytes
+    if grow:
+        assert np.array_equal(select, np.arange(len(data)))
+    else:
+        assert (np.diff(select) > 0).all()
+    out = np.memmap(
+        data.filename, mode="r+", dtype=data.dtype, offset=data.offset, shape=shape
+    )
+    step = max(_EPOCHS_READ_BYTES // max(in_bytes, out_bytes), 1)
+    starts = range(0, shape[0], step)
+    for start in reversed(starts) if grow else starts:
+        sl = slice(start, start + step)
+        block = data[select[sl]]  # always a copy
+        out[sl] = block if fun is None else fun(block)
+    out.flush()
+    return out
+
+
+def _allocate_epochs(shape, dtype, data_fname=None):
+    """Allocate epochs data in memory or in a memmap."""
+    from .io.base import _allocate_data
+
+    if data_fname is None:
+        return np.empty(shape, dtype)
+    return _allocate_data(data_fname, shape, dtype)
+
 
 def _pack_reject_params(epochs):
     reject_params = dict()
@@ -153,7 +221,7 @@ def _save_part(fid, epochs, fmt, n_parts, next_fname, next_idx):
     start_block(fid, FIFF.FIFFB_MNE_EPOCHS)
 
     # write events out after getting data to ensure bad events are dropped
-    data = epochs.get_data(copy=False)
+    data = epochs._get_data(copy=False)
 
     _check_option("fmt", fmt, ["single", "double"])
 
@@ -180,9 +248,9 @@ def _save_part(fid, epochs, fmt, n_parts, next_fname, next_idx):
     end_block(fid, FIFF.FIFFB_MNE_EVENTS)
 
     # Metadata
-    if epochs.metadata is not None:
+    if epochs._metadata is not None:
         start_block(fid, FIFF.FIFFB_MNE_METADATA)
-        metadata = _prepare_write_metadata(epochs.metadata)
+        metadata = _prepare_write_metadata(epochs._metadata)
         write_string(fid, FIFF.FIFF_DESCRIPTION, metadata)
         end_block(fid, FIFF.FIFFB_MNE_METADATA)
 
@@ -206,12 +274,18 @@ def _save_part(fid, epochs, fmt, n_parts, next_fname, next_idx):
     for k in range(info["nchan"]):
         decal[k] = 1.0 / (info["chs"][k]["cal"] * info["chs"][k].get("scale", 1.0))
 
-    data *= decal[np.newaxis, :, np.newaxis]
+    # scale in place (and undo it below) unless the data are a read-only view
+    in_place = data.flags.writeable
+    if in_place:
+        data *= decal[np.newaxis, :, np.newaxis]
+    else:
+        data = data * decal[np.newaxis, :, np.newaxis]
 
     write_function(fid, FIFF.FIFF_EPOCH, data)
 
     # undo modifications to data
-    data /= decal[np.newaxis, :, np.newaxis]
+    if in_place:
+        data /= decal[np.newaxis, :, np.newaxis]
 
     write_string(fid, FIFF.FIFF_MNE_EPOCHS_DROP_LOG, json.dumps(epochs.drop_log))
 
@@ -405,7 +479,7 @@ class BaseEpochs(
     %(detrend_epochs)s
     %(proj_epochs)s
     %(on_missing_epochs)s
-    preload_at_end : bool
+    preload_at_end : bool | path-like
         %(epochs_preload)s
     %(selection)s
 
@@ -601,6 +675,7 @@ class BaseEpochs(
             self._data = data
             self._do_baseline = False
         self._offset = None
+        self._data_fname = None  # memmap file we own, if any
 
         if tmin > tmax:
             raise ValueError("tmin has to be less than or equal to tmax")
@@ -675,7 +750,7 @@ class BaseEpochs(
         if preload_at_end:
             assert self._data is None
             assert self.preload is False
-            self.load_data()  # this will do the projection
+            self._load_data(preload_at_end)  # this will do the projection
         elif proj is True and self._projector is not None and data is not None:
             # let's make sure we project if data was provided and proj
             # requested
@@ -729,9 +804,19 @@ class BaseEpochs(
 
         .. versionadded:: 0.10.0
         """
+        return self._load_data()
+
+    def _load_data(self, preload=True, *, data=None):
         if self.preload:
             return self
-        self._data = self._get_data()
+        if data is None:
+            data_fname = None if preload is True else preload
+            data = self._get_data(data_fname=data_fname)
+        else:  # already processed, with no epochs to drop
+            self._bad_dropped = True
+        self._data = data
+        if _is_memmap(self._data):
+            self._data_fname = self._data.filename
         self.preload = True
         self._do_baseline = False
         self._decim_slice = slice(None, None, None)
@@ -775,7 +860,17 @@ class BaseEpochs(
                 )
             self._do_baseline = True
             picks = self._detrend_picks
-            rescale(self._data, self.times, baseline, copy=False, picks=picks)
+            _ensure_writeable(self)
+            # correct memory-mapped data in blocks of epochs
+            for ci, sl in enumerate(_memmap_chunks(self._data)):
+                rescale(
+                    self._data[sl],
+                    self.times,
+                    baseline,
+                    copy=False,
+                    picks=picks,
+                    verbose=None if ci == 0 else "error",
+                )
             self._do_baseline = False
         else:  # logging happens in "rescale" in "if" branch
             logger.info(_log_rescale(baseline))
@@ -1053,6 +1148,7 @@ class BaseEpochs(
 
         # do the subtraction
         if self.preload:
+            _ensure_writeable(self)
             self._data[:, ep_picks, :] -= evoked.data[picks][None, :, :]
         else:
             if self._offset is None:
@@ -1153,7 +1249,13 @@ class BaseEpochs(
         if self.preload:
             n_events = len(self.events)
             fun = _check_combine(mode, valid=("mean", "median", "std"))
-            data = fun(self._data)
+            if isinstance(mode, str) and mode == "mean":
+                # accumulate single precision data in double precision
+                data = np.mean(
+                    self._data, axis=0, dtype=np.result_type(self._data, np.float64)
+                ).astype(self._data.dtype, copy=False)
+            else:
+                data = fun(self._data)
             assert len(self.events) == len(self._data)
             if data.shape != self._data.shape[1:]:
                 raise RuntimeError(
@@ -1168,10 +1270,12 @@ class BaseEpochs(
                 )
             data = np.zeros((n_channels, n_times))
             n_events = 0
+            dtype = data.dtype
             for e in self:
                 if np.iscomplexobj(e):
                     data = data.astype(np.complex128)
                 data += e
+                dtype = e.dtype
                 n_events += 1
 
             if n_events > 0:
@@ -1187,6 +1291,7 @@ class BaseEpochs(
                 for e in self:
                     data += (e - data_mean) ** 2
                 data = np.sqrt(data / n_events)
+            data = data.astype(dtype, copy=False)
 
         if mode == "std":
             kind = "standard_error"
@@ -1258,6 +1363,9 @@ class BaseEpochs(
             baseline=None,
         )
         evoked.baseline = self.baseline
+        # the above constructor converts to double precision, keep single precision
+        if data.dtype in (np.float32, np.complex64):
+            evoked.data = data
 
         # the above constructor doesn't recreate the times object precisely
         # due to numerical precision issues
@@ -1573,6 +1681,24 @@ class BaseEpochs(
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _iter_epochs_from_raw(self, idxs):
+        """Get the given epochs from disk (see _get_epoch_from_raw)."""
+        for idx in idxs:
+            yield self._get_epoch_from_raw(idx)
+
+    def _get_next_epoch_from_raw(self):
+        """Get the epoch at self._current from disk while iterating."""
+        # read ahead with _iter_epochs_from_raw, starting over if _current
+        # was changed in the meantime
+        current, raw_epochs = getattr(self, "_current_raw_epochs", (None, None))
+        if current != self._current:
+            raw_epochs = self._iter_epochs_from_raw(
+                range(self._current, len(self.events))
+            )
+        epoch = next(raw_epochs)
+        self._current_raw_epochs = (self._current + 1, raw_epochs)
+        return epoch
+
     def _project_epoch(self, epoch):
         """Process a raw epoch based on the delayed param."""
         # whenever requested, the first epoch is being projected.
@@ -1581,7 +1707,7 @@ class BaseEpochs(
             return epoch
         proj = self._do_delayed_proj or self.proj
         if self._projector is not None and proj is True:
-            epoch = np.dot(self._projector, epoch)
+            epoch = np.dot(self._projector, epoch).astype(epoch.dtype, copy=False)
         return epoch
 
     def _handle_empty(self, on_empty, meth):
@@ -1605,6 +1731,7 @@ class BaseEpochs(
         tmax=None,
         copy=False,
         on_empty="warn",
+        data_fname=None,
         verbose=None,
     ):
         """Load all data, dropping bad epochs along the way.
@@ -1622,6 +1749,8 @@ class BaseEpochs(
             Start time of data to get in seconds.
         tmax : int | float | None
             End time of data to get in seconds.
+        data_fname : path-like | None
+            If not None, the file to use as a memmap for the loaded data.
         %(verbose)s
         """
         from .io.base import _get_ch_factors
@@ -1709,18 +1838,18 @@ class BaseEpochs(
 
             # we need to load from disk, drop, and return data
             detrend_picks = self._detrend_picks
-            for ii, idx in enumerate(use_idx):
+            for ii, epoch_noproj in enumerate(self._iter_epochs_from_raw(use_idx)):
                 # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
                 epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
                 if self._do_delayed_proj:
                     epoch_out = epoch_noproj
                 else:
                     epoch_out = self._project_epoch(epoch_noproj)
                 if ii == 0:
-                    data = np.empty(
+                    data = _allocate_epochs(
                         (n_events, len(self.ch_names), len(self.times)),
-                        dtype=epoch_out.dtype,
+                        epoch_out.dtype,
+                        data_fname,
                     )
                 data[ii] = epoch_out
         else:
@@ -1730,43 +1859,72 @@ class BaseEpochs(
             n_out = 0
             drop_log = list(self.drop_log)
             assert n_events == len(self.selection)
-            if not self.preload:
-                detrend_picks = self._detrend_picks
-            for idx, sel in enumerate(self.selection):
-                if self.preload:  # from memory
-                    if self._do_delayed_proj:
-                        epoch_noproj = self._data[idx]
-                        epoch = self._project_epoch(epoch_noproj)
+            bad_tuples = None
+            if self.preload:
+                bad_tuples = _find_bad_epochs(
+                    self._data,
+                    self.ch_names,
+                    self._channel_type_idx,
+                    self.reject,
+                    self.flat,
+                    ignore_chs=self.info["bads"],
+                    reject_time=self._reject_time,
+                    projector=self._projector if self._do_delayed_proj else None,
+                )
+            if bad_tuples is not None:
+                # all epochs were checked at once, move the good ones forward
+                for idx, sel in enumerate(self.selection):
+                    if len(bad_tuples[idx]):
+                        drop_log[sel] = drop_log[sel] + bad_tuples[idx]
                     else:
-                        epoch_noproj = None
-                        epoch = self._data[idx]
-                else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
-                    epoch_noproj = self._detrend_offset_decim(
-                        epoch_noproj, detrend_picks
-                    )
-                    epoch = self._project_epoch(epoch_noproj)
-
-                epoch_out = epoch_noproj if self._do_delayed_proj else epoch
-                is_good, bad_tuple = self._is_good_epoch(epoch, verbose=verbose)
-                if not is_good:
-                    assert isinstance(bad_tuple, tuple)
-                    assert all(isinstance(x, str) for x in bad_tuple)
-                    drop_log[sel] = drop_log[sel] + bad_tuple
-                    continue
-                good_idx.append(idx)
-
-                # store the epoch if there is a reason to (output or update)
-                if out or self.preload:
-                    # faster to pre-allocate, then trim as necessary
-                    if n_out == 0 and not self.preload:
-                        data = np.empty(
-                            (n_events, epoch_out.shape[0], epoch_out.shape[1]),
-                            dtype=epoch_out.dtype,
-                            order="C",
+                        good_idx.append(idx)
+                n_out = len(good_idx)
+                if n_out < n_events:
+                    _ensure_writeable(self)
+                    data = self._data
+                    _compact_epochs(data, good_idx)
+            else:
+                if self.preload:  # the good epochs are moved forward in place
+                    _ensure_writeable(self)
+                    data = self._data
+                else:
+                    detrend_picks = self._detrend_picks
+                    raw_epochs = self._iter_epochs_from_raw(range(n_events))
+                for idx, sel in enumerate(self.selection):
+                    if self.preload:  # from memory
+                        if self._do_delayed_proj:
+                            epoch_noproj = self._data[idx]
+                            epoch = self._project_epoch(epoch_noproj)
+                        else:
+                            epoch_noproj = None
+                            epoch = self._data[idx]
+                    else:  # from disk
+                        epoch_noproj = next(raw_epochs)
+                        epoch_noproj = self._detrend_offset_decim(
+                            epoch_noproj, detrend_picks
                         )
-                    data[n_out] = epoch_out
-                    n_out += 1
+                        epoch = self._project_epoch(epoch_noproj)
+
+                    epoch_out = epoch_noproj if self._do_delayed_proj else epoch
+                    is_good, bad_tuple = self._is_good_epoch(epoch, verbose=verbose)
+                    if not is_good:
+                        assert isinstance(bad_tuple, tuple)
+                        assert all(isinstance(x, str) for x in bad_tuple)
+                        drop_log[sel] = drop_log[sel] + bad_tuple
+                        continue
+                    good_idx.append(idx)
+
+                    # store the epoch if there is a reason to (output or update)
+                    if out or self.preload:
+                        # faster to pre-allocate, then trim as necessary
+                        if n_out == 0 and not self.preload:
+                            data = _allocate_epochs(
+                                (n_events, epoch_out.shape[0], epoch_out.shape[1]),
+                                epoch_out.dtype,
+                                data_fname,
+                            )
+                        data[n_out] = epoch_out
+                        n_out += 1
             self.drop_log = tuple(drop_log)
             del drop_log
 
@@ -1831,6 +1989,8 @@ class BaseEpochs(
             picks = slice(None)
         if not all(isinstance(x, slice) and x == slice(None) for x in (select, picks)):
             data = data[select][:, picks]
+            if not data_is_self_data:  # fancy indexing of strided views
+                data = np.ascontiguousarray(data)
         del picks
         if start != 0 or stop != self.times.size:
             logger.debug("  Slicing time")
@@ -1917,6 +2077,9 @@ class BaseEpochs(
             The epochs data. Will be a copy when ``copy=True`` and will be a view
             when possible when ``copy=False``.
         """
+        if not copy:
+            # a view of read-only data could not be modified in place
+            _ensure_writeable(self)
         return self._get_data(
             picks=picks, item=item, units=units, tmin=tmin, tmax=tmax, copy=copy
         )
@@ -1953,6 +2116,7 @@ class BaseEpochs(
             The epochs object with transformed data.
         """
         _check_preload(self, "epochs.apply_function")
+        _ensure_writeable(self)
         picks = _picks_to_idx(self.info, picks, exclude=(), with_ref_meg=False)
 
         if not callable(fun):
@@ -2050,7 +2214,7 @@ class BaseEpochs(
 
         s += f"), ~{sizeof_fmt(self._size)}"
         s += f", data{'' if self.preload else ' not'} loaded"
-        s += ", with metadata" if self.metadata is not None else ""
+        s += ", with metadata" if self._metadata is not None else ""
         max_events = 10
         counts = [
             f"{k!r}: {sum(self.events[:, 2] == v)}"
@@ -2154,13 +2318,33 @@ class BaseEpochs(
         for k, v in self.__dict__.items():
             # drop_log is immutable and _raw is private (and problematic to
             # deepcopy)
-            if k in ("drop_log", "_raw", "_times_readonly"):
+            if k == "_current_raw_epochs":  # a generator, copies start over
+                continue
+            if k == "_data_fname":  # copies hold their data in memory
+                result.__dict__[k] = None
+                continue
+            if k in ("drop_log", "_raw", "_raw_index", "_times_readonly") or (
+                # read-only data (e.g., a view of raw data) are copied on write
+                k == "_data" and v is not None and not v.flags.writeable
+            ):
                 memodict[id(v)] = v
             else:
                 v = deepcopy(v, memodict)
             result.__dict__[k] = v
         return result
 
+    def __del__(self):  # noqa: D105
+        # remove file for memmap
+        filename = getattr(self, "_data_fname", None)
+        if filename is not None:
+            # First, close the file out; happens automatically on del
+            self.__dict__.pop("_data", None)
+            # Now file can be removed
+            try:
+                os.remove(filename)
+            except OSError:
+                pass  # ignore file that no longer exists
+
     @verbose
     def save(
         self,
@@ -2260,8 +2444,8 @@ class BaseEpochs(
         total_size += self.events.size * 4
         over_size += len(_event_id_string(self.event_id)) + 72
         # 4. Metadata in a block of its own
-        if self.metadata is not None:
-            total_size += len(_prepare_write_metadata(self.metadata))
+        if self._metadata is not None:
+            total_size += len(_prepare_write_metadata(self._metadata))
         over_size += 56
         # 5. first sample, last sample, baseline
         over_size += 40 * (self.baseline is not None) + 40
@@ -3234,147 +3418,182 @@ def make_metadata(
     start_idx = stop_idx
     metadata[columns[start_idx:]] = None
 
-    # We're all set, let's iterate over all events and fill in in the
+    # We're all set, let's find the time window of each event and fill in the
     # respective cells in the metadata. We will subset this to include only
     # `row_events` later
-    for row_event in events_df.itertuples(name="RowEvent"):
-        row_idx = row_event.Index
-        metadata.loc[row_idx, "event_name"] = id_to_name_map[row_event.id]
-
-        # Determine which events fall into the current time window
-        if start_sample is None and isinstance(tmin, list):
-            # Lower bound is the the current or the closest previpus event with a name
-            # in "tmin"; if there is no such event (e.g., beginning of the recording is
-            # being approached), the upper lower becomes the last event in the
-            # recording.
-            prev_matching_events = events_df.loc[
-                (events_df["sample"] <= row_event.sample)
-                & (events_df["id"].isin([event_id[name] for name in tmin])),
-                :,
-            ]
-            if prev_matching_events.size == 0:
-                # No earlier matching event. Use the current one as the beginning of the
-                # time window. This may occur at the beginning of a recording.
-                window_start_sample = row_event.sample
-            else:
-                # At least one earlier matching event. Use the closest one.
-                window_start_sample = prev_matching_events.iloc[-1]["sample"]
-        elif start_sample is None:
-            # Lower bound is the current event.
-            window_start_sample = row_event.sample
-        else:
-            # Lower bound is determined by tmin.
-            window_start_sample = row_event.sample + start_sample
-
-        if stop_sample is None and isinstance(tmax, list):
-            # Upper bound is the the current or the closest following event with a name
-            # in "tmax"; if there is no such event (e.g., end of the recording is being
-            # approached), the upper bound becomes the last event in the recording.
-            next_matching_events = events_df.loc[
-                (events_df["sample"] >= row_event.sample)
-                & (events_df["id"].isin([event_id[name] for name in tmax])),
-                :,
-            ]
-            if next_matching_events.size == 0:
-                # No matching event after the current one; use the end of the recording
-                # as upper bound. This may occur at the end of a recording.
-                window_stop_sample = events_df["sample"].iloc[-1]
-            else:
-                # At least one matching later event. Use the closest one..
-                window_stop_sample = next_matching_events.iloc[0]["sample"]
-        elif stop_sample is None:
-            # Upper bound: next event of the same type, or the last event (of
-            # any type) if no later event of the same type can be found.
-            next_events = events_df.loc[
-                (events_df["sample"] > row_event.sample),
-                :,
-            ]
-            if next_events.size == 0:
-                # We've reached the last event in the recording.
-                window_stop_sample = row_event.sample
-            elif next_events.loc[next_events["id"] == row_event.id, :].size > 0:
-                # There's still an event of the same type appearing after the
-                # current event. Stop one sample short, we don't want to include that
-                # last event here, but in the next iteration.
-                window_stop_sample = (
-                    next_events.loc[next_events["id"] == row_event.id, :].iloc[0][
-                        "sample"
-                    ]
-                    - 1
-                )
-            else:
-                # There are still events after the current one, but not of the
-                # same type.
-                window_stop_sample = next_events.iloc[-1]["sample"]
-        else:
-            # Upper bound is determined by tmax.
-            window_stop_sample = row_event.sample + stop_sample
+    samples = events_df["sample"].to_numpy()
+    ids = events_df["id"].to_numpy()
+    if len(samples):
+        metadata["event_name"] = [id_to_name_map[id_] for id_ in ids]
+        _fill_metadata(
+            metadata,
+            samples,
+            ids,
+            sfreq=sfreq,
+            tmin=tmin,
+            tmax=tmax,
+            start_sample=start_sample,
+            stop_sample=stop_sample,
+            event_id=event_id,
+            id_to_name_map=id_to_name_map,
+            keep_first=keep_first,
+            keep_last=keep_last,
+        )
 
-        events_in_window = events_df.loc[
-            (events_df["sample"] >= window_start_sample)
-            & (events_df["sample"] <= window_stop_sample),
-            :,
-        ]
+    # Only keep rows of interest
+    if row_events:
+        event_id_timelocked = {
+            name: val for name, val in event_id.items() if name in row_events
+        }
+        events = events[np.isin(events[:, 2], list(event_id_timelocked.values()))]
+        metadata = metadata.loc[metadata["event_name"].isin(event_id_timelocked)]
+        assert len(events) == len(metadata)
+        event_id = event_id_timelocked
 
-        assert not events_in_window.empty
+    return metadata, events, event_id
 
-        # Store the metadata
-        for event in events_in_window.itertuples(name="Event"):
-            event_sample = event.sample - row_event.sample
-            event_time = event_sample / sfreq
-            event_time = 0 if np.isclose(event_time, 0) else event_time
-            event_name = id_to_name_map[event.id]
 
-            if not np.isnan(metadata.loc[row_idx, event_name]):
-                # Event already exists in current time window!
-                assert metadata.loc[row_idx, event_name] <= event_time
+def _event_times(samples, ref_samples, sfreq):
+    """Get event times relative to reference events, snapping ~0 to 0."""
+    times = (samples - ref_samples) / sfreq
+    times[np.isclose(times, 0)] = 0
+    return times
 
-                if event_name not in keep_last:
-                    continue
 
-            metadata.loc[row_idx, event_name] = event_time
+def _fill_metadata(
+    metadata,
+    samples,
+    ids,
+    *,
+    sfreq,
+    tmin,
+    tmax,
+    start_sample,
+    stop_sample,
+    event_id,
+    id_to_name_map,
+    keep_first,
+    keep_last,
+):
+    """Fill in the event times of each metadata row (helper for make_metadata)."""
+    from .event import match_event_names
 
-            # Handle keep_first and keep_last event aggregation
-            for event_group_name in keep_first + keep_last:
-                if event_name not in match_event_names(event_id, [event_group_name]):
+    pd = _check_pandas_installed()
+    # The time windows are found by binary search over the sorted events
+    order = np.argsort(samples, kind="stable")
+    sorted_samples, sorted_ids = samples[order], ids[order]
+
+    def _matching_samples(names):
+        return sorted_samples[np.isin(sorted_ids, [event_id[name] for name in names])]
+
+    if start_sample is None and isinstance(tmin, list):
+        # Lower bound is the current or the closest previous event with a name
+        # in "tmin"; if there is no such event (e.g., beginning of the
+        # recording is being approached), it becomes the current event.
+        window_start = samples.copy()
+        tmin_samples = _matching_samples(tmin)
+        prev = np.searchsorted(tmin_samples, samples, side="right") - 1
+        window_start[prev >= 0] = tmin_samples[prev[prev >= 0]]
+    elif start_sample is None:
+        # Lower bound is the current event.
+        window_start = samples
+    else:
+        # Lower bound is determined by tmin.
+        window_start = samples + start_sample
+
+    if stop_sample is None and isinstance(tmax, list):
+        # Upper bound is the the current or the closest following event with a
+        # name in "tmax"; if there is no such event (e.g., end of the recording
+        # is being approached), the upper bound becomes the last event in the
+        # recording.
+        window_stop = np.full_like(samples, sorted_samples[-1])
+        tmax_samples = _matching_samples(tmax)
+        next_ = np.searchsorted(tmax_samples, samples, side="left")
+        has_next = next_ < len(tmax_samples)
+        window_stop[has_next] = tmax_samples[next_[has_next]]
+    elif stop_sample is None:
+        # Upper bound: next event of the same type (stopping one sample short,
+        # as that event gets its own row), or the last event (of any type) if
+        # no later event of the same type can be found.
+        window_stop = np.full_like(samples, sorted_samples[-1])
+        for id_ in np.unique(ids):
+            same_samples = sorted_samples[sorted_ids == id_]
+            rows = np.where(ids == id_)[0]
+            next_ = np.searchsorted(same_samples, samples[rows], side="right")
+            has_next = next_ < len(same_samples)
+            window_stop[rows[has_next]] = same_samples[next_[has_next]] - 1
+        # We've reached the last event in the recording.
+        last = np.searchsorted(sorted_samples, samples, side="right") == len(samples)
+        window_stop[last] = samples[last]
+    else:
+        # Upper bound is determined by tmax.
+        window_stop = samples + stop_sample
+    window_lo = np.searchsorted(sorted_samples, window_start, side="left")
+    window_hi = np.searchsorted(sorted_samples, window_stop, side="right")
+    assert (window_hi > window_lo).all()
+
+    # Store the time of the first event of each type in the window (or of the
+    # last one for the types in keep_last)
+    for id_, event_name in id_to_name_map.items():
+        name_samples = sorted_samples[sorted_ids == id_]
+        if event_name in keep_last:
+            idx = np.searchsorted(name_samples, window_stop, side="right") - 1
+            found = idx >= 0
+            found[found] = name_samples[idx[found]] >= window_start[found]
+        else:
+            idx = np.searchsorted(name_samples, window_start, side="left")
+            found = idx < len(name_samples)
+            found[found] = name_samples[idx[found]] <= window_stop[found]
+        times = np.full(len(samples), np.nan)
+        times[found] = _event_times(name_samples[idx[found]], samples[found], sfreq)
+        metadata[event_name] = times
+
+    # Handle keep_first and keep_last event aggregation, going through the
+    # events in each window in order
+    if not keep_first + keep_last:
+        return
+    group_names = {
+        group: match_event_names(event_id, [group]) for group in keep_first + keep_last
+    }
+    sorted_names = [id_to_name_map[id_] for id_ in sorted_ids]
+    group_times = {group: np.full(len(samples), np.nan) for group in group_names}
+    first_last = {
+        group: np.full(len(samples), None, object)
+        for group in group_names
+        if group not in event_id
+    }
+    for row, (lo, hi) in enumerate(zip(window_lo, window_hi)):
+        row_times = dict()  # the (non-NaN) event times of this row
+        event_times = _event_times(sorted_samples[lo:hi], samples[row], sfreq)
+        for event_name, event_time in zip(sorted_names[lo:hi], event_times):
+            if event_name in row_times:
+                # Event already exists in current time window!
+                if event_name not in keep_last:
                     continue
-
-                if event_group_name in keep_first:
-                    first_last_col = f"first_{event_group_name}"
-                else:
-                    first_last_col = f"last_{event_group_name}"
-
-                old_time = metadata.loc[row_idx, event_group_name]
-                if not np.isnan(old_time):
-                    if (event_group_name in keep_first and old_time <= event_time) or (
-                        event_group_name in keep_last and old_time >= event_time
+            row_times[event_name] = event_time
+            for group, names in group_names.items():
+                if event_name not in names:
+                    continue
+                old_time = row_times.get(group)
+                if old_time is not None:
+                    if (group in keep_first and old_time <= event_time) or (
+                        group in keep_last and old_time >= event_time
                     ):
                         continue
-
-                if event_group_name not in event_id:
+                if group not in event_id:
                     # This is an HED. Strip redundant information from the
                     # event name
-                    name = (
-                        event_name.replace(event_group_name, "")
-                        .replace("//", "/")
-                        .strip("/")
+                    first_last[group][row] = (
+                        event_name.replace(group, "").replace("//", "/").strip("/")
                     )
-                    metadata.loc[row_idx, first_last_col] = name
-                    del name
-
-                metadata.loc[row_idx, event_group_name] = event_time
-
-    # Only keep rows of interest
-    if row_events:
-        event_id_timelocked = {
-            name: val for name, val in event_id.items() if name in row_events
-        }
-        events = events[np.isin(events[:, 2], list(event_id_timelocked.values()))]
-        metadata = metadata.loc[metadata["event_name"].isin(event_id_timelocked)]
-        assert len(events) == len(metadata)
-        event_id = event_id_timelocked
-
-    return metadata, events, event_id
+                row_times[group] = event_time
+        for group, times in group_times.items():
+            times[row] = row_times.get(group, np.nan)
+    for group, times in group_times.items():
+        metadata[group] = times
+    for group, names in first_last.items():
+        prefix = "first" if group in keep_first else "last"
+        metadata[f"{prefix}_{group}"] = pd.Series(names, metadata.index, object)
 
 
 def _events_from_annotations(raw, events, event_id, annotations, on_missing):
@@ -3434,7 +3653,7 @@ class Epochs(BaseEpochs):
         Defaults to ``(None, 0)``, i.e. beginning of the the data until
         time point zero.
     %(picks_all)s
-    preload : bool
+    preload : bool | path-like
         %(epochs_preload)s
     %(reject_epochs)s
     %(flat)s
@@ -3556,6 +3775,7 @@ class Epochs(BaseEpochs):
             raise ValueError(
                 "The first argument to `Epochs` must be an instance of mne.io.BaseRaw"
             )
+        _validate_type(preload, (bool, "path-like"), "preload")
         info = deepcopy(raw.info)
         annotations = raw.annotations.copy()
 
@@ -3600,24 +3820,8 @@ class Epochs(BaseEpochs):
             annotations=annotations,
         )
 
-    @verbose
-    def _get_epoch_from_raw(self, idx, verbose=None):
-        """Load one epoch from disk.
-
-        Returns
-        -------
-        data : array | str | None
-            If string, it's details on rejection reason.
-            If array, it's the data in the desired range (good segment)
-            If None, it means no data is available.
-        """
-        if self._raw is None:
-            # This should never happen, as raw=None only if preload=True
-            raise ValueError(
-                "An error has occurred, no valid raw file found. "
-                "Please report this to the mne-python "
-                "developers."
-            )
+    def _get_epoch_bounds(self, idx):
+        """Get the raw sample spans to read and to check for an epoch."""
         sfreq = self._raw.info["sfreq"]
         event_samp = self.events[idx, 0]
         # Read a data segment from "start" to "stop" in samples
@@ -3640,6 +3844,128 @@ class Epochs(BaseEpochs):
         diff = int(round((self._raw_times[-1] - reject_tmax) * sfreq))
         reject_stop = stop - diff
 
+        return start, stop, reject_start, reject_stop
+
+    def _iter_epochs_from_raw(self, idxs):
+        """Load epochs from disk, coalescing the reads of nearby epochs.
+
+        Yields the same as ``_get_epoch_from_raw`` for each index. Runs of
+        epochs whose sample spans overlap or touch (the usual case for densely
+        packed epochs, as events are sorted) are read from the raw data at once
+        and then sliced out of the shared buffer.
+        """
+        raw = self._raw
+        if raw is None or raw.preload:  # nothing to gain from coalescing
+            yield from super()._iter_epochs_from_raw(idxs)
+            return
+        max_samples = _EPOCHS_READ_BYTES // (8 * max(len(self.picks), 1))
+        prefetcher = getattr(raw, "_prefetcher", None)
+        if prefetcher is not None:
+            # keep the runs within the size of the blocks that are read ahead
+            max_samples = min(max_samples, prefetcher.n_block)
+        max_samples = max(max_samples, len(self._raw_times))
+        pending = []  # (start, stop, data) with data=None for the spans to read
+        span = None  # the samples covering the spans to read
+        for idx in idxs:
+            start, stop, reject_start, reject_stop = self._get_epoch_bounds(idx)
+            if (
+                start < 0
+                or stop > raw.n_times
+                or (
+                    self.reject_by_annotation
+                    and raw._bad_segment_description(reject_start, reject_stop)
+                    is not None
+                )
+            ):
+                # not (fully) read, handled as usual
+                pending.append((None, None, self._get_epoch_from_raw(idx)))
+                continue
+            if span is not None and (
+                start < span[0] or start > span[1] or stop - span[0] > max_samples
+            ):
+                yield from self._read_epoch_run(pending, span)
+                pending, span = [], None
+            span = (start, stop) if span is None else (span[0], max(span[1], stop))
+            pending.append((start, stop, None))
+        yield from self._read_epoch_run(pending, span)
+
+    def _read_epoch_run(self, pending, span):
+        if span is not None:
+            logger.debug(
+                f"    Getting {sum(p[0] is not None for p in pending)} epochs "
+                f"for {span[0]}-{span[1]}"
+            )
+            data = self._raw._getitem(
+                (self.picks, slice(span[0], span[1])), return_times=False
+            )
+        for start, stop, epoch in pending:
+            if start is not None:
+                # copy, as the epochs are processed in place
+                epoch = data[:, start - span[0] : stop - span[0]].copy()
+            yield epoch
+
+    def _get_raw_view(self):
+        """Get the epochs as a read-only strided view of preloaded raw data.
+
+        Returns None unless the epochs are regularly spaced, in-bounds windows
+        of all raw channels that need no projection, baseline correction,
+        detrending, decimation or rejection.
+        """
+        raw = self._raw
+        n_epochs = len(self.events)
+        if (
+            raw is None
+            or not raw.preload
+            or n_epochs == 0
+            or (self._projector is not None and not self._do_delayed_proj)
+            or (self._do_baseline and self.baseline is not None)
+            or self.detrend is not None
+            or self._decim != 1
+            or self._offset is not None
+            or self.reject is not None
+            or self.flat is not None
+            or not np.array_equal(self.picks, np.arange(len(raw.ch_names)))
+        ):
+            return None
+        bounds = np.array([self._get_epoch_bounds(idx) for idx in range(n_epochs)])
+        starts = bounds[:, 0]
+        step = starts[1] - starts[0] if n_epochs > 1 else 1
+        if (
+            starts[0] < 0
+            or bounds[-1, 1] > raw.n_times
+            or step < 1
+            or np.any(np.diff(starts) != step)
+        ):
+            return None
+        if self.reject_by_annotation and any(
+            raw._bad_segment_description(reject_start, reject_stop) is not None
+            for reject_start, reject_stop in bounds[:, 2:]
+        ):
+            return None
+        windows = np.lib.stride_tricks.sliding_window_view(
+            raw._data, len(self._raw_times), axis=1
+        )
+        return windows[:, starts[0] : starts[-1] + 1 : step].transpose(1, 0, 2)
+
+    @verbose
+    def _get_epoch_from_raw(self, idx, verbose=None):
+        """Load one epoch from disk.
+
+        Returns
+        -------
+        data : array | str | None
+            If string, it's details on rejection reason.
+            If array, it's the data in the desired range (good segment)
+            If None, it means no data is available.
+        """
+        if self._raw is None:
+            # This should never happen, as raw=None only if preload=True
+            raise ValueError(
+                "An error has occurred, no valid raw file found. "
+                "Please report this to the mne-python "
+                "developers."
+            )
+        start, stop, reject_start, reject_stop = self._get_epoch_bounds(idx)
         logger.debug(f"    Getting epoch for {start}-{stop}")
         data = self._raw._check_bad_segment(
             start,
@@ -4022,6 +4348,70 @@ def _is_good(
             return False, bad_tuple
 
 
+def _find_bad_epochs(
+    data,
+    ch_names,
+    channel_type_idx,
+    reject,
+    flat,
+    *,
+    ignore_chs=(),
+    reject_time=None,
+    projector=None,
+):
+    """Test all epochs in data at once according to reject and flat.
+
+    This is a vectorized version of :func:`_is_good` with ``full_report=True``
+    that processes blocks of epochs. It returns the tuple of offending channels
+    for each epoch (empty for good epochs), or None if any criterion is a
+    function.
+    """
+    checkable = ~np.isin(ch_names, list(ignore_chs))
+    criteria = list()
+    for refl, f, t in zip([reject, flat], [np.greater, np.less], ["", "flat"]):
+        for key, criterion in (refl or dict()).items():
+            if callable(criterion):
+                return None
+            idx = channel_type_idx[key]
+            if len(idx) > 0:
+                criteria.append((key.upper(), idx, criterion, f, t))
+    # bads[ci][ii, jj]: channel idx[jj] of epoch ii fails criterion ci
+    bads = [np.zeros((len(data), len(c[1])), bool) for c in criteria]
+    if len(criteria):
+        for sl in _chunk_slices(len(data), data[:1].nbytes):
+            block = data[sl]
+            if projector is not None:
+                block = np.matmul(projector, block).astype(block.dtype, copy=False)
+            if reject_time is not None:
+                block = block[..., reject_time]
+            maxs, mins = np.max(block, axis=-1), np.min(block, axis=-1)
+            for (_, idx, criterion, f, _), bad in zip(criteria, bads):
+                deltas = maxs[:, idx] - mins[:, idx]
+                bad[sl] = f(deltas, criterion) & checkable[idx]
+    bad_tuples = [()] * len(data)
+    any_bad = np.zeros(len(data), bool)
+    for bad in bads:
+        any_bad |= bad.any(axis=1)
+    for ii in np.where(any_bad)[0]:
+        bad_tuple = tuple()
+        for (name, idx, _, _, t), bad in zip(criteria, bads):
+            bad_names = [ch_names[idx[jj]] for jj in np.where(bad[ii])[0]]
+            if len(bad_names) and not len(bad_tuple):
+                logger.info(f"    Rejecting {t} epoch based on {name} : {bad_names}")
+            bad_tuple += tuple(bad_names)
+        bad_tuples[ii] = bad_tuple
+    return bad_tuples
+
+
+def _compact_epochs(data, keep):
+    """Move the epochs to keep to the front of data, in blocks of epochs."""
+    keep = np.asarray(keep, int)
+    assert (np.diff(keep) > 0).all()
+    # each block of kept epochs is read before it can be overwritten
+    for sl in _chunk_slices(len(keep), data[:1].nbytes):
+        data[sl] = data[keep[sl]]
+
+
 def _read_one_epoch_file(f, tree, preload):
     """Read a single FIF file."""
     with f as fid:
@@ -4215,9 +4605,13 @@ def read_epochs(fname, proj=True, preload=True, verbose=None) -> "EpochsFIF":
     ----------
     %(fname_epochs)s
     %(proj_epochs)s
-    preload : bool
+    preload : bool | path-like
         If True, read all epochs from disk immediately. If ``False``, epochs
-        will be read on demand.
+        will be read on demand. If path-like, the epochs are read into a
+        memory-mapped file at that location (see :class:`mne.Epochs`).
+
+        .. versionchanged:: 1.10
+           Support for reading into a memory-mapped file.
     %(verbose)s
 
     Returns
@@ -4239,6 +4633,33 @@ class _RawContainer:
         self.cals = cals
         self.proj = False
         self.fmt = fmt
+        # complex data are stored as interleaved real and imaginary parts
+        self.read_fmt = {">c8": ">f4", ">c16": ">f8"}.get(fmt, fmt)
+        self.dtype = np.float64 if self.read_fmt == fmt else np.complex128
+        self.epoch_size = int(np.prod(epoch_shape)) * np.dtype(fmt).itemsize
+
+    def epoch_offset(self, pos):
+        """Get the byte offset of the epoch(s) stored at position pos."""
+        return self.data_tag.pos + 16 + pos * self.epoch_size  # 16 = Tag header
+
+    def read_epochs(self, offset, n_epochs):
+        """Read consecutively stored epochs starting at a byte offset."""
+        # the following is equivalent to this, but faster:
+        #
+        # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
+        # >>> data *= raw.cals[np.newaxis, :, :]
+        # >>> data = data[idx]
+        #
+        # Eventually this could be refactored in io/tag.py if other functions
+        # could make use of it
+        self.fid.seek(offset, 0)
+        data = np.frombuffer(self.fid.read(n_epochs * self.epoch_size), self.read_fmt)
+        if self.read_fmt != self.fmt:
+            data = data.view(self.fmt)
+        data = data.astype(self.dtype)
+        data.shape = (n_epochs,) + tuple(self.epoch_shape)
+        data *= self.cals
+        return data
 
     def __del__(self):  # noqa: D105
         self.fid.close()
@@ -4252,9 +4673,13 @@ class EpochsFIF(BaseEpochs):
     ----------
     %(fname_epochs)s
     %(proj_epochs)s
-    preload : bool
+    preload : bool | path-like
         If True, read all epochs from disk immediately. If False, epochs will
-        be read on demand.
+        be read on demand. If path-like, the epochs are read into a
+        memory-mapped file at that location.
+
+        .. versionchanged:: 1.10
+           Support for reading into a memory-mapped file.
     %(verbose)s
 
     See Also
@@ -4268,6 +4693,10 @@ class EpochsFIF(BaseEpochs):
     def __init__(self, fname, proj=True, preload=True, verbose=None):
         from .io.base import _get_fname_rep
 
+        _validate_type(preload, (bool, "path-like"), "preload")
+        # epochs loaded into a memmap are read on demand first
+        data_fname = None if isinstance(preload, bool) else preload
+        preload = preload is True
         if _path_like(fname):
             check_fname(
                 fname=fname,
@@ -4421,50 +4850,165 @@ class EpochsFIF(BaseEpochs):
         # private property to suggest that people re-save epochs if they add
         # annotations
         self._unsafe_annot_add = unsafe_annot_add
+        if not preload:
+            self._raw_index = _build_epoch_index(raw)
+        if data_fname is not None:
+            self._load_data(data_fname)
+
+    def _locate_epochs(self, idxs):
+        """Find the file parts and byte offsets of epochs in the index."""
+        index_samps, index_parts, index_offsets = self._raw_index
+        event_samps = self.events[idxs, 0]
+        loc = np.searchsorted(index_samps, event_samps)
+        loc[loc == len(index_samps)] = 0
+        if not np.array_equal(index_samps[loc], event_samps):
+            raise RuntimeError(
+                "Correct epoch could not be found, please contact mne-python developers"
+            )
+        return index_parts[loc], index_offsets[loc]
 
     @verbose
     def _get_epoch_from_raw(self, idx, verbose=None):
         """Load one epoch from disk."""
-        # Find the right file and offset to use
-        event_samp = self.events[idx, 0]
-        for raw in self._raw:
-            idx = np.where(raw.event_samps == event_samp)[0]
-            if len(idx) == 1:
-                fmt = raw.fmt
-                idx = idx[0]
-                size = np.prod(raw.epoch_shape) * np.dtype(fmt).itemsize
-                offset = idx * size + 16  # 16 = Tag header
-                break
-        else:
-            # read the correct subset of the data
-            raise RuntimeError(
-                "Correct epoch could not be found, please contact mne-python developers"
-            )
-        # the following is equivalent to this, but faster:
-        #
-        # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
-        # >>> data *= raw.cals[np.newaxis, :, :]
-        # >>> data = data[idx]
-        #
-        # Eventually this could be refactored in io/tag.py if other functions
-        # could make use of it
-        raw.fid.seek(raw.data_tag.pos + offset, 0)
-        if fmt == ">c8":
-            read_fmt = ">f4"
-        elif fmt == ">c16":
-            read_fmt = ">f8"
-        else:
-            read_fmt = fmt
-        data = np.frombuffer(raw.fid.read(size), read_fmt)
-        if read_fmt != fmt:
-            data = data.view(fmt)
-            data = data.astype(np.complex128)
-        else:
-            data = data.astype(np.float64)
+        parts, offsets = self._locate_epochs([idx])
+        return self._raw[parts[0]].read_epochs(offsets[0], 1)[0]
 
-        data.shape = raw.epoch_shape
-        data *= raw.cals
-        return data
+    def _iter_epochs_from_raw(self, idxs):
+        """Load epochs from disk, reading runs of stored epochs at once.
+
+        Batches of requested epochs are located with the epoch index, sorted
+        by file position, and each run of consecutively stored epochs is read
+        with a single call, so scattered subsets only touch the parts and
+        bytes they need.
+        """
+        idxs = np.asarray(idxs, int)
+        if len(idxs) == 0:
+            return
+        parts, offsets = self._locate_epochs(idxs)
+        epoch_size = self._raw[0].epoch_size
+        n_batch = max(_EPOCHS_READ_BYTES // epoch_size, 1)
+        for start in range(0, len(idxs), n_batch):
+            sl = slice(start, start + n_batch)
+            batch_parts, batch_offsets = parts[sl], offsets[sl]
+            epochs = [None] * len(batch_parts)
+            for part in np.unique(batch_parts):
+                which = np.where(batch_parts == part)[0]
+                uniq, inverse = np.unique(batch_offsets[which], return_inverse=True)
+                raw = self._raw[part]
+                data = np.empty((len(uniq),) + tuple(raw.epoch_shape), raw.dtype)
+                runs = np.split(
+                    np.arange(len(uniq)), np.where(np.diff(uniq) != epoch_size)[0] + 1
+                )
+                for run in runs:
+                    data[run] = raw.read_epochs(uniq[run[0]], len(run))
+                seen = np.zeros(len(uniq), bool)
+                for ii, jj in zip(which, inverse.ravel()):
+                    # epochs are modified in place, so repeats get their own
+                    epochs[ii] = data[jj].copy() if seen[jj] else data[jj]
+                    seen[jj] = True
+            yield from epochs
+
+
+def _build_epoch_index(raws):
+    """Map the event sample of each stored epoch to its file part and offset.
+
+    Returns the sorted event samples with the matching part numbers and byte
+    offsets (of the epoch data within the part).
+    """
+    samps, parts, offsets = list(), list(), list()
+    for part, raw in enumerate(raws):
+        n_epochs = len(raw.event_samps)
+        samps.append(raw.event_samps)
+        parts.append(np.full(n_epochs, part))
+        offsets.append(raw.epoch_offset(np.arange(n_epochs)))
+    samps, parts, offsets = (
+        np.concatenate(x) if len(x) else np.zeros(0, int)
+        for x in (samps, parts, offsets)
+    )
+    order = np.argsort(samps, kind="stable")
+    return samps[order], parts[order], offsets[order]
+
+
+class _EpochsConcatenated(BaseEpochs):
+    """Epochs that read their data from a list of other epochs instances.
+
+    ``source_index`` holds, for each epoch, the index of the source instance
+    and the position of the epoch within it. Sources are only read from when
+    data are requested, so concatenating does not copy any data.
+    """
+
+    def __init__(
+        self,
+        epochs_list,
+        source_index,
+        *,
+        info,
+        events,
+        event_id,
+        tmin,
+        tmax,
+        baseline,
+        selection,
+        drop_log,
+        metadata,
+        raw_sfreq,
+    ):
+        super().__init__(
+            info,
+            None,
+            events,
+            event_id,
+            tmin,
+            tmax,
+            baseline=None,
+            raw=list(epochs_list),
+            proj=False,
+            preload_at_end=False,
+            on_missing="ignore",
+            selection=selection,
+            drop_log=drop_log,
+            metadata=metadata,
+            raw_sfreq=raw_sfreq,
+            verbose=False,
+        )
+        # the sources already applied their baseline correction
+        self.baseline = baseline
+        self._do_baseline = False
+        self._bad_dropped = True
+        self._source_index = np.asarray(source_index, int)
+
+    def _getitem(self, item, *args, return_indices=False, **kwargs):
+        source_index = self._source_index
+        inst, select = super()._getitem(item, *args, return_indices=True, **kwargs)
+        inst._source_index = source_index[select]
+        return (inst, select) if return_indices else inst
+
+    @verbose
+    def _get_epoch_from_raw(self, idx, verbose=None):
+        """Get one epoch from its source."""
+        source, pos = self._source_index[idx]
+        return self._raw[source].get_data(item=[pos], verbose=False)[0]
+
+    def _iter_epochs_from_raw(self, idxs):
+        """Get epochs from their sources, a block of epochs at a time."""
+        idxs = np.asarray(idxs, int)
+        if len(idxs) == 0:
+            return
+        sources, positions = self._source_index[idxs].T
+        epoch_bytes = len(self.ch_names) * len(self._raw_times) * 8
+        n_batch = max(_EPOCHS_READ_BYTES // epoch_bytes, 1)
+        for start in range(0, len(idxs), n_batch):
+            sl = slice(start, start + n_batch)
+            batch_sources, batch_positions = sources[sl], positions[sl]
+            epochs = [None] * len(batch_sources)
+            for source in np.unique(batch_sources):
+                which = np.where(batch_sources == source)[0]
+                data = self._raw[source].get_data(
+                    item=batch_positions[which], verbose=False
+                )
+                for ii, epoch in zip(which, data):
+                    epochs[ii] = epoch
+            yield from epochs
 
 
 @fill_doc
@@ -4498,9 +5042,10 @@ def bootstrap(epochs, random_state=None):
 
 
 def _concatenate_epochs(
-    epochs_list, *, with_data=True, add_offset=True, on_mismatch="raise"
+    epochs_list, *, with_data=True, drop_bad=None, add_offset=True, on_mismatch="raise"
 ):
     """Auxiliary function for concatenating epochs."""
+    drop_bad = with_data if drop_bad is None else drop_bad
     if not isinstance(epochs_list, list | tuple):
         raise TypeError(f"epochs_list must be a list or tuple, got {type(epochs_list)}")
 
@@ -4530,7 +5075,7 @@ def _concatenate_epochs(
             epochs.set_annotations(None)
     out = epochs_list[0]
     offsets = [0]
-    if with_data:
+    if drop_bad:
         out.drop_bad()
         offsets.append(len(out))
     events = [out.events]
@@ -4577,7 +5122,7 @@ def _concatenate_epochs(
                 )
                 raise ValueError(msg.format(key, event_id[key], epochs.event_id[key]))
 
-        if with_data:
+        if drop_bad:
             epochs.drop_bad()
             offsets.append(len(epochs))
         evs = epochs.events.copy()
@@ -4622,12 +5167,12 @@ def _concatenate_epochs(
             metadata = pd.concat(metadata)
         else:  # dict of dicts
             metadata = sum(metadata, list())
-    assert len(offsets) == (len(epochs_list) if with_data else 0) + 1
+    assert len(offsets) == (len(epochs_list) if drop_bad else 0) + 1
     data = None
     if with_data:
         offsets = np.cumsum(offsets)
         for start, stop, epochs in zip(offsets[:-1], offsets[1:], epochs_list):
-            this_data = epochs.get_data(copy=False)
+            this_data = epochs._get_data(copy=False)
             if data is None:
                 data = np.empty(
                     (offsets[-1], len(out.ch_names), len(out.times)),
@@ -4651,7 +5196,7 @@ def _concatenate_epochs(
 
 @verbose
 def concatenate_epochs(
-    epochs_list, add_offset=True, *, on_mismatch="raise", verbose=None
+    epochs_list, add_offset=True, *, on_mismatch="raise", preload=True, verbose=None
 ):
     """Concatenate a list of `~mne.Epochs` into one `~mne.Epochs` object.
 
@@ -4668,19 +5213,34 @@ def concatenate_epochs(
         concatenation.
         If False, the event times are unaltered during the concatenation.
     %(on_mismatch_info)s
-    %(verbose)s
 
         .. versionadded:: 0.24
+    preload : bool | path-like
+        If True (default), the data of all epochs are copied into memory.
+        If False, the concatenated epochs keep references to the epochs in
+        ``epochs_list`` and only read from them when data are requested
+        (e.g., by :meth:`~mne.Epochs.get_data` or
+        :meth:`~mne.Epochs.load_data`), in blocks of epochs when iterating.
+        If path-like, the data are concatenated into a memory-mapped file at
+        that location.
+
+        .. versionadded:: 1.10
+    %(verbose)s
 
     Returns
     -------
-    epochs : instance of EpochsArray
-        The result of the concatenation. All data will be loaded into memory.
+    epochs : instance of EpochsArray | Epochs
+        The result of the concatenation. Unless ``preload=False``, all data
+        will be loaded into memory (or into the memory-mapped file).
 
     Notes
     -----
+    With ``preload=False``, the input epochs must not be modified (e.g.,
+    filtered in place) while the concatenated epochs have not been loaded.
+
     .. versionadded:: 0.9.0
     """
+    _validate_type(preload, (bool, "path-like"), "preload")
     (
         info,
         data,
@@ -4695,11 +5255,38 @@ def concatenate_epochs(
         drop_log,
     ) = _concatenate_epochs(
         epochs_list,
-        with_data=True,
+        with_data=preload is True,
+        drop_bad=True,
         add_offset=add_offset,
         on_mismatch=on_mismatch,
     )
     selection = np.where([len(d) == 0 for d in drop_log])[0]
+    if preload is not True:
+        n_epochs = [len(epochs) for epochs in epochs_list]
+        source_index = np.stack(
+            [
+                np.repeat(np.arange(len(epochs_list)), n_epochs),
+                np.concatenate([np.arange(n) for n in n_epochs]),
+            ],
+            axis=1,
+        )
+        out = _EpochsConcatenated(
+            epochs_list,
+            source_index,
+            info=info,
+            events=events,
+            event_id=event_id,
+            tmin=tmin,
+            tmax=tmax,
+            baseline=baseline,
+            selection=selection,
+            drop_log=drop_log,
+            metadata=metadata,
+            raw_sfreq=raw_sfreq,
+        )
+        if preload is not False:
+            out._load_data(preload)
+        return out
     out = EpochsArray(
         data=data,
         info=info,
@@ -4933,6 +5520,8 @@ def make_fixed_length_epochs(
     proj=True,
     overlap=0.0,
     id=1,  # noqa: A002
+    *,
+    copy=True,
     verbose=None,
 ):
     """Divide continuous raw data into equal-sized consecutive epochs.
@@ -4959,6 +5548,12 @@ def make_fixed_length_epochs(
         The id to use (default 1).
 
         .. versionadded:: 0.24.0
+    copy : bool
+        If False, ``preload=True`` and ``raw`` is preloaded, the epochs data
+        are a read-only view of the raw data when possible (see Notes) instead
+        of a copy. Default is True.
+
+        .. versionadded:: 1.10
     %(verbose)s
 
     Returns
@@ -4968,19 +5563,33 @@ def make_fixed_length_epochs(
 
     Notes
     -----
+    With ``copy=False``, the epochs data are a view of the raw data (with
+    overlapping epochs sharing memory) whenever no projection needs to be
+    applied and no epochs are rejected by annotations. Modifying ``raw`` in
+    place then also modifies the epochs. Methods that modify the epochs data in
+    place (as well as :meth:`~mne.Epochs.get_data` with ``copy=False``) first
+    copy them, so the raw data are never modified through the epochs, but
+    writing to ``epochs._data`` directly fails.
+
     .. versionadded:: 0.20
     """
     events = make_fixed_length_events(raw, id=id, duration=duration, overlap=overlap)
     delta = 1.0 / raw.info["sfreq"]
-    return Epochs(
+    _validate_type(copy, bool, "copy")
+    use_view = not copy and preload is True and raw.preload
+    epochs = Epochs(
         raw,
         events,
         event_id=[id],
         tmin=0,
         tmax=duration - delta,
         baseline=None,
-        preload=preload,
+        preload=False if use_view else preload,
         reject_by_annotation=reject_by_annotation,
         proj=proj,
         verbose=verbose,
     )
+    if use_view:
+        # falls back to copying the epochs if they cannot be a view
+        epochs._load_data(data=epochs._get_raw_view())
+    return epochs
@@ -375,17 +375,49 @@ def write_events(filename, events, *, overwrite=False, verbose=None):
                 f.write(f"{e[0]:6d} {e[1]:6d} {e[2]:3d}\n")
 
 
-def _find_stim_steps(data, first_samp, pad_start=None, pad_stop=None, merge=0):
-    changed = np.diff(data, axis=1) != 0
-    idx = np.where(np.all(changed, axis=0))[0]
-    if len(idx) == 0:
-        return np.empty((0, 3), dtype="int32")
+# Number of samples of the stim channel(s) to read at once when looking for
+# steps, so that memory use does not grow with the length of the recording
+_STIM_CHUNK_SAMPLES = 1_000_000
+
+
+def _read_stim_steps(raw, picks, convert, *, combine=False):
+    """Find the raw steps in stim channels, reading them chunk by chunk.
+
+    ``convert`` turns a chunk of stim channel data into int64 values. With
+    ``combine=True`` only steps where all channels change value at once are
+    found (with the values of the first channel), otherwise the steps are
+    found for each channel. Returns the list of steps and the initial values.
+    """
+    n_out = 1 if combine else len(picks)
+    steps = [[] for _ in range(n_out)]
+    initial = None
+    for start in range(0, raw.n_times, _STIM_CHUNK_SAMPLES):
+        # overlap by one sample so that steps at chunk boundaries are found
+        read_start = max(start - 1, 0)
+        stop = min(start + _STIM_CHUNK_SAMPLES, raw.n_times)
+        data = convert(raw[picks, read_start:stop][0])
+        if initial is None:
+            initial = data[:, 0]
+        changed = np.diff(data, axis=1) != 0
+        if combine:
+            changed = np.all(changed, axis=0, keepdims=True)
+        for ii, ch_changed in enumerate(changed):
+            idx = np.where(ch_changed)[0]
+            steps[ii].append(
+                np.c_[
+                    idx + (read_start + 1 + raw.first_samp),
+                    data[ii, idx],
+                    data[ii, idx + 1],
+                ]
+            )
+    steps = [np.concatenate(ch_steps).astype(np.int64) for ch_steps in steps]
+    return steps, initial
 
-    pre_step = data[0, idx]
-    idx += 1
-    post_step = data[0, idx]
-    idx += first_samp
-    steps = np.c_[idx, pre_step, post_step]
+
+def _find_stim_steps(steps, stop_samp, pad_start=None, pad_stop=None, merge=0):
+    """Pad and merge the steps found by _read_stim_steps."""
+    if len(steps) == 0:
+        return np.empty((0, 3), dtype="int32")
 
     if pad_start is not None:
         v = steps[0, 1]
@@ -395,8 +427,7 @@ def _find_stim_steps(data, first_samp, pad_start=None, pad_stop=None, merge=0):
     if pad_stop is not None:
         v = steps[-1, 2]
         if v != pad_stop:
-            last_idx = len(data[0]) + first_samp
-            steps = np.append(steps, [[last_idx, v, pad_stop]], axis=0)
+            steps = np.append(steps, [[stop_samp, v, pad_stop]], axis=0)
 
     if merge != 0:
         diff = np.diff(steps[:, 0])
@@ -463,35 +494,56 @@ def find_stim_steps(raw, pad_start=None, pad_stop=None, merge=0, stim_channel=No
     picks = pick_channels(raw.info["ch_names"], include=stim_channel, ordered=False)
     if len(picks) == 0:
         raise ValueError("No stim channel found to extract event triggers.")
-    data, _ = raw[picks, :]
-    if np.any(data < 0):
+    negative = False
+
+    def convert(data):
+        nonlocal negative
+        if np.any(data < 0):
+            negative = True
+            data = np.abs(data)  # make sure trig channel is positive
+        return data.astype(np.int64)
+
+    (steps,), _ = _read_stim_steps(raw, picks, convert, combine=True)
+    if negative:
         warn("Trigger channel contains negative values, using absolute value.")
-        data = np.abs(data)  # make sure trig channel is positive
-    data = data.astype(np.int64)
 
     return _find_stim_steps(
-        data, raw.first_samp, pad_start=pad_start, pad_stop=pad_stop, merge=merge
+        steps,
+        raw.last_samp + 1,
+        pad_start=pad_start,
+        pad_stop=pad_stop,
+        merge=merge,
     )
 
 
+def _convert_stim_data(data, uint_cast, negative):
+    """Convert stim channel data to non-negative integers."""
+    data = data.astype(np.int64)
+    if uint_cast:
+        data = data.astype(np.uint16).astype(np.int64)
+    if data.min() < 0:
+        negative[np.where(data.min(axis=1) < 0)[0]] = True
+        data = np.abs(data)  # make sure trig channel is positive
+    return data
+
+
 @verbose
 def _find_events(
-    data,
+    steps,
+    initial_value,
     first_samp,
+    stop_samp,
     *,
     verbose=None,
     output="onset",
     consecutive="increasing",
     min_samples=0,
     mask=None,
-    uint_cast=False,
     mask_type="and",
     initial_event=False,
     ch_name=None,
 ):
-    """Help find events."""
-    assert data.shape[0] == 1  # data should be only a row vector
-
+    """Help find events from the steps of a single stim channel."""
     if min_samples > 0:
         merge = int(min_samples // 1)
         if merge == min_samples:
@@ -499,20 +551,7 @@ def _find_events(
     else:
         merge = 0
 
-    data = data.astype(np.int64)
-    if uint_cast:
-        data = data.astype(np.uint16).astype(np.int64)
-    if data.min() < 0:
-        warn(
-            "Trigger channel contains negative values, using absolute "
-            "value. If data were acquired on a Neuromag system with "
-            "STI016 active, consider using uint_cast=True to work around "
-            "an acquisition bug"
-        )
-        data = np.abs(data)  # make sure trig channel is positive
-
-    events = _find_stim_steps(data, first_samp, pad_stop=0, merge=merge)
-    initial_value = data[0, 0]
+    events = _find_stim_steps(steps, stop_samp, pad_stop=0, merge=merge)
     if initial_value != 0:
         if initial_event:
             events = np.insert(events, 0, [first_samp, 0, initial_value], axis=0)
@@ -767,19 +806,33 @@ def find_events(
     picks = pick_channels(raw.info["ch_names"], include=stim_channel)
     if len(picks) == 0:
         raise ValueError("No stim channel found to extract event triggers.")
-    data, _ = raw[picks, :]
+    # the stim channels are read in chunks and only their steps are kept
+    negative = np.zeros(len(picks), bool)
+    steps, initial = _read_stim_steps(
+        raw, picks, lambda data: _convert_stim_data(data, uint_cast, negative)
+    )
 
     events_list = []
-    for d, ch_name in zip(data, stim_channel):
+    for ch_steps, initial_value, ch_negative, ch_name in zip(
+        steps, initial, negative, stim_channel
+    ):
+        if ch_negative:
+            warn(
+                "Trigger channel contains negative values, using absolute "
+                "value. If data were acquired on a Neuromag system with "
+                "STI016 active, consider using uint_cast=True to work around "
+                "an acquisition bug"
+            )
         events = _find_events(
-            d[np.newaxis, :],
+            ch_steps,
+            initial_value,
             raw.first_samp,
+            raw.last_samp + 1,
             verbose=verbose,
             output=output,
             consecutive=consecutive,
             min_samples=min_samples,
             mask=mask,
-            uint_cast=uint_cast,
             mask_type=mask_type,
             initial_event=initial_event,
             ch_name=ch_name,
@@ -28,6 +28,7 @@ from .utils import (
     _check_option,
     _check_preload,
     _ensure_int,
+    _ensure_writeable,
     _pl,
     _validate_type,
     logger,
@@ -358,7 +359,8 @@ def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     # pad to reduce ringing
     x_ext = _smart_pad(x, (n_edge, n_edge), pad)
     n_x = len(x_ext)
-    x_filtered = np.zeros_like(x_ext)
+    # accumulate in double precision even for single precision data
+    x_filtered = np.zeros(x_ext.shape, np.result_type(x_ext, np.float64))
 
     n_seg = n_fft - n_h + 1
     n_segments = int(np.ceil(n_x / float(n_seg)))
@@ -1789,7 +1791,7 @@ def _check_filterable(x, kind="filtered", alternative="filter"):
             )
     _validate_type(x, (np.ndarray, list, tuple), f"Data to be {kind}")
     x = np.asanyarray(x)
-    if x.dtype != np.float64:
+    if x.dtype not in (np.float64, np.float32):
         raise ValueError(f"Data to be {kind} must be real floating, got {x.dtype}")
     return x
 
@@ -1888,6 +1890,7 @@ def resample(
         )
         y = _resample_polyphase(x, up=up, down=down, **kwargs)
     assert y.shape[-1] == final_len
+    y = y.astype(x.dtype, copy=False)  # computations are done in double precision
 
     # restore dimensions (reshape then swap axis with last)
     y = y.reshape(out_shape).swapaxes(axis, -1)
@@ -2370,6 +2373,37 @@ def _check_resamp_noop(sfreq, o_sfreq, rtol=1e-6):
     return False
 
 
+def _filter_chunks(data, chunk_size, picks=None):
+    """Get blocks of epochs or channels to process at once.
+
+    Returns (slice, picks) tuples, with the picks relative to the block. Blocks
+    of channels only cover the picked channels.
+    """
+    from .epochs import _memmap_chunks
+
+    if chunk_size is None:
+        if data.ndim != 3:
+            return [(slice(None), picks)]
+        # memory-mapped epochs are processed in blocks of epochs
+        return [(chunk, picks) for chunk in _memmap_chunks(data)]
+    chunk_size = _ensure_int(chunk_size, "chunk_size")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+    if data.ndim == 3:  # blocks of epochs
+        chunks = [
+            (slice(start, start + chunk_size), picks)
+            for start in range(0, len(data), chunk_size)
+        ]
+    else:  # blocks of channels
+        picks = _picks_to_idx(len(data), picks)
+        chunks = list()
+        for start in range(0, len(picks), chunk_size):
+            use_picks = picks[start : start + chunk_size]
+            first = use_picks.min()
+            chunks.append((slice(first, use_picks.max() + 1), use_picks - first))
+    return chunks if chunks else [(slice(None), picks)]
+
+
 class FilterMixin:
     """Object for Epoch/Evoked filtering."""
 
@@ -2423,6 +2457,7 @@ class FilterMixin:
         from .source_estimate import _BaseSourceEstimate
 
         _check_preload(self, "inst.savgol_filter")
+        _ensure_writeable(self)
         if not isinstance(self, _BaseSourceEstimate):
             s_freq = self.info["sfreq"]
         else:
@@ -2457,6 +2492,7 @@ class FilterMixin:
         skip_by_annotation=("edge", "bad_acq_skip"),
         pad="edge",
         *,
+        chunk_size=None,
         verbose=None,
     ):
         """Filter a subset of channels/vertices.
@@ -2479,6 +2515,7 @@ class FilterMixin:
 
             .. versionadded:: 0.16.
         %(pad_fir)s
+        %(chunk_size_filter)s
         %(verbose)s
 
         Returns
@@ -2518,7 +2555,8 @@ class FilterMixin:
 
         .. note:: If n_jobs > 1, more memory is required as
                   ``len(picks) * n_times`` additional time points need to
-                  be temporarily stored in memory.
+                  be temporarily stored in memory. Use ``chunk_size`` to
+                  bound this.
 
         When working on SourceEstimates the sample rate of the original
         data is inferred from tstep.
@@ -2534,6 +2572,7 @@ class FilterMixin:
         from .source_estimate import _BaseSourceEstimate
 
         _check_preload(self, "inst.filter")
+        _ensure_writeable(self)
         if not isinstance(self, _BaseSourceEstimate):
             update_info, picks = _filt_check_picks(self.info, picks, l_freq, h_freq)
             s_freq = self.info["sfreq"]
@@ -2554,29 +2593,32 @@ class FilterMixin:
         else:
             onsets, ends = np.array([0]), np.array([self._data.shape[1]])
         max_idx = (ends - onsets).argmax()
+        # filter blocks of epochs or channels (views of the data) in place
+        chunks = _filter_chunks(self._data, chunk_size, picks)
         for si, (start, stop) in enumerate(zip(onsets, ends)):
-            # Only output filter params once (for info level), and only warn
-            # once about the length criterion (longest segment is too short)
-            use_verbose = verbose if si == max_idx else "error"
-            filter_data(
-                self._data[:, start:stop],
-                s_freq,
-                l_freq,
-                h_freq,
-                picks,
-                filter_length,
-                l_trans_bandwidth,
-                h_trans_bandwidth,
-                n_jobs,
-                method,
-                iir_params,
-                copy=False,
-                phase=phase,
-                fir_window=fir_window,
-                fir_design=fir_design,
-                pad=pad,
-                verbose=use_verbose,
-            )
+            for ci, (chunk, chunk_picks) in enumerate(chunks):
+                # Only output filter params once (for info level), and only warn
+                # once about the length criterion (longest segment is too short)
+                use_verbose = verbose if si == max_idx and ci == 0 else "error"
+                filter_data(
+                    self._data[chunk][:, start:stop],
+                    s_freq,
+                    l_freq,
+                    h_freq,
+                    chunk_picks,
+                    filter_length,
+                    l_trans_bandwidth,
+                    h_trans_bandwidth,
+                    n_jobs,
+                    method,
+                    iir_params,
+                    copy=False,
+                    phase=phase,
+                    fir_window=fir_window,
+                    fir_design=fir_design,
+                    pad=pad,
+                    verbose=use_verbose,
+                )
         # update info if filter is applied to all data channels/vertices,
         # and it's not a band-stop filter
         if not isinstance(self, _BaseSourceEstimate):
@@ -2593,6 +2635,7 @@ class FilterMixin:
         n_jobs=None,
         pad="edge",
         method="fft",
+        chunk_size=None,
         verbose=None,
     ):
         """Resample data.
@@ -2615,6 +2658,7 @@ class FilterMixin:
         %(method_resample)s
 
             .. versionadded:: 1.7
+        %(chunk_size_filter)s
         %(verbose)s
 
         Returns
@@ -2631,7 +2675,7 @@ class FilterMixin:
         For some data, it may be more accurate to use npad=0 to reduce
         artifacts. This is dataset dependent -- check your data!
         """
-        from .epochs import BaseEpochs
+        from .epochs import BaseEpochs, _is_memmap, _rewrite_memmap
         from .evoked import Evoked
 
         # Should be guaranteed by our inheritance, and the fact that
@@ -2644,16 +2688,33 @@ class FilterMixin:
             return self
 
         _check_preload(self, "inst.resample")
-        self._data = resample(
-            self._data,
-            sfreq,
-            o_sfreq,
+        resample_data = partial(
+            resample,
+            up=sfreq,
+            down=o_sfreq,
             npad=npad,
             window=window,
             n_jobs=n_jobs,
             pad=pad,
             method=method,
         )
+        _, final_len = _resamp_ratio_len(sfreq, o_sfreq, self._data.shape[-1])
+        if _is_memmap(self._data):
+            # resample blocks of epochs within the file
+            self._data = _rewrite_memmap(
+                self._data, self._data.shape[:-1] + (final_len,), resample_data
+            )
+        elif chunk_size is None:
+            self._data = resample_data(self._data)
+        else:
+            # resample blocks of epochs or channels into the output array
+            data = np.empty(self._data.shape[:-1] + (final_len,), self._data.dtype)
+            chunks = _filter_chunks(self._data, chunk_size)
+            for ci, (chunk, _) in enumerate(chunks):
+                data[chunk] = resample_data(
+                    self._data[chunk], verbose=None if ci == 0 else "error"
+                )
+            self._data = data
         lowpass = self.info.get("lowpass")
         lowpass = np.inf if lowpass is None else lowpass
         with self.info._unlock():
@@ -2742,6 +2803,7 @@ class FilterMixin:
         else:
             use_info = len(self._data)
         _check_preload(self, "inst.apply_hilbert")
+        _ensure_writeable(self)
         picks = _picks_to_idx(use_info, picks, exclude=(), with_ref_meg=False)
 
         if n_fft is None:
@@ -35,6 +35,7 @@ __all__ = [
     "read_raw_fif",
     "read_raw_fil",
     "read_raw_gdf",
+    "read_raw_h5",
     "read_raw_hitachi",
     "read_raw_kit",
     "read_raw_nedf",
@@ -79,6 +80,7 @@ from .eyelink import read_raw_eyelink
 from .fieldtrip import read_epochs_fieldtrip, read_evoked_fieldtrip, read_raw_fieldtrip
 from .fiff import Raw, read_raw_fif
 from .fil import read_raw_fil
+from .h5 import read_raw_h5
 from .hitachi import read_raw_hitachi
 from .kit import read_epochs_kit, read_raw_kit
 from .nedf import read_raw_nedf
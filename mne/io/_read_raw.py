@@ -41,6 +41,7 @@ def _get_supported():
         read_raw_fif,
         read_raw_fil,
         read_raw_gdf,
+        read_raw_h5,
         read_raw_kit,
         read_raw_nedf,
         read_raw_nicolet,
@@ -90,6 +91,9 @@ def _get_supported():
         ".asc": dict(EyeLink=read_raw_eyelink),
         ".ns3": dict(NSx=read_raw_nsx),
         ".lay": dict(Persyst=read_raw_persyst),
+        # HDF5 written by Raw.save
+        ".h5": dict(HDF5=read_raw_h5),
+        ".hdf5": dict(HDF5=read_raw_h5),
     }
 
 
@@ -143,6 +147,7 @@ def read_raw(fname, *, preload=False, verbose=None, **kwargs) -> BaseRaw:
     * `~mne.io.read_raw_fif`
     * `~mne.io.read_raw_fil`
     * `~mne.io.read_raw_gdf`
+    * `~mne.io.read_raw_h5`
     * `~mne.io.read_raw_kit`
     * `~mne.io.read_raw_nedf`
     * `~mne.io.read_raw_nicolet`
@@ -4,12 +4,14 @@
 
 import os
 import shutil
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import nullcontext
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import timedelta
 from inspect import getfullargspec
+from io import BytesIO
 from pathlib import Path
 
 import numpy as np
@@ -68,7 +70,7 @@ from ..filter import (
     resample,
 )
 from ..html_templates import _get_html_template
-from ..parallel import parallel_func
+from ..parallel import _check_n_jobs, parallel_func
 from ..time_frequency.spectrum import Spectrum, SpectrumMixin, _validate_method
 from ..time_frequency.tfr import RawTFR
 from ..utils import (
@@ -83,6 +85,7 @@ from ..utils import (
     _check_preload,
     _check_time_format,
     _convert_times,
+    _ensure_int,
     _file_like,
     _get_argvalues,
     _get_stim_channel,
@@ -202,10 +205,11 @@ class BaseRaw(
     ):
         # wait until the end to preload data, but triage here
         if isinstance(preload, np.ndarray):
-            # some functions (e.g., filtering) only work w/64-bit data
-            if preload.dtype not in (np.float64, np.complex128):
+            # some functions (e.g., filtering) only work w/floating point data
+            if preload.dtype not in _DATA_DTYPES:
                 raise RuntimeError(
-                    f"datatype must be float64 or complex128, not {preload.dtype}"
+                    "datatype must be float64, float32, complex128 or complex64, "
+                    f"not {preload.dtype}"
                 )
             if preload.dtype != dtype:
                 raise ValueError("preload and dtype must match")
@@ -226,6 +230,7 @@ class BaseRaw(
                 load_from_disk = True
         self._last_samps = np.array(last_samps)
         self._first_samps = np.array(first_samps)
+        self._cumul_lens_cache = None
         orig_ch_names = info["ch_names"]
         with info._unlock(check_after=True):
             # be permissive of old code
@@ -364,7 +369,14 @@ class BaseRaw(
 
     @verbose
     def _read_segment(
-        self, start=0, stop=None, sel=None, data_buffer=None, *, verbose=None
+        self,
+        start=0,
+        stop=None,
+        sel=None,
+        data_buffer=None,
+        *,
+        n_jobs=None,
+        verbose=None,
     ):
         """Read a chunk of raw data.
 
@@ -384,6 +396,10 @@ class BaseRaw(
             to store the data.
         projector : array
             SSP operator to apply to the data.
+        n_jobs : int | None
+            Number of threads to use to read the data. The read is split
+            across files and contiguous blocks of time, each of which is
+            read directly into its part of the output.
         %(verbose)s
 
         Returns
@@ -419,11 +435,13 @@ class BaseRaw(
         else:
             data = _allocate_data(data_buffer, data_shape, dtype)
 
-        # deal with having multiple files accessed by the raw object
-        cumul_lens = np.concatenate(([0], np.array(self._raw_lengths, dtype="int")))
-        cumul_lens = np.cumsum(cumul_lens)
-        files_used = np.logical_and(
-            np.less(start, cumul_lens[1:]), np.greater_equal(stop - 1, cumul_lens[:-1])
+        # deal with having multiple files accessed by the raw object: look up the
+        # range of files spanned by [start, stop) in the cumulative lengths, so
+        # that only the files that are actually read are touched in Python
+        cumul_lens = self._cumul_lens()
+        files_used = range(
+            np.searchsorted(cumul_lens, start, side="right") - 1,
+            np.searchsorted(cumul_lens, stop - 1, side="right"),
         )
 
         # set up cals and mult (cals, compensation, and projector)
@@ -455,9 +473,10 @@ class BaseRaw(
             )
         assert (mult is None) ^ (cals is None)  # xor
 
-        # read from necessary files
+        # figure out what to read from the necessary files
+        reads = list()
         offset = 0
-        for fi in np.nonzero(files_used)[0]:
+        for fi in files_used:
             start_file = self._first_samps[fi]
             # first iteration (only) could start in the middle somewhere
             if offset == 0:
@@ -471,21 +490,48 @@ class BaseRaw(
             if start_file < self._first_samps[fi] or stop_file < start_file:
                 raise ValueError("Bad array indexing, could be a bug")
             n_read = stop_file - start_file
-            this_sl = slice(offset, offset + n_read)
             # reindex back to original file
             orig_idx = _convert_slice(self._read_picks[fi][need_idx])
-            _ReadSegmentFileProtector(self)._read_segment_file(
-                data[:, this_sl],
+            reads.append([fi, int(start_file), int(stop_file), offset, orig_idx])
+            offset += n_read
+        n_jobs = 1 if n_jobs is None else _check_n_jobs(n_jobs)
+        if n_jobs > 1:
+            min_len = max(int(round(self.buffer_size_sec * self.info["sfreq"])), 1)
+            splittable = [self._can_split_reads(read[0]) for read in reads]
+            reads = _split_reads(reads, n_jobs, min_len, splittable)
+            n_jobs = min(n_jobs, len(reads))
+        reader = _ReadSegmentFileProtector(self)
+
+        def _read_one(fi, start_file, stop_file, offset, orig_idx):
+            reader._read_segment_file(
+                data[:, offset : offset + stop_file - start_file],
                 orig_idx,
                 fi,
-                int(start_file),
-                int(stop_file),
+                start_file,
+                stop_file,
                 cals,
                 mult,
             )
-            offset += n_read
+
+        if n_jobs == 1:
+            for read in reads:
+                _read_one(*read)
+        else:
+            logger.debug(f"Reading {len(reads)} blocks using {n_jobs} threads")
+            with ThreadPoolExecutor(n_jobs) as executor:
+                # consume the results so that exceptions get raised
+                list(executor.map(lambda read: _read_one(*read), reads))
         return data
 
+    def _can_split_reads(self, fi):
+        """Check if reads from a file can be split into blocks of time.
+
+        Readers whose output for a segment depends on the whole segment (e.g.,
+        because channels with lower sampling rates are resampled on each read)
+        should return False, so that such files are read in one block.
+        """
+        return True
+
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file.
 
@@ -552,25 +598,49 @@ class BaseRaw(
         """
         if start < 0:
             return None
-        if reject_by_annotation and len(self.annotations) > 0:
-            annot = self.annotations
-            sfreq = self.info["sfreq"]
-            onset = _sync_onset(self, annot.onset)
-            overlaps = np.where(onset < reject_stop / sfreq)
-            overlaps = np.where(
-                onset[overlaps] + annot.duration[overlaps] > reject_start / sfreq
-            )
-            for descr in annot.description[overlaps]:
-                if descr.lower().startswith("bad"):
-                    return descr
+        if reject_by_annotation:
+            descr = self._bad_segment_description(reject_start, reject_stop)
+            if descr is not None:
+                return descr
         return self._getitem((picks, slice(start, stop)), return_times=False)
 
+    def _bad_segment_description(self, reject_start, reject_stop):
+        """Get the description of a bad annotation overlapping a segment.
+
+        Returns None if no annotation starting with "bad" overlaps the samples
+        from ``reject_start`` to ``reject_stop``.
+        """
+        if len(self.annotations) == 0:
+            return None
+        annot = self.annotations
+        sfreq = self.info["sfreq"]
+        # narrow down to the annotations around the segment (with one
+        # sample of slack), then check those in the raw time base
+        candidates = annot.overlapping(
+            _sync_onset(self, (reject_start - 1) / sfreq, inverse=True),
+            _sync_onset(self, (reject_stop + 1) / sfreq, inverse=True),
+        )
+        onset = _sync_onset(self, annot.onset[candidates])
+        overlaps = (onset < reject_stop / sfreq) & (
+            onset + annot.duration[candidates] > reject_start / sfreq
+        )
+        for descr in annot.description[candidates[overlaps]]:
+            if descr.lower().startswith("bad"):
+                return descr
+        return None
+
     @verbose
-    def load_data(self, verbose=None):
+    def load_data(self, *, dtype=None, n_jobs=None, verbose=None):
         """Load raw data.
 
         Parameters
         ----------
+        %(dtype_data)s
+
+            .. versionadded:: 1.10
+        %(n_jobs_read)s
+
+            .. versionadded:: 1.10
         %(verbose)s
 
         Returns
@@ -581,15 +651,26 @@ class BaseRaw(
         Notes
         -----
         This function will load raw data if it was not already preloaded.
-        If data were already preloaded, it will do nothing.
+        If data were already preloaded, it will do nothing (besides
+        converting them to ``dtype``, if given).
 
         .. versionadded:: 0.10.0
         """
+        if dtype is not None:
+            dtype = _get_data_dtype(dtype, self._data if self.preload else self)
+            if self.preload:
+                if isinstance(self._data, np.memmap) and self._data.dtype != dtype:
+                    raise ValueError(
+                        "Cannot convert memory-mapped data to a different dtype, "
+                        f"got {dtype} for data of type {self._data.dtype}"
+                    )
+                self._data = self._data.astype(dtype, copy=False)
+            self._dtype_ = dtype
         if not self.preload:
-            self._preload_data(True)
+            self._preload_data(True, n_jobs=n_jobs)
         return self
 
-    def _preload_data(self, preload):
+    def _preload_data(self, preload, *, n_jobs=None):
         """Actually preload the data."""
         data_buffer = preload
         if isinstance(preload, bool | np.bool_) and not preload:
@@ -598,7 +679,7 @@ class BaseRaw(
         logger.info(
             f"Reading 0 ... {len(t) - 1}  =  {0.0:9.3f} ... {t[-1]:9.3f} secs..."
         )
-        self._data = self._read_segment(data_buffer=data_buffer)
+        self._data = self._read_segment(data_buffer=data_buffer, n_jobs=n_jobs)
         assert len(self._data) == self.info["nchan"]
         self.preload = True
         self._comp = None  # no longer needed
@@ -624,7 +705,7 @@ class BaseRaw(
     @property
     def last_samp(self):
         """The last data sample."""
-        return self.first_samp + sum(self._raw_lengths) - 1
+        return self.first_samp + self._cumul_lens(total=True) - 1
 
     @property
     def _last_time(self):
@@ -668,6 +749,33 @@ class BaseRaw(
 
         return super().time_as_index(times, use_rounding)
 
+    def _cumul_lens(self, total=False):
+        """Get the number of samples preceding each file (and the total).
+
+        With ``total=True``, only get the total number of samples instead.
+        """
+        # cached as every read and last_samp need it, until _first_samps or
+        # _last_samps get replaced (crop drops it after modifying them)
+        cache = self._cumul_lens_cache
+        if (
+            cache is None
+            or cache[0] is not self._first_samps
+            or cache[1] is not self._last_samps
+        ):
+            first_samps = np.asarray(self._first_samps, dtype=np.int64)
+            last_samps = np.asarray(self._last_samps, dtype=np.int64)
+            cumul_lens = np.zeros(len(first_samps) + 1, np.int64)
+            np.cumsum(last_samps - first_samps + 1, out=cumul_lens[1:])
+            cumul_lens.flags.writeable = False
+            cache = (
+                self._first_samps,
+                self._last_samps,
+                cumul_lens,
+                sum(self._raw_lengths),  # keeps the dtype of the samples
+            )
+            self._cumul_lens_cache = cache
+        return cache[3] if total else cache[2]
+
     @property
     def _raw_lengths(self):
         return [
@@ -866,12 +974,14 @@ class BaseRaw(
         """  # noqa: E501
         return self._getitem(item)
 
-    def _getitem(self, item, return_times=True):
+    def _getitem(self, item, return_times=True, *, n_jobs=None):
         sel, start, stop = self._parse_get_set_params(item)
         if self.preload:
             data = self._data[sel, start:stop]
+        elif getattr(self, "_prefetcher", None) is not None:
+            data = self._prefetcher._read(start, stop, sel, n_jobs=n_jobs)
         else:
-            data = self._read_segment(start=start, stop=stop, sel=sel)
+            data = self._read_segment(start=start, stop=stop, sel=sel, n_jobs=n_jobs)
 
         if return_times:
             # Rather than compute the entire thing just compute the subset
@@ -902,6 +1012,7 @@ class BaseRaw(
         *,
         tmin=None,
         tmax=None,
+        n_jobs=None,
         verbose=None,
     ):
         """Get data in the given range.
@@ -931,6 +1042,9 @@ class BaseRaw(
             ignored if the ``stop`` parameter is defined.
 
             .. versionadded:: 0.24.0
+        %(n_jobs_read)s
+
+            .. versionadded:: 1.10
         %(verbose)s
 
         Returns
@@ -975,7 +1089,7 @@ class BaseRaw(
 
         if len(self.annotations) == 0 or reject_by_annotation is None:
             getitem = self._getitem(
-                (picks, slice(start, stop)), return_times=return_times
+                (picks, slice(start, stop)), return_times=return_times, n_jobs=n_jobs
             )
             if return_times:
                 data, times = getitem
@@ -993,7 +1107,7 @@ class BaseRaw(
         onsets = np.maximum(onsets[keep], start)
         ends = np.minimum(ends[keep], stop)
         if len(onsets) == 0:
-            data, times = self[picks, start:stop]
+            data, times = self._getitem((picks, slice(start, stop)), n_jobs=n_jobs)
             if units is not None:
                 data *= ch_factors[:, np.newaxis]
             if return_times:
@@ -1031,7 +1145,9 @@ class BaseRaw(
                     if start == stop:
                         continue
                     end = idx + stop - start
-                    data[:, idx:end], times[idx:end] = self[picks, start:stop]
+                    data[:, idx:end], times[idx:end] = self._getitem(
+                        (picks, slice(start, stop)), n_jobs=n_jobs
+                    )
                     idx = end
             else:
                 msg = (
@@ -1047,10 +1163,10 @@ class BaseRaw(
                         n_kept / n_samples,
                     )
                 )
-                data, times = self[picks, start:stop]
+                data, times = self._getitem((picks, slice(start, stop)), n_jobs=n_jobs)
                 data[:, ~used[1:-1]] = np.nan
         else:
-            data, times = self[picks, start:stop]
+            data, times = self._getitem((picks, slice(start, stop)), n_jobs=n_jobs)
 
         if units is not None:
             data *= ch_factors[:, np.newaxis]
@@ -1058,6 +1174,150 @@ class BaseRaw(
             return data, times
         return data
 
+    def prefetch(self, n_segments=2, duration=10.0, *, n_jobs=None):
+        """Read ahead data in a background thread during sequential access.
+
+        Returns a context manager. While it is active, reads from data that are
+        not preloaded (e.g., from :meth:`get_data`, indexing, or non-preloaded
+        :class:`~mne.Epochs` created from this instance) are served from
+        fixed-duration segments, and the ``n_segments`` segments following
+        the most recently requested one are read by a background thread while
+        the current data are being processed.
+
+        Parameters
+        ----------
+        n_segments : int
+            The number of segments to read ahead.
+        duration : float
+            The duration of each segment in seconds.
+        n_jobs : int | None
+            The number of background threads, i.e., the number of segments
+            that are read ahead concurrently. If ``-1``, it is set to the
+            number of CPU cores. ``None`` (default) means ``n_jobs=1``.
+
+        Returns
+        -------
+        prefetcher : context manager
+            The context manager. Its ``hits`` and ``misses`` attributes count
+            the reads that were (or were not) served from data scheduled for
+            reading in advance.
+
+        Notes
+        -----
+        Peak memory use grows with ``n_segments * duration``. Prefetching has
+        no effect when the data are preloaded.
+
+        .. versionadded:: 1.10
+
+        Examples
+        --------
+        Hide the I/O latency when dropping bad epochs of non-preloaded data::
+
+            >>> with raw.prefetch(n_segments=4) as prefetcher:  # doctest: +SKIP
+            ...     epochs.drop_bad()
+            >>> prefetcher.hits, prefetcher.misses  # doctest: +SKIP
+            (287, 1)
+        """
+        n_segments = _ensure_int(n_segments, "n_segments")
+        if n_segments < 1:
+            raise ValueError(f"n_segments must be at least 1, got {n_segments}")
+        _validate_type(duration, "numeric", "duration")
+        n_block = int(round(duration * self.info["sfreq"]))
+        if n_block < 1:
+            raise ValueError(
+                f"duration must correspond to at least one sample, got {duration}"
+            )
+        n_jobs = 1 if n_jobs is None else _check_n_jobs(n_jobs)
+        return _RawPrefetcher(self, n_segments, n_block, n_jobs)
+
+    @verbose
+    def iter_chunks(
+        self,
+        duration,
+        *,
+        overlap=0.0,
+        picks=None,
+        reject_by_annotation=None,
+        verbose=None,
+    ):
+        """Iterate over the data in chunks of fixed duration.
+
+        Data that are not preloaded are read lazily one chunk at a time, with
+        compensation and active projectors applied on the fly, so only a single
+        chunk needs to be held in memory.
+
+        Parameters
+        ----------
+        duration : float
+            The duration of each chunk in seconds. The last chunk (of each
+            segment, see ``reject_by_annotation``) can be shorter.
+        overlap : float
+            The overlap between consecutive chunks in seconds. Must be smaller
+            than ``duration``. Defaults to 0.
+        %(picks_all)s
+        reject_by_annotation : None | 'omit' | 'NaN'
+            Whether to reject by annotation. If None (default), no rejection is
+            done. If 'omit', chunks are only taken from the segments in between
+            annotations whose description starts with 'bad', and never span
+            such annotations. If 'NaN', the bad samples are filled with NaNs.
+        %(verbose)s
+
+        Returns
+        -------
+        chunks : generator
+            A generator that yields tuples ``(start, stop, data)``, where
+            ``start`` and ``stop`` are the sample indices (as in
+            :meth:`get_data`) of the chunk and ``data`` is an array of shape
+            ``(n_channels, stop - start)``.
+
+        See Also
+        --------
+        get_data
+
+        Notes
+        -----
+        .. versionadded:: 1.10
+        """
+        _validate_type(duration, "numeric", "duration")
+        _validate_type(overlap, "numeric", "overlap")
+        sfreq = self.info["sfreq"]
+        n_chunk = int(round(duration * sfreq))
+        n_overlap = int(round(overlap * sfreq))
+        if n_chunk < 1:
+            raise ValueError(
+                f"duration must correspond to at least one sample, got {duration}"
+            )
+        if not 0 <= n_overlap < n_chunk:
+            raise ValueError(
+                f"overlap must be non-negative and smaller than duration ({duration}), "
+                f"got {overlap}"
+            )
+        picks = _picks_to_idx(self.info, picks, "all", exclude=())
+        _validate_type(reject_by_annotation, (str, None), "reject_by_annotation")
+        segments = [(0, self.n_times)]
+        if reject_by_annotation is not None:
+            reject_by_annotation = reject_by_annotation.lower()
+            _check_option("reject_by_annotation", reject_by_annotation, ["omit", "nan"])
+            if reject_by_annotation == "omit":
+                segments = _good_segments(self)
+                reject_by_annotation = None  # segments are good by construction
+        return self._iter_chunks(
+            segments, n_chunk, n_chunk - n_overlap, picks, reject_by_annotation
+        )
+
+    def _iter_chunks(self, segments, n_chunk, n_step, picks, reject_by_annotation):
+        for seg_start, seg_stop in segments:
+            start = seg_start
+            while True:
+                stop = min(start + n_chunk, seg_stop)
+                data = self.get_data(
+                    picks, start, stop, reject_by_annotation=reject_by_annotation
+                )
+                yield start, stop, data
+                if stop >= seg_stop:
+                    break
+                start += n_step
+
     @verbose
     def apply_function(
         self,
@@ -1168,6 +1428,8 @@ class BaseRaw(
         fir_design="firwin",
         skip_by_annotation=("edge", "bad_acq_skip"),
         pad="reflect_limited",
+        *,
+        chunk_size=None,
         verbose=None,
     ):
         return super().filter(
@@ -1185,6 +1447,7 @@ class BaseRaw(
             fir_design=fir_design,
             skip_by_annotation=skip_by_annotation,
             pad=pad,
+            chunk_size=chunk_size,
             verbose=verbose,
         )
 
@@ -1612,8 +1875,7 @@ class BaseRaw(
                 include_tmax=include_tmax,
             )
         )[0][[0, -1]]
-        cumul_lens = np.concatenate(([0], np.array(self._raw_lengths, dtype="int")))
-        cumul_lens = np.cumsum(cumul_lens)
+        cumul_lens = self._cumul_lens()
         keepers = np.logical_and(
             np.less(smin, cumul_lens[1:]), np.greater_equal(smax, cumul_lens[:-1])
         )
@@ -1626,6 +1888,7 @@ class BaseRaw(
         self._first_samps[0] += smin - cumul_lens[keepers[0]]
         self._last_samps = np.atleast_1d(self._last_samps[keepers])
         self._last_samps[-1] -= cumul_lens[keepers[-1] + 1] - 1 - smax
+        self._cumul_lens_cache = None  # modified in place
         self._read_picks = [self._read_picks[ri] for ri in keepers]
         assert all(len(r) == len(self._read_picks[0]) for r in self._read_picks)
         self._raw_extras = [self._raw_extras[ri] for ri in keepers]
@@ -1693,6 +1956,7 @@ class BaseRaw(
         overwrite=False,
         split_size="2GB",
         split_naming="neuromag",
+        compression="auto",
         verbose=None,
     ):
         """Save raw data to file.
@@ -1708,6 +1972,8 @@ class BaseRaw(
             ``_meg.fif`` (common MEG data), ``_eeg.fif`` (common EEG data),
             or ``_ieeg.fif`` (common intracranial EEG data). You may also
             append an additional ``.gz`` suffix to enable gzip compression.
+            Filenames ending with ``.h5`` or ``.hdf5`` instead of ``.fif``
+            are saved in HDF5 format (see Notes).
         %(picks_all)s
         %(tmin_raw)s
         %(tmax_raw)s
@@ -1746,6 +2012,13 @@ class BaseRaw(
         %(split_naming)s
 
             .. versionadded:: 0.17
+        compression : 'auto' | 'gzip' | 'lzf' | None
+            Lossless compression to use when saving in HDF5 format. ``'gzip'``
+            gives smaller files, ``'lzf'`` is faster. ``'auto'`` (default) uses
+            ``'gzip'``. Only ``'auto'`` is supported for FIF files, which are
+            compressed by appending ``.gz`` to the file name instead.
+
+            .. versionadded:: 1.10
         %(verbose)s
 
         Returns
@@ -1765,6 +2038,13 @@ class BaseRaw(
 
         Samples annotated ``BAD_ACQ_SKIP`` are not stored in order to optimize
         memory. Whatever values, they will be loaded as 0s when reading file.
+
+        In HDF5 format (which requires h5io and h5py), the data are stored in
+        compressed blocks of channels and time, so that :func:`mne.io.read_raw_h5`
+        only reads the blocks needed for a given selection of channels and
+        time. Only ``fmt='single'`` and ``fmt='double'`` are supported, the
+        data are never split across files, and ``drop_small_buffer`` is
+        ignored.
         """
         endings = (
             "raw.fif",
@@ -1774,8 +2054,6 @@ class BaseRaw(
             "_eeg.fif",
             "_ieeg.fif",
         )
-        endings += tuple([f"{e}.gz" for e in endings])
-        endings_err = (".fif", ".fif.gz")
 
         # convert to str, check for overwrite a few lines later
         fname = _check_fname(
@@ -1785,6 +2063,20 @@ class BaseRaw(
             check_bids_split=True,
             name="fname",
         )
+        h5 = fname.suffix in (".h5", ".hdf5")
+        if h5:
+            endings = tuple(
+                f"{e[:-4]}{ext}" for e in endings for ext in (".h5", ".hdf5")
+            )
+            endings_err = (".h5", ".hdf5")
+        else:
+            endings += tuple([f"{e}.gz" for e in endings])
+            endings_err = (".fif", ".fif.gz")
+            if compression != "auto":
+                raise ValueError(
+                    "compression is only supported when saving in HDF5 format, "
+                    f"got {compression!r} for a FIF file"
+                )
         check_fname(fname, "raw", endings, endings_err=endings_err)
 
         split_size = _get_split_size(split_size)
@@ -1826,13 +2118,34 @@ class BaseRaw(
         start, stop = self._tmin_tmax_to_start_stop(tmin, tmax)
         buffer_size = self._get_buffer_size(buffer_size_sec)
 
+        if h5:
+            from .h5.h5 import _write_raw_h5
+
+            picks = _picks_to_idx(info, picks, "all", ())
+            return [
+                _write_raw_h5(
+                    self,
+                    fname,
+                    info,
+                    picks,
+                    projector,
+                    start,
+                    stop,
+                    buffer_size,
+                    fmt,
+                    "gzip" if compression == "auto" else compression,
+                )
+            ]
+
         # write the raw file
         _validate_type(split_naming, str, "split_naming")
         _check_option("split_naming", split_naming, ("neuromag", "bids"))
 
         cfg = _RawFidWriterCfg(buffer_size, split_size, drop_small_buffer, fmt)
-        raw_fid_writer = _RawFidWriter(self, info, picks, projector, start, stop, cfg)
-        filenames = _write_raw(raw_fid_writer, fname, split_naming, overwrite)
+        with _RawFidWriter(
+            self, info, picks, projector, start, stop, cfg
+        ) as raw_fid_writer:
+            filenames = _write_raw(raw_fid_writer, fname, split_naming, overwrite)
         return filenames
 
     @verbose
@@ -2126,22 +2439,28 @@ class BaseRaw(
             self._data = _data
             self.preload = True
 
-        # now combine information from each raw file to construct new self
-        annotations = self.annotations
-        assert annotations.orig_time == self.info["meas_date"]
+        # now combine information from each raw file to construct new self, all
+        # at once so that appending many files does not scale quadratically
+        assert self.annotations.orig_time == self.info["meas_date"]
         edge_samps = list()
-        for ri, r in enumerate(raws):
-            edge_samps.append(self.last_samp - self.first_samp + 1)
-            annotations = _combine_annotations(
-                annotations,
-                r.annotations,
-                edge_samps[-1],
-                self.first_samp,
-                r.first_samp,
-                self.info["sfreq"],
-            )
-            self._first_samps = np.r_[self._first_samps, r._first_samps]
-            self._last_samps = np.r_[self._last_samps, r._last_samps]
+        n_samples = self.last_samp - self.first_samp + 1
+        for r in raws:
+            edge_samps.append(n_samples)
+            n_samples += r.n_times
+        annotations = _combine_annotations(
+            [self.annotations] + [r.annotations for r in raws],
+            edge_samps,
+            self.first_samp,
+            [r.first_samp for r in raws],
+            self.info["sfreq"],
+        )
+        self._first_samps = np.concatenate(
+            [self._first_samps] + [r._first_samps for r in raws]
+        )
+        self._last_samps = np.concatenate(
+            [self._last_samps] + [r._last_samps for r in raws]
+        )
+        for r in raws:
             self._read_picks += r._read_picks
             self._raw_extras += r._raw_extras
             self._filenames += r._filenames  # use the private attribute to use the list
@@ -2153,13 +2472,17 @@ class BaseRaw(
         if annotations.orig_time is None:
             annotations.onset -= self.first_samp / self.info["sfreq"]
         self.set_annotations(annotations)
-        for edge_samp in edge_samps:
-            onset = _sync_onset(self, edge_samp / self.info["sfreq"], True)
-            logger.debug(
-                f"Marking edge at {edge_samp} samples (maps to {onset:0.3f} sec)"
+        if edge_samps:
+            onsets = _sync_onset(self, np.array(edge_samps) / self.info["sfreq"], True)
+            for edge_samp, onset in zip(edge_samps, onsets):
+                logger.debug(
+                    f"Marking edge at {edge_samp} samples (maps to {onset:0.3f} sec)"
+                )
+            self.annotations.append(
+                np.repeat(onsets, 2),
+                0.0,
+                ["BAD boundary", "EDGE boundary"] * len(onsets),
             )
-            self.annotations.append(onset, 0.0, "BAD boundary")
-            self.annotations.append(onset, 0.0, "EDGE boundary")
         if not (
             len(self._first_samps)
             == len(self._last_samps)
@@ -2561,6 +2884,26 @@ class BaseRaw(
             print(msg)
 
 
+_DATA_DTYPES = (np.float64, np.float32, np.complex128, np.complex64)
+
+
+def _get_data_dtype(dtype, inst):
+    """Get the (real or complex) data type to store the data of inst in."""
+    try:
+        name = np.dtype(dtype).name
+    except TypeError:
+        name = dtype
+    _check_option("dtype", name, ("float64", "float32"))
+    dtype = np.dtype(dtype)
+    if isinstance(inst, np.ndarray):
+        is_complex = np.iscomplexobj(inst)
+    else:
+        is_complex = np.issubdtype(inst._dtype, np.complexfloating)
+    if is_complex:
+        dtype = np.result_type(dtype, np.complex64)
+    return dtype
+
+
 def _allocate_data(preload, shape, dtype):
     """Allocate data in memory or in memmap for preloading."""
     if preload in (None, True):  # None comes from _read_segment
@@ -2571,6 +2914,42 @@ def _allocate_data(preload, shape, dtype):
     return data
 
 
+def _good_segments(raw):
+    """Get the (start, stop) sample spans not covered by bad annotations."""
+    onsets, ends = _annotations_starts_stops(raw, ["BAD"])
+    onsets = np.clip(onsets, 0, raw.n_times)
+    ends = np.clip(ends, 0, raw.n_times)
+    segments = list()
+    cur = 0
+    for onset, end in zip(onsets, ends):  # onsets are sorted
+        if onset >= end:
+            continue
+        if onset > cur:
+            segments.append((cur, int(onset)))
+        cur = max(cur, int(end))
+    if cur < raw.n_times:
+        segments.append((cur, raw.n_times))
+    return segments
+
+
+def _split_reads(reads, n_jobs, min_len, splittable):
+    """Split file reads into contiguous blocks of time for parallel reading."""
+    n_total = sum(read[2] - read[1] for read in reads)
+    block_len = max(-(-n_total // n_jobs), min_len)
+    out = list()
+    for read, can_split in zip(reads, splittable):
+        if not can_split:
+            out.append(read)
+            continue
+        fi, start_file, stop_file, offset, orig_idx = read
+        n_blocks = max(-(-(stop_file - start_file) // block_len), 1)
+        lims = np.linspace(start_file, stop_file, n_blocks + 1).round().astype(int)
+        for this_start, this_stop in zip(lims[:-1], lims[1:]):
+            this_offset = int(offset + this_start - start_file)
+            out.append([fi, int(this_start), int(this_stop), this_offset, orig_idx])
+    return out
+
+
 def _convert_slice(sel):
     if len(sel) and (np.diff(sel) == 1).all():
         return slice(sel[0], sel[-1] + 1)
@@ -2706,6 +3085,94 @@ class _ReadSegmentFileProtector:
         return tuple(self._filenames)
 
 
+class _RawPrefetcher:
+    """Serve raw reads from blocks that are read ahead in a background thread."""
+
+    def __init__(self, raw, n_segments, n_block, n_jobs):
+        self._raw = raw
+        self.n_segments = n_segments
+        self.n_block = n_block
+        self.n_jobs = n_jobs
+        self.hits = 0
+        self.misses = 0
+        self._key = None
+        self._blocks = OrderedDict()  # block index -> Future
+        self._executor = None
+
+    def __repr__(self):  # noqa: D105
+        return (
+            f"<Prefetcher | {self.n_segments} segments of {self.n_block} samples, "
+            f"{self.hits} hit{_pl(self.hits)}, "
+            f"{self.misses} miss{_pl(self.misses, pl='es')}>"
+        )
+
+    def __enter__(self):
+        if getattr(self._raw, "_prefetcher", None) is not None:
+            raise RuntimeError("Prefetching is already active for this instance")
+        self._executor = ThreadPoolExecutor(self.n_jobs)
+        self._raw._prefetcher = self
+        return self
+
+    def __exit__(self, *args):
+        self._raw._prefetcher = None
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        self._blocks.clear()
+        logger.info(
+            f"Prefetching: {self.hits} hit{_pl(self.hits)}, "
+            f"{self.misses} miss{_pl(self.misses, pl='es')}"
+        )
+
+    def __deepcopy__(self, memodict):
+        # copies of the instance do not prefetch
+        return None
+
+    def _read_block(self, bi, sel, n_jobs=None):
+        start = bi * self.n_block
+        stop = min(start + self.n_block, self._raw.n_times)
+        return self._raw._read_segment(start=start, stop=stop, sel=sel, n_jobs=n_jobs)
+
+    def _read(self, start, stop, sel, n_jobs=None):
+        raw = self._raw
+        # anything that changes what _read_segment returns invalidates the blocks
+        key = (np.asarray(sel).tobytes(), raw._projector, raw._comp)
+        if (
+            self._key is None
+            or key[0] != self._key[0]
+            or any(new is not old for new, old in zip(key[1:], self._key[1:]))
+        ):
+            self._blocks.clear()
+        self._key = key
+        first, last = start // self.n_block, (stop - 1) // self.n_block
+        # read what we do not have (yet) in this thread
+        hit = True
+        for bi in range(first, last + 1):
+            if bi not in self._blocks:
+                hit = False
+                future = Future()
+                future.set_result(self._read_block(bi, sel, n_jobs))
+                self._blocks[bi] = future
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        # and schedule the next segments
+        n_blocks = -(-raw.n_times // self.n_block)
+        for bi in range(last + 1, min(last + 1 + self.n_segments, n_blocks)):
+            if bi not in self._blocks:
+                self._blocks[bi] = self._executor.submit(self._read_block, bi, sel)
+        # assemble the output
+        blocks = [self._blocks[bi].result() for bi in range(first, last + 1)]
+        data = np.concatenate(blocks, axis=1) if len(blocks) > 1 else blocks[0]
+        offset = first * self.n_block
+        data = data[:, start - offset : stop - offset].copy()
+        # drop blocks outside of the current and read-ahead segments
+        for bi in list(self._blocks):
+            if bi < first or bi > last + self.n_segments:
+                self._blocks.pop(bi).cancel()
+        return data
+
+
 class _RawShell:
     """Create a temporary raw object."""
 
@@ -2839,9 +3306,20 @@ class _RawFidWriter:
             if cfg.reset_range:
                 self.info["chs"][k]["range"] = 1.0
         self.projector = projector
-        # self.start is the only mutable attribute in this design!
+        # self.start is the only mutable attribute in this design (besides the
+        # state of the pipeline)!
         self.start, self.stop = start, stop
         self.cfg = cfg
+        self.pipeline = _RawBufferPipeline(
+            raw, self.info, self.picks, projector, cfg.fmt
+        )
+
+    def __enter__(self):
+        self.pipeline.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        self.pipeline.__exit__(*args)
 
     def write(self, fid, part_idx, prev_fname, next_fname):
         self._check_start_stop_within_bounds()
@@ -2865,9 +3343,8 @@ class _RawFidWriter:
             prev_fname,
             self.cfg.split_size,
             next_fname,
-            self.projector,
             self.cfg.drop_small_buffer,
-            self.cfg.fmt,
+            self.pipeline,
         )
         end_block(fid, FIFF.FIFFB_MEAS)
         is_next_split = self.start < self.stop
@@ -2896,9 +3373,8 @@ def _write_raw_data(
     prev_fname,
     split_size,
     next_fname,
-    projector,
     drop_small_buffer,
-    fmt,
+    pipeline,
 ):
     # Start the raw data
     data_kind = "IAS_" if info.get("maxshield", False) else ""
@@ -2946,7 +3422,14 @@ def _write_raw_data(
                     "output buffer_size, will be written as zeroes."
                 )
 
-    cals = [ch["cal"] * ch["range"] for ch in info["chs"]]
+    # Read and convert the blocks we are going to write ahead of time
+    pipeline.set_blocks(
+        [
+            (first, last)
+            for first, last in zip(firsts, lasts)
+            if not (do_skips and ((first >= sk_onsets) & (last <= sk_ends)).any())
+        ]
+    )
     # Write the blocks
     n_current_skip = 0
     new_start = start
@@ -2964,17 +3447,11 @@ def _write_raw_data(
                 # write_nop(fid)
                 # write_nop(fid)
                 n_current_skip = 0
-        data, times = raw[picks, first:last]
-        assert len(times) == last - first
-
-        if projector is not None:
-            data = np.dot(projector, data)
-
-        if drop_small_buffer and (first > start) and (len(times) < buffer_size):
+        if drop_small_buffer and (first > start) and (last - first < buffer_size):
             logger.info("Skipping data chunk due to small buffer ... [done]")
             break
         logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
-        _write_raw_buffer(fid, data, cals, fmt)
+        fid.write(pipeline.get(first, last))
 
         pos = fid.tell()
         this_buff_size_bytes = pos - pos_prev
@@ -3048,6 +3525,79 @@ def _write_raw_metadata(fid, info, data_type, reset_range, annotations):
         _write_annotations(fid, annotations)
 
 
+# Number of buffers read and converted ahead of the one being written, the
+# stages only overlap if they can run on different cores
+_N_WRITE_AHEAD = 2 if (os.cpu_count() or 1) > 1 else 0
+
+
+class _RawBufferPipeline:
+    """Read and convert raw buffers in threads ahead of writing them.
+
+    Buffers are read (and projected) in one thread and converted to FIF tags
+    in another, so that reading a buffer, converting the previous one, and
+    writing the one before that to disk all overlap. At most
+    ``_N_WRITE_AHEAD`` buffers are scheduled ahead of the one being written.
+    """
+
+    def __init__(self, raw, info, picks, projector, fmt):
+        self.raw = raw
+        self.picks = picks
+        self.projector = projector
+        self.cals = [ch["cal"] * ch["range"] for ch in info["chs"]]
+        self.fmt = fmt
+        self._blocks, self._index = list(), dict()
+        self._futures = dict()  # (first, last) -> Future of the tag bytes
+        self._read_executor = self._convert_executor = None
+
+    def __enter__(self):
+        if _N_WRITE_AHEAD > 0:
+            self._read_executor = ThreadPoolExecutor(1)
+            self._convert_executor = ThreadPoolExecutor(1)
+        return self
+
+    def __exit__(self, *args):
+        for executor in (self._read_executor, self._convert_executor):
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        self._read_executor = self._convert_executor = None
+        self._futures.clear()
+
+    def set_blocks(self, blocks):
+        """Set the (first, last) blocks to be written next, in order."""
+        self._blocks = blocks
+        self._index = {block: bi for bi, block in enumerate(blocks)}
+        # keep what we have already started on (e.g., before a split)
+        keep = set(blocks)
+        for block in list(self._futures):
+            if block not in keep:
+                self._futures.pop(block).cancel()
+
+    def get(self, first, last):
+        """Get the bytes of the tag holding a given block."""
+        if self._read_executor is None:
+            return self._convert(self._read(first, last))
+        bi = self._index[(first, last)]
+        for block in self._blocks[bi : bi + 1 + _N_WRITE_AHEAD]:
+            if block not in self._futures:
+                read = self._read_executor.submit(self._read, *block)
+                self._futures[block] = self._convert_executor.submit(
+                    lambda read: self._convert(read.result()), read
+                )
+        return self._futures.pop((first, last)).result()
+
+    def _read(self, first, last):
+        data, times = self.raw[self.picks, first:last]
+        assert len(times) == last - first
+        if self.projector is not None:
+            data = np.dot(self.projector, data)
+        return data
+
+    def _convert(self, data):
+        bio = BytesIO()
+        _write_raw_buffer(bio, data, self.cals, self.fmt)
+        return bio.getbuffer()
+
+
 def _write_raw_buffer(fid, buf, cals, fmt):
     """Write raw buffer.
 
@@ -216,6 +216,10 @@ class RawEDF(BaseRaw):
             )
             self.set_annotations(annotations, on_missing="warn")
 
+    def _can_split_reads(self, fi):
+        """Check if reads from a file can be split into blocks of time."""
+        return _can_split_reads(self._raw_extras[fi])
+
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a chunk of raw data."""
         return _read_segment_file(
@@ -318,6 +322,10 @@ class RawGDF(BaseRaw):
             )
         )
 
+    def _can_split_reads(self, fi):
+        """Check if reads from a file can be split into blocks of time."""
+        return _can_split_reads(self._raw_extras[fi])
+
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a chunk of raw data."""
         return _read_segment_file(
@@ -333,15 +341,21 @@ class RawGDF(BaseRaw):
         )
 
 
+def _bdf_to_int32(raw):
+    """Convert (..., 3) little-endian 24-bit samples to int32."""
+    # put the 3 bytes in the upper part of an int32, then an arithmetic right
+    # shift takes care of the sign extension
+    out = np.zeros(raw.shape[:-1] + (4,), np.uint8)
+    out[..., 1:] = raw
+    return out.view("<i4")[..., 0] >> 8
+
+
 def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     """Read a number of samples for a single channel."""
     # BDF
     if subtype == "bdf":
         ch_data = np.fromfile(fid, dtype=dtype, count=samp * dtype_byte)
-        ch_data = ch_data.reshape(-1, 3).astype(INT32)
-        ch_data = (ch_data[:, 0]) + (ch_data[:, 1] << 8) + (ch_data[:, 2] << 16)
-        # 24th bit determines the sign
-        ch_data[ch_data >= (1 << 23)] -= 1 << 24
+        ch_data = _bdf_to_int32(ch_data.reshape(-1, 3))
 
     # GDF data and EDF data
     else:
@@ -350,11 +364,24 @@ def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     return ch_data
 
 
+def _take_samples(records, cols, subtype):
+    """Extract and decode sample columns from a (n_records, n_items) array."""
+    if subtype == "bdf":
+        return _bdf_to_int32(records.reshape(len(records), -1, 3)[:, cols])
+    return records[:, cols]
+
+
+def _can_split_reads(raw_extras):
+    """Check that no channels are resampled when reading a segment."""
+    n_samps = raw_extras["n_samps"][raw_extras["sel"]]
+    return bool((n_samps == raw_extras["max_samp"]).all())
+
+
 def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals, mult):
     """Read a chunk of raw data."""
     n_samps = raw_extras["n_samps"]
     buf_len = int(raw_extras["max_samp"])
-    dtype = raw_extras["dtype_np"]
+    dtype = np.dtype(raw_extras["dtype_np"])
     dtype_byte = raw_extras["dtype_byte"]
     data_offset = raw_extras["data_offset"]
     stim_channel_idxs = raw_extras["stim_channel_idxs"]
@@ -365,114 +392,138 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
     offsets = raw_extras["offsets"]
     gains = raw_extras["units"]
 
-    read_sel = np.concatenate([orig_sel[idx], tal_idx])
     tal_data = []
 
     # only try to read the stim channel if it's not None and it's
     # actually one of the requested channels
     idx_arr = np.arange(idx.start, idx.stop) if isinstance(idx, slice) else idx
+    read_sel = orig_sel[idx_arr]
 
-    # We could read this one EDF block at a time, which would be this:
     ch_offsets = np.cumsum(np.concatenate([[0], n_samps]), dtype=np.int64)
+    rec_len = int(ch_offsets[-1])
     block_start_idx, r_lims, _ = _blk_read_lims(start, stop, buf_len)
-    # But to speed it up, we really need to read multiple blocks at once,
-    # Otherwise we can end up with e.g. 18,181 chunks for a 20 MB file!
-    # Let's do ~10 MB chunks:
-    n_per = max(10 * 1024 * 1024 // (ch_offsets[-1] * dtype_byte), 1)
-    with open(filenames, "rb", buffering=0) as fid:
-        # Extract data
-        start_offset = data_offset + block_start_idx * ch_offsets[-1] * dtype_byte
-
-        # first read everything into the `ones` array. For channels with
-        # lower sampling frequency, there will be zeros left at the end of the
-        # row. Ignore TAL/annotations channel and only store `orig_sel`
-        ones = np.zeros((len(orig_sel), data.shape[-1]), dtype=data.dtype)
-        # save how many samples have already been read per channel
-        n_smp_read = [0 for _ in range(len(orig_sel))]
-
-        # read data in chunks
-        for ai in range(0, len(r_lims), n_per):
-            block_offset = ai * ch_offsets[-1] * dtype_byte
-            n_read = min(len(r_lims) - ai, n_per)
-            fid.seek(start_offset + block_offset, 0)
-            # Read and reshape to (n_chunks_read, ch0_ch1_ch2_ch3...)
-            many_chunk = _read_ch(
-                fid, subtype, ch_offsets[-1] * n_read, dtype_byte, dtype
-            ).reshape(n_read, -1)
-            r_sidx = r_lims[ai][0]
-            r_eidx = buf_len * (n_read - 1) + r_lims[ai + n_read - 1][1]
-
-            # loop over selected channels, ci=channel selection
-            for ii, ci in enumerate(read_sel):
-                # This now has size (n_chunks_read, n_samp[ci])
-                ch_data = many_chunk[:, ch_offsets[ci] : ch_offsets[ci + 1]].copy()
-
-                # annotation channel has to be treated separately
-                if ci in tal_idx:
-                    tal_data.append(ch_data)
-                    continue
-
-                orig_idx = idx_arr[ii]
-                ch_data = ch_data * cal[orig_idx]
-                ch_data += offsets[orig_idx]
-                ch_data *= gains[orig_idx]
-
-                assert ci == orig_sel[orig_idx]
-
-                if n_samps[ci] != buf_len:
-                    if orig_idx in stim_channel_idxs:
-                        # Stim channel will be interpolated
-                        old = np.linspace(0, 1, n_samps[ci] + 1, True)
-                        new = np.linspace(0, 1, buf_len, False)
-                        ch_data = np.append(ch_data, np.zeros((len(ch_data), 1)), -1)
-                        ch_data = interp1d(old, ch_data, kind="zero", axis=-1)(new)
-                elif orig_idx in stim_channel_idxs:
-                    ch_data = np.bitwise_and(ch_data.astype(int), 2**17 - 1)
-
-                one_i = ch_data.ravel()[r_sidx:r_eidx]
-
-                # note how many samples have been read
-                smp_read = n_smp_read[orig_idx]
-                ones[orig_idx, smp_read : smp_read + len(one_i)] = one_i
-                n_smp_read[orig_idx] += len(one_i)
-
-        # resample channels with lower sample frequency
-        # skip if no data was requested, ie. only annotations were read
-        if any(n_smp_read) > 0:
-            # expected number of samples, equals maximum sfreq
-            smp_exp = data.shape[-1]
-
-            # resample data after loading all chunks to prevent edge artifacts
-            resampled = False
-
-            for i, smp_read in enumerate(n_smp_read):
-                # nothing read, nothing to resample
-                if smp_read == 0:
-                    continue
-                # upsample if n_samples is lower than from highest sfreq
-                if smp_read != smp_exp:
-                    # sanity check that we read exactly how much we expected
-                    assert (ones[i, smp_read:] == 0).all()
-
-                    ones[i, :] = resample(
-                        ones[i, :smp_read].astype(np.float64),
-                        smp_exp,
-                        smp_read,
-                        npad=0,
-                        axis=-1,
-                    )
-                    resampled = True
-
-            # give warning if we resampled a subselection
-            if resampled and raw_extras["nsamples"] != (stop - start):
-                warn(
-                    "Loading an EDF with mixed sampling frequencies and "
-                    "preload=False will result in edge artifacts. "
-                    "It is recommended to use preload=True."
-                    "See also https://github.com/mne-tools/mne-python/issues/10635"
+    n_blocks = len(r_lims)
+
+    # Channels sampled at the highest rate (usually all of them) are decoded
+    # together using a single fancy index into the records
+    is_full = n_samps[read_sel] == buf_len
+    full_rows = np.where(is_full)[0]
+    full_cols = ch_offsets[read_sel[is_full]][:, np.newaxis] + np.arange(buf_len)
+    full_cols = full_cols.ravel()
+    full_idx = idx_arr[is_full]
+    full_stim = np.isin(full_idx, stim_channel_idxs)
+    full_scale = np.array([cal[full_idx], offsets[full_idx], gains[full_idx]])
+    full_scale = full_scale[:, :, np.newaxis]
+
+    # Map all records covering [start, stop) at once, then decode them in
+    # ~10 MB chunks to bound the size of the temporaries
+    n_items = dtype_byte // dtype.itemsize  # 3 for BDF, 1 otherwise
+    records = np.memmap(
+        filenames,
+        dtype=dtype,
+        mode="r",
+        offset=data_offset + block_start_idx * rec_len * dtype_byte,
+        shape=(n_blocks, rec_len * n_items),
+    )
+    n_per = max(10 * 1024 * 1024 // (rec_len * dtype_byte), 1)
+
+    # first read everything into the `ones` array. For channels with
+    # lower sampling frequency, there will be zeros left at the end of the
+    # row. Ignore TAL/annotations channel and only store requested channels
+    ones = np.zeros((len(idx_arr), data.shape[-1]), dtype=data.dtype)
+    # save how many samples have already been read per channel
+    n_smp_read = np.zeros(len(idx_arr), int)
+
+    # read data in chunks
+    for ai in range(0, n_blocks, n_per):
+        n_read = min(n_blocks - ai, n_per)
+        these_records = records[ai : ai + n_read]
+        r_sidx = r_lims[ai][0]
+        r_eidx = buf_len * (n_read - 1) + r_lims[ai + n_read - 1][1]
+
+        if len(full_rows):
+            # (n_read, n_full * buf_len) -> (n_full, n_read * buf_len)
+            ch_data = _take_samples(these_records, full_cols, subtype)
+            ch_data = ch_data.reshape(n_read, len(full_rows), buf_len)
+            ch_data = ch_data.transpose(1, 0, 2).reshape(len(full_rows), -1)
+            ch_data = ch_data[:, r_sidx:r_eidx] * full_scale[0]
+            ch_data += full_scale[1]
+            ch_data *= full_scale[2]
+            if full_stim.any():
+                ch_data[full_stim] = np.bitwise_and(
+                    ch_data[full_stim].astype(int), 2**17 - 1
                 )
+            smp_read = n_smp_read[full_rows[0]]
+            ones[full_rows, smp_read : smp_read + ch_data.shape[1]] = ch_data
+            n_smp_read[full_rows] += ch_data.shape[1]
+
+        # channels with lower sampling frequency
+        for ii in np.where(~is_full)[0]:
+            ci = read_sel[ii]
+            orig_idx = idx_arr[ii]
+            cols = np.arange(ch_offsets[ci], ch_offsets[ci + 1])
+            # This now has size (n_chunks_read, n_samp[ci])
+            ch_data = _take_samples(these_records, cols, subtype) * cal[orig_idx]
+            ch_data += offsets[orig_idx]
+            ch_data *= gains[orig_idx]
+            if orig_idx in stim_channel_idxs:
+                # Stim channel will be interpolated
+                old = np.linspace(0, 1, n_samps[ci] + 1, True)
+                new = np.linspace(0, 1, buf_len, False)
+                ch_data = np.append(ch_data, np.zeros((len(ch_data), 1)), -1)
+                ch_data = interp1d(old, ch_data, kind="zero", axis=-1)(new)
+
+            one_i = ch_data.ravel()[r_sidx:r_eidx]
+
+            # note how many samples have been read
+            smp_read = n_smp_read[ii]
+            ones[ii, smp_read : smp_read + len(one_i)] = one_i
+            n_smp_read[ii] += len(one_i)
+
+        # annotation channel has to be treated separately
+        for ci in tal_idx:
+            cols = np.arange(ch_offsets[ci], ch_offsets[ci + 1])
+            tal_data.append(_take_samples(these_records, cols, subtype))
+    del records
+
+    # resample channels with lower sample frequency
+    # skip if no data was requested, ie. only annotations were read
+    if any(n_smp_read) > 0:
+        # expected number of samples, equals maximum sfreq
+        smp_exp = data.shape[-1]
+
+        # resample data after loading all chunks to prevent edge artifacts
+        resampled = False
+
+        for i, smp_read in enumerate(n_smp_read):
+            # nothing read, nothing to resample
+            if smp_read == 0:
+                continue
+            # upsample if n_samples is lower than from highest sfreq
+            if smp_read != smp_exp:
+                # sanity check that we read exactly how much we expected
+                assert (ones[i, smp_read:] == 0).all()
+
+                ones[i, :] = resample(
+                    ones[i, :smp_read].astype(np.float64),
+                    smp_exp,
+                    smp_read,
+                    npad=0,
+                    axis=-1,
+                )
+                resampled = True
+
+        # give warning if we resampled a subselection
+        if resampled and raw_extras["nsamples"] != (stop - start):
+            warn(
+                "Loading an EDF with mixed sampling frequencies and "
+                "preload=False will result in edge artifacts. "
+                "It is recommended to use preload=True."
+                "See also https://github.com/mne-tools/mne-python/issues/10635"
+            )
 
-            _mult_cal_one(data[:, :], ones, idx, cals, mult)
+        # ones only holds the requested channels (in order)
+        _mult_cal_one(data[:, :], ones, slice(None), cals, mult)
 
     if len(tal_data) > 1:
         tal_data = np.concatenate([tal.ravel() for tal in tal_data])
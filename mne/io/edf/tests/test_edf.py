@@ -23,6 +23,7 @@ from mne.annotations import _ndarray_ch_names, events_from_annotations, read_ann
 from mne.datasets import testing
 from mne.io import edf, read_raw_bdf, read_raw_edf, read_raw_fif, read_raw_gdf
 from mne.io.edf.edf import (
+    _bdf_to_int32,
     _edf_str,
     _parse_prefilter_string,
     _prefilter_float,
@@ -191,6 +192,29 @@ def test_bdf_data():
     assert (raw_py.info["chs"][63]["loc"]).any()
 
 
+def test_bdf_to_int32():
+    """Test vectorized conversion of 24-bit samples."""
+    vals = np.array([0, 1, -1, 2**23 - 1, -(2**23), 123456, -654321])
+    raw = vals.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3]
+    out = _bdf_to_int32(raw)
+    assert out.dtype == np.int32
+    assert_array_equal(out, vals)
+    out = _bdf_to_int32(np.tile(raw[:, np.newaxis], (1, 2, 1)))
+    assert_array_equal(out, np.tile(vals[:, np.newaxis], (1, 2)))
+
+
+def test_read_segment_subsets():
+    """Test that reading channel and time subsets matches preloaded data."""
+    for fname, reader in ((bdf_path, read_raw_bdf), (edf_path, read_raw_edf)):
+        raw = reader(fname, preload=False)
+        data = reader(fname, preload=True).get_data()
+        picks = [5, 2, 40, len(raw.ch_names) - 1]
+        for start, stop in ((0, None), (17, 1234), (raw.n_times - 3, None)):
+            assert_allclose(
+                raw.get_data(picks, start, stop), data[picks, start:stop], atol=1e-20
+            )
+
+
 @testing.requires_testing_data
 def test_bdf_crop_save_stim_channel(tmp_path):
     """Test EDF with various sampling rates."""
@@ -277,6 +301,16 @@ def test_edf_different_sfreqs_nopreload(stim_channel):
         assert x1.shape == x2.shape
 
 
+def test_edf_different_sfreqs_n_jobs():
+    """Test that mixed sampling rates are not read in blocks of time."""
+    raw = read_raw_edf(edf_uneven_path, verbose="error")
+    assert not raw._can_split_reads(0)
+    want = raw.copy().load_data().get_data()
+    # splitting the reads would resample (and warn) for every block
+    raw.load_data(n_jobs=4)
+    assert_array_equal(raw.get_data(), want)
+
+
 def test_edf_data_broken(tmp_path):
     """Test edf files."""
     raw = _test_raw_reader(
@@ -10,8 +10,8 @@ import numpy as np
 
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import read_meas_info
-from ..._fiff.open import _fiff_get_fid, _get_next_fname, fiff_open
-from ..._fiff.tag import _call_dict, read_tag
+from ..._fiff.open import _fid_pool, _get_next_fname, fiff_open
+from ..._fiff.tag import _call_dict, _simple_dict, read_tag
 from ..._fiff.tree import dir_tree_find
 from ..._fiff.utils import _mult_cal_one
 from ...annotations import Annotations, _read_annotations_fif
@@ -21,6 +21,7 @@ from ...utils import (
     _check_fname,
     _file_like,
     _on_missing,
+    _validate_type,
     check_fname,
     fill_doc,
     logger,
@@ -60,6 +61,7 @@ class Raw(BaseRaw):
         activity. Can also be "yes" to load without eliciting a warning.
     %(preload)s
     %(on_split_missing)s
+    %(mmap_fif)s
     %(verbose)s
 
     Attributes
@@ -94,10 +96,15 @@ class Raw(BaseRaw):
         allow_maxshield=False,
         preload=False,
         on_split_missing="raise",
+        *,
+        mmap=False,
         verbose=None,
     ):
         raws = []
         do_check_ext = not _file_like(fname)
+        _validate_type(mmap, bool, "mmap")
+        if mmap and preload is not False:
+            raise ValueError(f"preload must be False when mmap=True, got {preload}")
         next_fname = fname
         while next_fname is not None:
             raw, next_fname, buffer_size_sec = self._read_raw_file(
@@ -165,6 +172,14 @@ class Raw(BaseRaw):
 
             self._annotations += annot
 
+        if mmap:
+            for extra in self._raw_extras:
+                extra["mmap"] = _check_mmap(extra) and _FileMap(extra["filename"])
+                if not extra["mmap"]:
+                    logger.info(
+                        f"    Cannot memory-map {_get_fname_rep(extra['filename'])}, "
+                        "falling back to on-demand reads"
+                    )
         if preload:
             self._preload_data(preload)
         else:
@@ -402,8 +417,12 @@ class Raw(BaseRaw):
 
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file."""
+        if self._raw_extras[fi].get("mmap", False):
+            return _read_segment_file_mmap(
+                self._raw_extras[fi], data, idx, start, stop, cals, mult
+            )
         n_bad = 0
-        with _fiff_get_fid(self._raw_extras[fi]["filename"]) as fid:
+        with _fid_pool.open(self._raw_extras[fi]["filename"]) as fid:
             bounds = self._raw_extras[fi]["bounds"]
             ents = self._raw_extras[fi]["ent"]
             nchan = self._raw_extras[fi]["orig_nchan"]
@@ -499,9 +518,92 @@ def _check_entry(first, nent):
         raise OSError("Could not read data, perhaps this is a corrupt file")
 
 
+# Buffer types that are stored as fixed-width big-endian values and can thus be
+# viewed in place in a memory-mapped file
+_mmap_dtypes = {
+    FIFF.FIFFT_COMPLEX_FLOAT: ">c8",
+    FIFF.FIFFT_COMPLEX_DOUBLE: ">c16",
+}
+_mmap_dtypes.update(_simple_dict)
+
+
+def _check_mmap(raw_extra):
+    """Check if the data buffers of a FIF file can be memory-mapped."""
+    fname = raw_extra["filename"]
+    if not isinstance(fname, Path) or fname.suffix == ".gz":
+        return False
+    return all(ent.type in _mmap_dtypes for ent in raw_extra["ent"] if ent is not None)
+
+
+class _FileMap:
+    """A read-only memory map of a file that is opened on first use.
+
+    Copies and pickles hold their own map, which is opened again when needed.
+    """
+
+    def __init__(self, fname):
+        self.fname = fname
+        self._mm = None
+
+    def __reduce__(self):
+        return (self.__class__, (self.fname,))
+
+    def get(self):
+        if self._mm is None:
+            self._mm = np.memmap(self.fname, dtype=np.uint8, mode="r")
+        return self._mm
+
+
+def _read_segment_file_mmap(raw_extra, data, idx, start, stop, cals, mult):
+    """Read a segment of data by viewing the FIF buffers in a memmap."""
+    n_bad = 0
+    # The mapping is shared with the OS page cache (and thus with other processes
+    # reading the same file), only the requested window gets calibrated and copied
+    mm = raw_extra["mmap"].get()
+    bounds = raw_extra["bounds"]
+    ents = raw_extra["ent"]
+    nchan = raw_extra["orig_nchan"]
+    use = (stop > bounds[:-1]) & (start < bounds[1:])
+    offset = 0
+    for ei in np.where(use)[0]:
+        first = bounds[ei]
+        nsamp = bounds[ei + 1] - first
+        ent = ents[ei]
+        first_pick = max(start - first, 0)
+        last_pick = min(nsamp, stop - first)
+        this_sl = slice(offset, offset + last_pick - first_pick)
+        offset = this_sl.stop
+        if ent is None:
+            continue  # just use zeros for gaps
+        dtype = np.dtype(_mmap_dtypes[ent.type])
+        if ent.size != nsamp * nchan * dtype.itemsize:
+            n_bad += this_sl.stop - this_sl.start
+            continue
+        one = np.ndarray((nsamp, nchan), dtype, buffer=mm, offset=ent.pos + 16)
+        one = one[first_pick:last_pick].T
+        if mult is None:
+            # only convert the channels we actually need
+            one, this_idx = one[idx], slice(None)
+        else:
+            this_idx = idx
+        _mult_cal_one(data[:, this_sl], one, this_idx, cals, mult)
+    if n_bad:
+        warn(
+            f"FIF raw buffer could not be read, acquisition error "
+            f"likely: {n_bad} samples set to zero"
+        )
+    assert offset == stop - start
+
+
 @fill_doc
 def read_raw_fif(
-    fname, allow_maxshield=False, preload=False, on_split_missing="raise", verbose=None
+    fname,
+    allow_maxshield=False,
+    preload=False,
+    on_split_missing="raise",
+    *,
+    mmap=False,
+    verbose=None,
 ) -> Raw:
     """Reader function for Raw FIF data.
 
@@ -524,6 +626,7 @@ def read_raw_fif(
         activity. Can also be "yes" to load without eliciting a warning.
     %(preload)s
     %(on_split_missing)s
+    %(mmap_fif)s
     %(verbose)s
 
     Returns
@@ -546,6 +649,7 @@ def read_raw_fif(
         preload=preload,
         verbose=verbose,
         on_split_missing=on_split_missing,
+        mmap=mmap,
     )
 
 
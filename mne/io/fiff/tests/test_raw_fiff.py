@@ -30,6 +30,7 @@ from mne import (
     pick_types,
 )
 from mne._fiff.constants import FIFF
+from mne._fiff.open import _fid_pool, fiff_open
 from mne._fiff.tag import _read_tag_header, read_tag
 from mne.annotations import Annotations
 from mne.datasets import testing
@@ -2002,6 +2003,224 @@ def test_memmap(tmp_path):
     # require them.
 
 
+@pytest.mark.parametrize("fmt", ("single", "double", "int", "short"))
+def test_preload_mmap(tmp_path, fmt):
+    """Test reading with memory-mapped FIF data buffers."""
+    rng = np.random.RandomState(0)
+    info = create_info(["EEG 001", "EEG 002", "EEG 003", "STI 014"], 1000.0)
+    info.set_montage(None)
+    for ch in info["chs"][:3]:
+        ch.update(kind=FIFF.FIFFV_EEG_CH, unit=FIFF.FIFF_UNIT_V, cal=1e-6)
+    data = rng.randint(-1000, 1000, (4, 100000)) * 1e-6
+    raw = RawArray(data, info)
+    raw.info["bads"] = ["EEG 002"]
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, fmt=fmt, buffer_size_sec=0.3)
+    raw_read = read_raw_fif(fname, preload=True)
+    raw_mmap = read_raw_fif(fname, mmap=True)
+    assert not raw_mmap.preload
+    assert all(extra["mmap"] for extra in raw_mmap._raw_extras)
+    assert raw_mmap._init_kwargs["mmap"]
+    assert_allclose(raw_mmap.get_data(), raw_read.get_data())
+    for picks, start, stop in ((None, 0, None), ([2, 0], 123, 4567), ("eeg", 299, 301)):
+        assert_allclose(
+            raw_mmap.get_data(picks, start, stop),
+            raw_read.get_data(picks, start, stop),
+        )
+    # projection gets applied on access
+    raw_read.set_eeg_reference(projection=True).apply_proj()
+    raw_mmap.set_eeg_reference(projection=True).apply_proj()
+    assert_allclose(
+        raw_mmap.get_data(start=10, stop=900),
+        raw_read.get_data()[:, 10:900],
+        atol=1e-12,
+    )
+    assert_allclose(
+        raw_mmap.copy().load_data().get_data(), raw_read.get_data(), atol=1e-12
+    )
+    # split files
+    raw.save(fname, fmt=fmt, split_size="1.2MB", buffer_size_sec=0.3, overwrite=True)
+    raw_read = read_raw_fif(fname, preload=True)
+    raw_mmap = read_raw_fif(fname, mmap=True)
+    assert len(raw_mmap.filenames) > 1
+    assert_allclose(raw_mmap.get_data(), raw_read.get_data())
+    # compressed files fall back to regular reads
+    fname_gz = tmp_path / "test_raw.fif.gz"
+    raw.save(fname_gz, fmt=fmt)
+    raw_mmap = read_raw_fif(fname_gz, mmap=True)
+    assert not raw_mmap._raw_extras[0]["mmap"]
+    assert_allclose(raw_mmap.get_data(), raw_read.get_data())
+    # a file name without a suffix can be mapped
+    fname_plain = tmp_path / "test_raw"
+    raw.save(tmp_path / "plain_raw.fif", fmt=fmt, buffer_size_sec=0.3)
+    (tmp_path / "plain_raw.fif").rename(fname_plain)
+    raw_mmap = read_raw_fif(fname_plain, mmap=True, verbose="error")
+    assert raw_mmap._raw_extras[0]["mmap"]
+    assert_allclose(raw_mmap.get_data(), raw_read.get_data())
+    # the map is opened once, and not shared with copies or pickles
+    mm = raw_mmap._raw_extras[0]["mmap"].get()
+    assert raw_mmap._raw_extras[0]["mmap"].get() is mm
+    raw_copy = raw_mmap.copy()
+    assert raw_copy._raw_extras[0]["mmap"]._mm is None
+    assert_allclose(raw_copy.get_data(), raw_read.get_data())
+    raw_copy = pickle.loads(pickle.dumps(raw_mmap))
+    assert raw_copy._raw_extras[0]["mmap"]._mm is None
+    assert_allclose(raw_copy.get_data(), raw_read.get_data())
+    # memory-mapping only applies to data that are not preloaded
+    with pytest.raises(ValueError, match="preload must be False"):
+        read_raw_fif(fname, preload=True, mmap=True)
+
+
+def test_fif_index_cache(tmp_path, monkeypatch):
+    """Test caching of the FIF tag directory and tree."""
+    info = create_info(
+        ["EEG 001", "EEG 002", "STI 014"], 1000.0, ["eeg"] * 2 + ["stim"]
+    )
+    raw = RawArray(np.random.RandomState(0).randn(3, 100000) * 1e-6, info)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, split_size="1.5MB")
+    fnames = sorted(tmp_path.glob("*.fif"))
+    assert len(fnames) > 1
+    index_dir = tmp_path / "index"
+    ff, tree, directory = fiff_open(fname)
+    ff.close()
+    assert not index_dir.exists()
+    monkeypatch.setenv("MNE_FIF_INDEX_DIR", str(index_dir))
+    # first read populates the cache, second one uses it
+    for count in range(2):
+        with catch_logging(verbose="debug") as log:
+            ff, tree_cached, directory_cached = fiff_open(fname)
+        ff.close()
+        assert ("Using cached tag directory" in log.getvalue()) == bool(count)
+        assert_object_equal(tree_cached, tree)
+        assert_object_equal(directory_cached, directory)
+        assert len(list(index_dir.glob("*-idx.npz"))) == 1
+    raw_cached = read_raw_fif(fname)
+    assert len(list(index_dir.glob("*-idx.npz"))) == len(fnames)
+    assert_allclose(raw_cached.get_data(), raw.get_data(), rtol=1e-6)
+    # modifying the file invalidates the entry
+    raw.crop(0, 10).save(fname, overwrite=True)
+    with catch_logging(verbose="debug") as log:
+        ff, tree_new, _ = fiff_open(fname)
+    ff.close()
+    assert "Using cached tag directory" not in log.getvalue()
+    assert_allclose(read_raw_fif(fname).get_data(), raw.get_data(), rtol=1e-6)
+    # corrupted entries are ignored
+    for index_fname in index_dir.glob("*-idx.npz"):
+        index_fname.write_bytes(b"foo")
+    assert_allclose(read_raw_fif(fname).get_data(), raw.get_data(), rtol=1e-6)
+
+
+def test_parallel_read(tmp_path):
+    """Test reading split files using multiple threads."""
+    info = create_info(
+        ["EEG 001", "EEG 002", "STI 014"], 1000.0, ["eeg"] * 2 + ["stim"]
+    )
+    raw = RawArray(np.random.RandomState(0).randn(3, 100000) * 1e-6, info)
+    raw.set_eeg_reference(projection=True)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, split_size="1.5MB", buffer_size_sec=0.5)
+    raw = read_raw_fif(fname)
+    assert len(raw.filenames) > 1
+    for picks, start, stop in ((None, 0, None), ([1, 0], 123, 45678), ("eeg", 9, 10)):
+        assert_allclose(
+            raw.get_data(picks, start, stop, n_jobs=3),
+            raw.get_data(picks, start, stop),
+        )
+    raw.apply_proj()
+    with catch_logging(verbose="debug") as log:
+        got = raw.get_data(n_jobs=4, reject_by_annotation="omit")
+    assert "using 4 threads" in log.getvalue()
+    assert_allclose(got, raw.copy().load_data().get_data())
+    raw.load_data(n_jobs=2)
+    assert raw.preload
+    assert_allclose(raw.get_data(), got)
+
+
+@pytest.mark.parametrize("fmt", ["single", "short"])
+def test_pipelined_write(tmp_path, monkeypatch, fmt):
+    """Test that reading ahead while writing does not change the files."""
+    info = create_info(
+        ["EEG 001", "EEG 002", "STI 014"], 1000.0, ["eeg"] * 2 + ["stim"]
+    )
+    data = np.random.RandomState(0).randn(3, 100000) * 1e-6
+    raw = RawArray(data, info)
+    raw.set_eeg_reference(projection=True)
+    raw.set_annotations(Annotations([10.0], [5.0], ["BAD_ACQ_SKIP"]))
+    raw.save(tmp_path / "test_raw.fif", buffer_size_sec=0.5)
+    raw = read_raw_fif(tmp_path / "test_raw.fif")
+    kwargs = dict(
+        fmt=fmt,
+        buffer_size_sec=0.5,
+        split_size="1.2MB",
+        proj=True,
+        drop_small_buffer=True,
+    )
+    monkeypatch.setattr(base, "_N_WRITE_AHEAD", 2)
+    fnames = raw.save(tmp_path / "piped_raw.fif", **kwargs)
+    assert len(fnames) > 1
+    monkeypatch.setattr(base, "_N_WRITE_AHEAD", 0)
+    want = raw.save(tmp_path / "plain_raw.fif", **kwargs)
+    assert len(want) == len(fnames)
+    # the files only differ by their IDs (which include the time of writing)
+    for fname, fname_want in zip(fnames, want):
+        assert fname.stat().st_size == fname_want.stat().st_size
+    raw_read, raw_want = read_raw_fif(fnames[0]), read_raw_fif(want[0])
+    for extra, extra_want in zip(raw_read._raw_extras, raw_want._raw_extras):
+        assert_array_equal(extra["bounds"], extra_want["bounds"])
+    assert_array_equal(raw_read.get_data(), raw_want.get_data())
+
+
+def test_concatenate_many(tmp_path, monkeypatch):
+    """Test reading from a concatenation of many short files."""
+    monkeypatch.setattr(_fid_pool, "max_size", 4)
+    info = create_info(["EEG 001", "EEG 002"], 100.0, "eeg")
+    rng = np.random.RandomState(0)
+    raws, data = list(), list()
+    for ii in range(30):
+        data.append(rng.randn(2, 10 + ii) * 1e-6)
+        fname = tmp_path / f"test_{ii}_raw.fif"
+        RawArray(data[-1], info, first_samp=ii).save(fname)
+        raws.append(read_raw_fif(fname))
+    data = np.concatenate(data, axis=1)
+    raw = concatenate_raws(raws)
+    assert not raw.preload
+    assert len(raw.filenames) == 30
+    assert raw.n_times == data.shape[1]
+    boundaries = raw.annotations.description == "BAD boundary"
+    assert boundaries.sum() == 29
+    assert_allclose(
+        raw.annotations.onset[boundaries] * raw.info["sfreq"] + raw.first_samp,
+        raw.first_samp + np.cumsum(np.arange(10, 39)),
+    )
+    for start, stop in ((0, None), (9, 10), (10, 11), (15, 400), (700, 795)):
+        assert_allclose(raw.get_data(start=start, stop=stop), data[:, start:stop])
+    assert sum(len(fids) for fids in _fid_pool._fids.values()) == 4
+    # the cumulative file lengths are cached until the files change
+    assert raw._cumul_lens() is raw._cumul_lens()
+    first_samp = raw.first_samp
+    raw.crop(0.15, 7.0)
+    assert raw.first_samp == first_samp + 15
+    assert raw.last_samp == first_samp + 700
+    assert raw.n_times == 686
+    assert_allclose(raw.get_data(), data[:, 15:701])
+    raw.append(read_raw_fif(tmp_path / "test_0_raw.fif"))
+    assert raw.n_times == 696
+    assert_allclose(raw.get_data(start=680), np.c_[data[:, 695:701], data[:, :10]])
+    _fid_pool.clear()
+    assert len(_fid_pool._fids) == 0
+    if os.name == "nt":  # open files cannot be replaced
+        return
+    # a replaced file is re-opened
+    raw = read_raw_fif(tmp_path / "test_0_raw.fif")
+    raw.get_data()
+    RawArray(data[:, :10] * 2, info).save(tmp_path / "test_0_raw.fif", overwrite=True)
+    assert_allclose(
+        read_raw_fif(tmp_path / "test_0_raw.fif").get_data(), data[:, :10] * 2
+    )
+    _fid_pool.clear()
+
+
 # These are slow on Azure Windows so let's do a subset
 @pytest.mark.parametrize(
     "kind",
@@ -0,0 +1,7 @@
+"""HDF5 module for reading and writing raw data."""
+
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+from .h5 import read_raw_h5
@@ -0,0 +1,190 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import numpy as np
+
+from ..._fiff.constants import _coord_frame_named
+from ..._fiff.meas_info import Info, _writing_info_hdf5
+from ..._fiff.pick import pick_info
+from ..._fiff.tag import _update_ch_info_named
+from ..._fiff.utils import _mult_cal_one
+from ...annotations import Annotations
+from ...utils import (
+    _check_fname,
+    _check_option,
+    _import_h5io_funcs,
+    _import_h5py,
+    fill_doc,
+    logger,
+    verbose,
+)
+from ..base import BaseRaw
+
+# Name of the group holding the metadata (written by h5io) and of the dataset
+# holding the data (written by h5py) within the file
+_TITLE = "mnepython"
+_DATA = "raw_data"
+# Maximum number of channels per chunk, small enough that reading a single
+# channel does not need to decompress the data of many others
+_CHUNK_CHANNELS = 8
+
+
+@fill_doc
+def read_raw_h5(fname, preload=False, verbose=None) -> "RawH5":
+    """Reader for raw data saved in HDF5 format.
+
+    Parameters
+    ----------
+    fname : path-like
+        Path to the HDF5 file, as written by :meth:`mne.io.Raw.save`.
+    %(preload)s
+    %(verbose)s
+
+    Returns
+    -------
+    raw : instance of RawH5
+        A Raw object containing the data.
+        See :class:`mne.io.Raw` for documentation of attributes and methods.
+
+    See Also
+    --------
+    mne.io.Raw : Documentation of attributes and methods of RawH5.
+
+    Notes
+    -----
+    The data are stored in blocks of channels and time, so reading a few
+    channels or a short time window only decompresses the blocks involved.
+
+    .. versionadded:: 1.10
+    """
+    return RawH5(fname, preload=preload, verbose=verbose)
+
+
+@fill_doc
+class RawH5(BaseRaw):
+    """Raw object from an HDF5 file.
+
+    Parameters
+    ----------
+    fname : path-like
+        Path to the HDF5 file, as written by :meth:`mne.io.Raw.save`.
+    %(preload)s
+    %(verbose)s
+
+    See Also
+    --------
+    mne.io.Raw : Documentation of attributes and methods.
+
+    Notes
+    -----
+    .. versionadded:: 1.10
+    """
+
+    @verbose
+    def __init__(self, fname, preload=False, verbose=None):
+        read_hdf5, _ = _import_h5io_funcs()
+        fname = _check_fname(fname, "read", True, "fname")
+        logger.info(f"Loading {fname}")
+        state = read_hdf5(fname, title=_TITLE, slash="replace")
+        info = Info(**state["info"])
+        with info._unlock():
+            for ch in info["chs"]:  # restore the named constants
+                coord_frame = ch["coord_frame"]
+                _update_ch_info_named(ch)
+                ch["coord_frame"] = _coord_frame_named.get(coord_frame, coord_frame)
+        first_samp, n_times = int(state["first_samp"]), int(state["n_times"])
+        super().__init__(
+            info,
+            preload,
+            first_samps=[first_samp],
+            last_samps=[first_samp + n_times - 1],
+            filenames=[fname],
+            raw_extras=[dict(first_samp=first_samp)],
+            orig_format=state["fmt"],
+            verbose=verbose,
+        )
+        annot = state["annotations"]
+        onset = np.array(annot["onset"], float)
+        if info["meas_date"] is None:
+            onset -= self._first_time  # set_annotations will add it back on
+        annotations = Annotations(
+            onset,
+            annot["duration"],
+            annot["description"],
+            orig_time=info["meas_date"],
+            ch_names=annot["ch_names"],
+        )
+        self.set_annotations(annotations, emit_warning=False)
+
+    def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
+        """Read a segment of data from a file."""
+        h5py = _import_h5py()
+
+        first_samp = self._raw_extras[fi]["first_samp"]
+        time_sl = slice(start - first_samp, stop - first_samp)
+        with h5py.File(self.filenames[fi], "r") as fid:
+            dset = fid[_DATA]
+            # only the chunks holding the requested channels get decompressed,
+            # h5py needs increasing indices though
+            if isinstance(idx, slice):
+                one = dset[idx, time_sl]
+            else:
+                sel, inverse = np.unique(idx, return_inverse=True)
+                one = dset[sel, time_sl][inverse]
+        _mult_cal_one(data, one, slice(None), cals, mult)
+
+
+def _write_raw_h5(
+    raw, fname, info, picks, projector, start, stop, buffer_size, fmt, compression
+):
+    """Write raw data to an HDF5 file."""
+    h5py = _import_h5py()
+    _, write_hdf5 = _import_h5io_funcs()
+    _check_option("fmt", fmt, ("single", "double"), extra="when saving to HDF5")
+    _check_option("compression", compression, ("gzip", "lzf", None))
+    info = pick_info(info, picks, copy=True)
+    with info._unlock():
+        for ch in info["chs"]:
+            ch["range"] = 1.0
+    cals = np.array([ch["cal"] for ch in info["chs"]], float)[:, np.newaxis]
+    annot = raw.annotations
+    state = dict(
+        first_samp=raw.first_samp + start,
+        n_times=stop - start,
+        fmt=fmt,
+        info=info,
+        annotations=dict(
+            onset=annot.onset,
+            duration=annot.duration,
+            description=list(annot.description),
+            ch_names=[list(ch_names) for ch_names in annot.ch_names],
+        ),
+    )
+    with _writing_info_hdf5(info):
+        write_hdf5(fname, state, overwrite=True, title=_TITLE, slash="replace")
+    is_complex = np.iscomplexobj(raw[0, 0][0])
+    dtype = dict(single=np.float32, double=np.float64)[fmt]
+    if is_complex:
+        dtype = np.result_type(dtype, np.complex64)
+    n_chunk = min(buffer_size, stop - start)
+    chunks = (min(len(picks), _CHUNK_CHANNELS), n_chunk)
+    with h5py.File(fname, "a") as fid:
+        dset = fid.create_dataset(
+            _DATA,
+            shape=(len(picks), stop - start),
+            dtype=dtype,
+            chunks=chunks,
+            compression=compression,
+            shuffle=compression is not None,
+        )
+        # write whole chunks of time at once
+        for first in range(start, stop, n_chunk):
+            last = min(first + n_chunk, stop)
+            logger.debug(f"Writing HDF5 {first:6d} ... {last:6d} ...")
+            if projector is None:
+                data = raw[picks, first:last][0]
+            else:  # operates on all channels
+                data = (projector @ raw[:, first:last][0])[picks]
+            dset[:, first - start : last - start] = data / cals
+    return fname
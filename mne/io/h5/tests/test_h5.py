@@ -0,0 +1,100 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from mne import Annotations, create_info
+from mne.io import RawArray, read_raw, read_raw_fif, read_raw_h5
+from mne.io.tests.test_raw import _test_raw_reader
+
+pytest.importorskip("h5io")
+h5py = pytest.importorskip("h5py")
+
+
+def _make_raw(first_samp=123):
+    info = create_info(
+        ["EEG 001", "EEG 002", "EEG 003", "MEG 0113", "STI 014"],
+        1000.0,
+        ["eeg"] * 3 + ["mag", "stim"],
+    )
+    rng = np.random.RandomState(0)
+    data = rng.randn(5, 20000) * 1e-6
+    data[3] *= 1e-6
+    data[4] = (rng.rand(20000) > 0.999) * 5
+    raw = RawArray(data, info, first_samp=first_samp)
+    raw.set_meas_date(1e9)
+    raw.set_annotations(
+        Annotations([1, 5], [0.5, 1], ["bad x", "y"], ch_names=[["EEG 001"], []])
+    )
+    return raw
+
+
+@pytest.mark.parametrize("compression", ["gzip", "lzf", None])
+def test_io_raw_h5(tmp_path, compression):
+    """Test round-tripping raw data through HDF5."""
+    raw = _make_raw()
+    fname = tmp_path / "test_raw.h5"
+    assert raw.save(fname, compression=compression) == [fname]
+    raw_read = read_raw_h5(fname)
+    assert not raw_read.preload
+    assert raw_read.first_samp == raw.first_samp
+    assert raw_read.ch_names == raw.ch_names
+    assert raw_read.info["meas_date"] == raw.info["meas_date"]
+    assert_allclose(raw_read.annotations.onset, raw.annotations.onset)
+    assert_array_equal(raw_read.annotations.description, raw.annotations.description)
+    assert raw_read.annotations.ch_names[0] == ("EEG 001",)
+    assert_allclose(raw_read.get_data(), raw.get_data(), rtol=1e-6, atol=0)
+    for picks, start, stop in ((["MEG 0113"], 0, None), ([4, 0, 2], 150, 1234)):
+        assert_allclose(
+            raw_read.get_data(picks, start, stop),
+            raw.get_data(picks, start, stop),
+            rtol=1e-6,
+            atol=0,
+        )
+    with h5py.File(fname, "r") as fid:
+        assert fid["raw_data"].chunks[0] == 5
+        assert fid["raw_data"].compression == compression
+    # the generic reader dispatches on the extension
+    assert_allclose(read_raw(fname).get_data(), raw_read.get_data(), atol=0)
+
+
+def test_io_raw_h5_crop_proj(tmp_path):
+    """Test saving part of the data with projections applied."""
+    raw = _make_raw()
+    raw.set_eeg_reference(projection=True)
+    fname = tmp_path / "test_raw.hdf5"
+    raw.save(fname, picks="eeg", tmin=2, tmax=8, fmt="double", proj=True)
+    raw_read = read_raw_h5(fname, preload=True)
+    raw.crop(2, 8).pick("eeg").apply_proj()
+    assert raw_read.first_samp == raw.first_samp
+    assert_allclose(raw_read.get_data(), raw.get_data(), atol=1e-20)
+    assert raw_read.info["projs"][0]["active"]
+    assert_allclose(raw_read.annotations.onset, raw.annotations.onset)
+    # without a measurement date, annotations are relative to the first sample
+    raw = _make_raw()
+    raw.set_meas_date(None)
+    raw.save(fname, tmin=2, overwrite=True)
+    raw_read = read_raw_h5(fname)
+    raw.crop(2)
+    assert raw_read.info["meas_date"] is None
+    assert_allclose(raw_read.annotations.onset, raw.annotations.onset)
+    assert_allclose(raw_read.times, raw.times)
+    with pytest.raises(ValueError, match="Invalid value for the 'fmt'"):
+        raw.save(fname, fmt="short", overwrite=True)
+    with pytest.raises(ValueError, match="Invalid value for the 'compression'"):
+        raw.save(fname, compression="bzip2", overwrite=True)
+    with pytest.raises(ValueError, match="only supported when saving in HDF5"):
+        raw.save(tmp_path / "test_raw.fif", compression="lzf")
+
+
+def test_raw_h5_reader(tmp_path):
+    """Test the HDF5 reader with the generic raw reader checks."""
+    fname_fif = tmp_path / "test_raw.fif"
+    _make_raw().save(fname_fif)
+    fname = tmp_path / "test_raw.h5"
+    read_raw_fif(fname_fif).save(fname)
+    raw = _test_raw_reader(read_raw_h5, fname=fname)
+    assert_allclose(raw.get_data(), read_raw_fif(fname_fif).get_data(), atol=0)
@@ -351,9 +351,9 @@ def _test_raw_reader(
     for filename in filenames:
         assert filename.is_file()
     # Test saving with not correct extension
-    out_fname_h5 = op.join(tempdir, "test_raw.h5")
+    out_fname_txt = op.join(tempdir, "test_raw.txt")
     with pytest.raises(OSError, match="raw must end with .fif or .fif.gz"):
-        raw.save(out_fname_h5)
+        raw.save(out_fname_txt)
 
     raw3 = read_raw_fif(out_fname, allow_maxshield="yes")
     assert_named_constants(raw3.info)
@@ -732,6 +732,166 @@ def test_get_data_reject():
     assert np.isnan(data).sum() == 3072  # but NaNs are introduced instead
 
 
+def test_iter_chunks(tmp_path):
+    """Test iterating over chunks of raw data."""
+    fs = 100.0
+    info = create_info(["C3", "Cz", "C4"], sfreq=fs, ch_types="eeg")
+    data = np.random.RandomState(0).randn(3, 1050) * 1e-6
+    raw = RawArray(data, info)
+    chunks = list(raw.iter_chunks(2.0))
+    assert [(start, stop) for start, stop, _ in chunks] == [
+        (0, 200),
+        (200, 400),
+        (400, 600),
+        (600, 800),
+        (800, 1000),
+        (1000, 1050),
+    ]
+    assert_array_equal(np.concatenate([c[2] for c in chunks], axis=1), data)
+    chunks = list(raw.iter_chunks(4.0, overlap=1.0, picks=[2, 0]))
+    assert [(start, stop) for start, stop, _ in chunks] == [
+        (0, 400),
+        (300, 700),
+        (600, 1000),
+        (900, 1050),
+    ]
+    for start, stop, chunk in chunks:
+        assert_array_equal(chunk, data[[2, 0], start:stop])
+    # lazily read with an average reference projector applied on the fly
+    raw.set_eeg_reference(projection=True)
+    raw.save(tmp_path / "test_raw.fif")
+    raw = read_raw_fif(tmp_path / "test_raw.fif").apply_proj()
+    assert not raw.preload
+    want = raw.copy().load_data().get_data()
+    chunks = list(raw.iter_chunks(3.0, overlap=0.5))
+    for start, stop, chunk in chunks:
+        assert_allclose(chunk, want[:, start:stop], atol=1e-20)
+    assert chunks[-1][1] == raw.n_times
+    # annotations
+    raw.set_annotations(
+        Annotations(onset=[1, 1.5, 6], duration=[1, 1, 0.5], description="bad")
+    )
+    chunks = list(raw.iter_chunks(3.0, reject_by_annotation="omit"))
+    assert [(start, stop) for start, stop, _ in chunks] == [
+        (0, 100),
+        (250, 550),
+        (550, 600),
+        (650, 950),
+        (950, 1050),
+    ]
+    chunks = list(raw.iter_chunks(5.0, reject_by_annotation="NaN"))
+    assert np.isnan(chunks[0][2]).sum() == 3 * 150
+    assert np.isnan(chunks[1][2]).sum() == 3 * 50
+    with pytest.raises(ValueError, match="smaller than duration"):
+        raw.iter_chunks(1.0, overlap=1.0)
+    with pytest.raises(ValueError, match="at least one sample"):
+        raw.iter_chunks(0.001)
+    with pytest.raises(ValueError, match="Invalid value"):
+        raw.iter_chunks(1.0, reject_by_annotation="foo")
+
+
+def test_prefetch(tmp_path):
+    """Test reading ahead raw data in a background thread."""
+    info = create_info(["C3", "Cz", "C4"], sfreq=100.0, ch_types="eeg")
+    data = np.random.RandomState(0).randn(3, 1050) * 1e-6
+    RawArray(data, info).save(tmp_path / "test_raw.fif")
+    raw = read_raw_fif(tmp_path / "test_raw.fif")
+    want = raw.copy().load_data().get_data()
+    with raw.prefetch(n_segments=2, duration=1.0) as prefetcher:
+        assert raw._prefetcher is prefetcher
+        for start in range(0, raw.n_times, 70):
+            stop = min(start + 70, raw.n_times)
+            assert_allclose(
+                raw.get_data(start=start, stop=stop), want[:, start:stop], atol=0
+            )
+        assert prefetcher.misses == 1
+        assert prefetcher.hits > 10
+        assert len(prefetcher._blocks) <= 4
+        # jumping back drops the blocks outside of the new window
+        assert_allclose(raw.get_data(stop=70, n_jobs=2), want[:, :70], atol=0)
+        assert prefetcher.misses == 2
+        assert set(prefetcher._blocks) == {0, 1, 2}
+        assert_allclose(raw.get_data(picks=[2, 0]), want[[2, 0]], atol=0)
+        # copies do not share the prefetcher
+        assert raw.copy()._prefetcher is None
+        # a projector change invalidates the blocks
+        raw.set_eeg_reference(projection=True).apply_proj()
+        assert_allclose(raw.get_data(), want - want.mean(0), atol=1e-20)
+        with pytest.raises(RuntimeError, match="already active"):
+            with raw.prefetch():
+                pass
+    assert raw._prefetcher is None
+    assert "hits" in repr(prefetcher)
+    # non-preloaded epochs read through the prefetcher
+    events = mne.make_fixed_length_events(raw, duration=0.5)
+    epochs = mne.Epochs(raw, events, tmin=0, tmax=0.49, baseline=None, preload=False)
+    want = epochs.get_data()
+    epochs = mne.Epochs(raw, events, tmin=0, tmax=0.49, baseline=None, preload=False)
+    with raw.prefetch(n_segments=3, duration=2.0, n_jobs=2) as prefetcher:
+        assert prefetcher._executor._max_workers == 2
+        epochs.drop_bad()
+        assert_allclose(epochs.get_data(), want, atol=1e-20)
+    assert prefetcher.hits > prefetcher.misses
+    with pytest.raises(ValueError, match="at least 1"):
+        raw.prefetch(n_segments=0)
+    with pytest.raises(ValueError, match="at least one sample"):
+        raw.prefetch(duration=0.001)
+
+
+def test_load_data_dtype(tmp_path):
+    """Test processing raw data in single precision."""
+    info = create_info(["C3", "Cz", "C4", "STI"], 100.0, ["eeg"] * 3 + ["stim"])
+    rng = np.random.RandomState(0)
+    data = np.cumsum(rng.randn(4, 3000), axis=1) * 1e-7 + 5e-5
+    data[3] = 0
+    data[3, 100::200] = 1
+    RawArray(data, info).save(tmp_path / "test_raw.fif")
+    raw64 = read_raw_fif(tmp_path / "test_raw.fif").load_data()
+    raw = read_raw_fif(tmp_path / "test_raw.fif").load_data(dtype="float32")
+    assert raw._data.dtype == np.float32
+    assert raw.get_data().dtype == np.float32
+    assert_allclose(raw.get_data(), raw64.get_data(), rtol=1e-6, atol=0)
+    # preloaded data get converted
+    raw_conv = raw64.copy().load_data(dtype="float32")
+    assert raw_conv._data.dtype == np.float32
+    assert_array_equal(raw_conv._data, raw._data)
+    with pytest.raises(ValueError, match="Invalid value for the 'dtype'"):
+        raw.load_data(dtype="float16")
+    with pytest.raises(ValueError, match="Invalid value for the 'dtype'"):
+        raw.load_data(dtype="foo")
+    # memory-mapped data are not silently loaded into memory
+    raw_mmap = read_raw_fif(tmp_path / "test_raw.fif", preload=tmp_path / "data.dat")
+    with pytest.raises(ValueError, match="memory-mapped"):
+        raw_mmap.load_data(dtype="float32")
+    assert isinstance(raw_mmap.load_data(dtype="float64")._data, np.memmap)
+
+    def _assert_close(got, want, rtol=1e-5):
+        assert got.dtype == np.float32
+        assert_allclose(got, want, atol=rtol * np.abs(want).max())
+
+    # the data stay in single precision through processing
+    for inst in (raw, raw64):
+        inst.set_eeg_reference(projection=True)
+    for kind, func in (
+        ("fir", lambda r: r.filter(1.0, 20.0)),
+        ("iir", lambda r: r.filter(1.0, 20.0, method="iir")),
+        ("notch", lambda r: r.notch_filter(10.0)),
+        ("resample", lambda r: r.resample(50.0)),
+        ("proj", lambda r: r.apply_proj()),
+    ):
+        _assert_close(func(raw.copy())._data, func(raw64.copy())._data)
+    events = mne.find_events(raw)
+    for preload in (True, False):
+        epochs = mne.Epochs(raw, events, tmin=-0.2, tmax=0.5, preload=preload)
+        epochs64 = mne.Epochs(raw64, events, tmin=-0.2, tmax=0.5, preload=preload)
+        _assert_close(epochs.get_data(), epochs64.get_data())
+        _assert_close(epochs.average().data, epochs64.average().data)
+    _assert_close(
+        epochs.average().filter(None, 10.0, method="iir").data,
+        epochs64.average().filter(None, 10.0, method="iir").data,
+    )
+
+
 def test_5839():
     """Test concatenating raw objects with annotations."""
     # Global Time 0         1         2         3         4
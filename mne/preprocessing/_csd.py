@@ -21,7 +21,14 @@ from ..channels.interpolation import _calc_g, _calc_h
 from ..epochs import BaseEpochs, make_fixed_length_epochs
 from ..evoked import Evoked
 from ..io import BaseRaw
-from ..utils import _check_preload, _ensure_int, _validate_type, logger, verbose
+from ..utils import (
+    _check_preload,
+    _ensure_int,
+    _ensure_writeable,
+    _validate_type,
+    logger,
+    verbose,
+)
 
 
 def _prepare_G(G, lambda2):
@@ -109,6 +116,7 @@ def compute_current_source_density(
 
     _validate_type(copy, (bool), "copy")
     inst = inst.copy() if copy else inst
+    _ensure_writeable(inst)
 
     picks = pick_types(inst.info, meg=False, eeg=True, exclude=[])
 
@@ -14,6 +14,7 @@ from ..utils import (
     _check_fname,
     _check_option,
     _check_preload,
+    _ensure_writeable,
     _import_h5io_funcs,
     _validate_type,
     copy_function_doc_to_method_doc,
@@ -256,6 +257,7 @@ class EOGRegression:
             )
 
         _check_preload(inst, "artifact regression")
+        _ensure_writeable(inst)
         artifact_data = inst._data[..., picks_artifact, :]
         ref_data = artifact_data - np.mean(artifact_data, -1, keepdims=True)
         for pi, pick in enumerate(picks):
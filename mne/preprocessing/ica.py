@@ -69,6 +69,7 @@ from ..utils import (
     _check_option,
     _check_preload,
     _ensure_int,
+    _ensure_writeable,
     _get_inst_data,
     _on_missing,
     _pl,
@@ -2298,6 +2299,7 @@ class ICA(ContainsMixin):
     def _apply_epochs(self, epochs, include, exclude, n_pca_components):
         """Aux method."""
         _check_preload(epochs, "ica.apply")
+        _ensure_writeable(epochs)
 
         picks = pick_types(
             epochs.info, meg=False, ref_meg=False, include=self.ch_names, exclude="bads"
@@ -11,7 +11,13 @@ from ..epochs import BaseEpochs
 from ..event import find_events
 from ..evoked import Evoked
 from ..io import BaseRaw
-from ..utils import _check_option, _check_preload, _validate_type, fill_doc
+from ..utils import (
+    _check_option,
+    _check_preload,
+    _ensure_writeable,
+    _validate_type,
+    fill_doc,
+)
 
 
 def _get_window(start, end):
@@ -124,6 +130,7 @@ def fix_stim_artifact(
     picks = _picks_to_idx(inst.info, picks, "data", exclude=())
 
     _check_preload(inst, "fix_stim_artifact")
+    _ensure_writeable(inst)
     if isinstance(inst, BaseRaw):
         if events is None:
             events = find_events(inst, stim_channel=stim_channel)
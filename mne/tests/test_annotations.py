@@ -1241,6 +1241,73 @@ def test_sorting():
     assert_array_equal(annot.duration, duration)
 
 
+def test_append_buffered():
+    """Test that many appends give the same result as one."""
+    rng = np.random.default_rng(0)
+    onset = rng.uniform(0, 100, 1000).round(1)
+    duration = rng.choice([0, 0.5, 1], 1000)
+    description = rng.choice(["spike", "BAD_spike", "sharp"], 1000)
+    ch_names = [("MEG 0113",) if ii % 3 else () for ii in range(1000)]
+    want = Annotations(onset, duration, description, ch_names=ch_names)
+    annot = Annotations([], [], [])
+    for args in zip(onset, duration, description, ch_names):
+        assert annot.append(*args[:3], ch_names=[args[3]]) is annot
+    assert annot._pending is not None
+    assert len(annot) == 1000
+    assert annot._pending is None
+    assert annot == want
+    assert annot.description.dtype == want.description.dtype
+    # merging keeps sorting and the appended arrays are not aliased
+    annot.append(-1, 2, "first")
+    annot.onset += 1
+    assert annot.onset[0] == 0
+    assert annot.description[0] == "first"
+    assert_array_equal(annot.onset[1:], want.onset + 1)
+    annot.append([200, 101], 0, "last")
+    assert_array_equal(annot.onset[-2:], [101, 200])
+    assert count_annotations(annot) == {
+        **count_annotations(want),
+        "first": 1,
+        "last": 2,
+    }
+
+
+def test_overlapping():
+    """Test querying annotations that overlap a time span."""
+    rng = np.random.default_rng(0)
+    onset = rng.uniform(0, 100, 200)
+    duration = rng.exponential(2, 200)
+    duration[:20] = 0
+    duration[20:30] = np.nan
+    annot = Annotations(onset, duration, "BAD")
+    assert_array_equal(annot.overlapping(-10, 0), [])
+    assert_array_equal(annot.overlapping(0, 200), np.arange(200))
+    onset, duration = annot.onset, np.nan_to_num(annot.duration)
+    for tmin in rng.uniform(-5, 105, 20):
+        tmax = tmin + rng.exponential(3)
+        want = np.where((onset < tmax) & (onset + duration > tmin))[0]
+        assert_array_equal(annot.overlapping(tmin, tmax), want)
+        want = np.where((onset <= tmax) & (onset + duration >= tmin))[0]
+        assert_array_equal(annot.overlapping(tmin, tmax, inclusive=True), want)
+    # edges
+    annot = Annotations([1, 2.5, 4], [1, 0, 1], ["a", "b", "c"])
+    assert_array_equal(annot.overlapping(2, 4), [1])
+    assert_array_equal(annot.overlapping(2, 4, inclusive=True), [0, 1, 2])
+    # the index follows changes to the annotations
+    annot.append(3, 0.5, "d")
+    assert_array_equal(annot.overlapping(2, 4), [1, 2])
+    annot.delete(1)
+    assert_array_equal(annot.overlapping(2, 4), [1])
+    annot.onset += 1
+    assert_array_equal(annot.overlapping(2, 4), [0])
+    annot.set_durations(2)
+    assert_array_equal(annot.overlapping(0.5, 1.5), [])
+    assert_array_equal(annot.overlapping(3.5, 4.5), [0, 1])
+    annot.crop(4.5, 10)
+    assert_array_equal(annot.overlapping(2, 4), [])
+    assert_array_equal(annot.overlapping(4, 6), [0, 1])
+
+
 def test_date_none(tmp_path):
     """Test that DATE_NONE is used properly."""
     # Regression test for gh-5908
@@ -1856,6 +1856,36 @@ def test_split_many_reset(tmp_path):
     assert_allclose(epochs.get_data(), epochs_read.get_data())
 
 
+def test_split_random_access(tmp_path, monkeypatch):
+    """Test reading scattered subsets of split epochs from disk."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((1000, 2, 512))  # 8 kB per epoch
+    info = mne.create_info(2, 1000.0, "eeg")
+    epochs = EpochsArray(data, info, tmin=0.0)
+    fname = tmp_path / "temp-epo.fif"
+    epochs.save(fname, split_size="2.5MB")
+    epochs_read = read_epochs(fname, preload=False)
+    assert len(epochs_read._raw) > 2
+    monkeypatch.setattr(mne.epochs, "_EPOCHS_READ_BYTES", 100 * 8192)
+    reads = list()
+
+    def _read_epochs(*args, part, read):
+        reads.append(part)
+        return read(*args)
+
+    for part, raw in enumerate(epochs_read._raw):
+        read = partial(_read_epochs, part=part, read=raw.read_epochs)
+        monkeypatch.setattr(raw, "read_epochs", read)
+    for item in (rng.permutation(1000)[:200], [999, 3, 3, 4, 5], slice(10, 60)):
+        assert_allclose(epochs_read.get_data(item=item), data[item], rtol=1e-6)
+    assert len(reads) < 200 + 3 + 1  # runs of stored epochs are read at once
+    assert reads[-1:] == [0]  # only the part holding the epochs is touched
+    assert_allclose(epochs_read[::-3].get_data(), data[::-3], rtol=1e-6)
+    assert_allclose(
+        np.array([epoch for epoch in epochs_read[500:]]), data[500:], rtol=1e-6
+    )
+
+
 def _assert_splits(fname, n, size):
     __tracebackhide__ = True
     assert n >= 0
@@ -2227,6 +2257,31 @@ def test_reject_epochs(tmp_path):
     assert epochs_cleaned.flat == dict(grad=new_flat["grad"], mag=flat["mag"])
 
 
+@pytest.mark.parametrize("proj", (True, "delayed"))
+def test_reject_preloaded(proj, monkeypatch):
+    """Test that rejecting preloaded epochs matches rejecting them lazily."""
+    rng = np.random.default_rng(0)
+    info = create_info(["a", "b", "c", "d", "e"], 1000.0, ["eeg"] * 3 + ["eog"] * 2)
+    data = rng.standard_normal((5, 30000)) * 1e-5
+    data[:, 4900:5300] = 0
+    raw = RawArray(data, info)
+    raw.info["bads"] = ["b"]
+    raw.set_eeg_reference(projection=True)
+    events = make_fixed_length_events(raw, duration=0.3)
+    kwargs = dict(tmin=-0.1, tmax=0.2, reject_tmin=-0.05, reject_tmax=0.1, proj=proj)
+    reject = dict(eeg=5.7e-5, eog=6e-5)
+    flat = dict(eeg=1e-7)
+    want = Epochs(raw, events, reject=reject, flat=flat, **kwargs).drop_bad()
+    assert 0 < len(want) < len(events)
+    assert ("a", "c") in want.drop_log  # flat, bad channel ignored
+    monkeypatch.setattr(mne.epochs, "_EPOCHS_READ_BYTES", 3 * 5 * 301 * 8)
+    epochs = Epochs(raw, events, preload=True, **kwargs)
+    epochs.drop_bad(reject=reject, flat=flat)
+    assert epochs.drop_log == want.drop_log
+    assert_array_equal(epochs.selection, want.selection)
+    assert_array_equal(epochs.get_data(), want.get_data())
+
+
 @testing.requires_testing_data
 def test_callable_reject():
     """Test using a callable for rejection."""
@@ -2791,6 +2846,103 @@ def test_iter_epochs(preload):
     assert_allclose(data, epochs_data, atol=1e-20)
 
 
+def test_lazy_epochs_coalesced_reads(tmp_path, monkeypatch):
+    """Test that overlapping lazy epochs are read together."""
+    rng = np.random.default_rng(0)
+    info = create_info(4, 100.0, "eeg")
+    raw = RawArray(rng.standard_normal((4, 2000)) * 1e-6, info, first_samp=50)
+    raw.set_annotations(Annotations(raw.first_time + 12.0, 0.5, "BAD_x"))
+    raw.save(tmp_path / "test_raw.fif")
+    raw = read_raw_fif(tmp_path / "test_raw.fif")
+    events = np.array([[raw.first_samp + s, 0, 1] for s in range(5, 2000, 40)])
+    kwargs = dict(tmin=-0.2, tmax=0.5, reject=dict(eeg=5.8e-6), detrend=0)
+    want = Epochs(raw, events, preload=True, **kwargs)
+    assert "BAD_x" in sum(want.drop_log, ())  # annotation
+    assert "NO_DATA" in sum(want.drop_log, ())  # out of bounds
+    assert set(raw.ch_names) & set(sum(want.drop_log, ()))  # reject
+    reads = list()
+    getitem = raw._getitem
+
+    def _getitem(item, *args, **kw):
+        reads.append(item[1])
+        return getitem(item, *args, **kw)
+
+    monkeypatch.setattr(raw, "_getitem", _getitem)
+    epochs = Epochs(raw, events, preload=False, **kwargs)
+    assert_array_equal(np.array([epoch for epoch in epochs]), want.get_data(copy=False))
+    assert 1 < len(reads) < 5
+    epochs.drop_bad()
+    assert epochs.drop_log == want.drop_log
+    assert_allclose(epochs.get_data(), want.get_data())
+    assert_allclose(epochs.average().data, want.average().data)
+    assert_allclose(epochs[::3].get_data(), want[::3].get_data())
+    # reads are limited in size
+    monkeypatch.setattr(mne.epochs, "_EPOCHS_READ_BYTES", 8 * 4 * 100)
+    del reads[:]
+    assert_allclose(epochs.get_data(), want.get_data())
+    assert len(reads) > len(epochs) / 2
+    assert max(read.stop - read.start for read in reads) <= 100
+
+
+def _raise_deepcopy(self, memodict):
+    raise RuntimeError("memory-mapped data should not be copied")
+
+
+def test_epochs_memmap(tmp_path, monkeypatch):
+    """Test loading epochs into a memmap and operating on it in blocks."""
+    rng = np.random.default_rng(0)
+    info = create_info(3, 1000.0, "eeg")
+    raw = RawArray(rng.standard_normal((3, 20000)) * 1e-5, info)
+    events = make_fixed_length_events(raw, duration=0.3)
+    kwargs = dict(tmin=-0.1, tmax=0.2, reject=dict(eeg=6.5e-5))
+    monkeypatch.setattr(mne.epochs, "_EPOCHS_READ_BYTES", 3 * 3 * 301 * 8)
+    fname = tmp_path / "epochs.dat"
+    with pytest.raises(TypeError, match="preload must be"):
+        Epochs(raw, events, preload=1, **kwargs)
+    want = Epochs(raw, events, preload=True, **kwargs)
+    epochs = Epochs(raw, events, preload=fname, **kwargs)
+    assert 0 < len(epochs) < len(events)
+    assert isinstance(epochs._data, np.memmap)
+    assert fname.is_file()
+    assert_array_equal(epochs.get_data(), want.get_data())
+    for func in (
+        lambda e: e.apply_baseline((None, 0.05)),
+        lambda e: e.filter(None, 40.0, method="iir"),
+        lambda e: e.crop(-0.05, 0.15),
+        lambda e: e.resample(300.0),
+        lambda e: e.resample(700.0),
+        lambda e: e.drop([1, 5, 6]),
+    ):
+        func(epochs)
+        func(want)
+        assert isinstance(epochs._data, np.memmap)
+        assert_array_equal(epochs.get_data(), want.get_data())
+    # copies are in memory and do not remove the file
+    epochs_copy = epochs[:5]
+    assert not isinstance(epochs_copy._data, np.memmap)
+    del epochs_copy
+    # only the selected epochs are copied
+    with monkeypatch.context() as m:
+        m.setattr(np.memmap, "__deepcopy__", _raise_deepcopy, raising=False)
+        for item in ([0], [3, 1], "1"):
+            epochs_copy = epochs[item]
+            assert not isinstance(epochs_copy._data, np.memmap)
+            assert_array_equal(epochs_copy.get_data(), want[item].get_data())
+        del epochs_copy
+    assert isinstance(epochs._data, np.memmap)
+    assert_array_equal(epochs.get_data(), want.get_data())
+    assert fname.is_file()
+    del epochs
+    assert not fname.is_file()
+    # reading from disk
+    want.save(tmp_path / "test-epo.fif")
+    epochs = read_epochs(tmp_path / "test-epo.fif", preload=fname)
+    assert isinstance(epochs._data, np.memmap)
+    assert_allclose(epochs.get_data(), want.get_data(), rtol=1e-6)
+    del epochs
+    assert not fname.is_file()
+
+
 def test_subtract_evoked():
     """Test subtraction of Evoked from Epochs."""
     raw, events, picks = _get_data()
@@ -3882,6 +4034,44 @@ def test_concatenate_epochs_large():
     assert np.max(many_epochs_cat.events[:, 0]) < max_expected_sample_index
 
 
+def test_concatenate_epochs_lazy(tmp_path):
+    """Test concatenating epochs without copying their data."""
+    raw, events, picks = _get_data()
+    epochs = Epochs(
+        raw=raw, events=events, event_id=event_id, tmin=tmin, tmax=tmax, picks=picks
+    )
+    epochs_pre = epochs.copy().load_data()
+    epochs_pre.drop([1, 3])
+    epochs_list = [epochs, epochs_pre, epochs]
+    want = concatenate_epochs(epochs_list)
+    epochs_cat = concatenate_epochs(epochs_list, preload=False)
+    assert not epochs_cat.preload
+    assert_array_equal(epochs_cat.events, want.events)
+    assert epochs_cat.drop_log == want.drop_log
+    assert epochs_cat.baseline == want.baseline
+    # items are read from the right sources
+    for item in (slice(None, None, 3), [4, 0, len(want) - 1], "1"):
+        assert_allclose(epochs_cat[item].get_data(), want[item].get_data())
+    assert_allclose(np.array(list(epochs_cat[2:9])), want[2:9].get_data())
+    assert_allclose(epochs_cat.average().data, want.average().data)
+    # copies and dropping keep the map to the sources
+    epochs_cat.copy().drop([0, 5])
+    epochs_cat.drop([0, 5])
+    want.drop([0, 5])
+    assert_allclose(epochs_cat.copy().get_data(), want.get_data())
+    epochs_cat.load_data()
+    assert epochs_cat.preload
+    assert epochs_cat._raw is None
+    assert_allclose(epochs_cat.get_data(), want.get_data())
+    # into a memmap
+    epochs_cat = concatenate_epochs(epochs_list, preload=tmp_path / "cat.dat")
+    assert epochs_cat.preload
+    assert isinstance(epochs_cat._data, np.memmap)
+    assert_allclose(epochs_cat.get_data(), concatenate_epochs(epochs_list).get_data())
+    with pytest.raises(TypeError, match="preload must be"):
+        concatenate_epochs(epochs_list, preload=1)
+
+
 def test_add_channels():
     """Test epoch splitting / re-appending channel types."""
     raw, events, picks = _get_data()
@@ -4382,6 +4572,80 @@ def test_make_metadata_bounded_by_row_or_tmin_tmax_event_names(tmin, tmax):
         assert metadata.iloc[2][last_event_name] > 0
 
 
+def test_make_metadata_keep_first_last():
+    """Test the event times and names aggregated by make_metadata."""
+    pytest.importorskip("pandas")
+    event_id = {"cue": 1, "resp/left": 2, "resp/right": 3}
+    events = np.array(
+        [[0, 0, 1], [50, 0, 3], [60, 0, 2], [80, 0, 3], [100, 0, 1], [140, 0, 2]]
+    )
+    metadata, events_new, _ = make_metadata(
+        events=events,
+        event_id=event_id,
+        tmin=0.0,
+        tmax=0.9,
+        sfreq=100.0,
+        row_events="cue",
+        keep_first="resp",
+        keep_last="resp/right",
+    )
+    assert_array_equal(events_new, events[[0, 4]])
+    assert_array_equal(metadata.index, [0, 4])
+    assert_allclose(metadata["resp/left"], [0.6, 0.4])
+    assert_allclose(metadata["resp/right"], [0.8, np.nan])
+    assert_allclose(metadata["resp"], [0.5, 0.4])
+    assert list(metadata["first_resp"]) == ["right", "left"]
+    # windows bounded by the next event of the same type
+    metadata, _, _ = make_metadata(
+        events=events, event_id=event_id, tmin=None, tmax=None, sfreq=100.0
+    )
+    assert_allclose(metadata["cue"], [0, np.nan, 0.4, 0.2, 0, np.nan])
+    assert_allclose(metadata["resp/left"], [0.6, 0.1, 0, 0.6, 0.4, 0])
+    assert_allclose(metadata["resp/right"], [0.5, 0, 0.2, 0, np.nan, np.nan])
+
+
+def test_metadata_query_cache(monkeypatch):
+    """Test that metadata queries are cached while the metadata are private."""
+    pd = pytest.importorskip("pandas")
+    info = create_info(1, 100.0, "eeg")
+    epochs = EpochsArray(np.zeros((4, 1, 2)), info)
+    epochs.metadata = pd.DataFrame(dict(rt=[0.1, 0.6, 0.7, 0.2]))
+    queries = list()
+    query = pd.DataFrame.query
+    monkeypatch.setattr(
+        pd.DataFrame,
+        "query",
+        lambda *args, **kw: queries.append(1) or query(*args, **kw),
+    )
+    for _ in range(3):
+        assert_array_equal(epochs["rt > 0.5"].events[:, 0], [1, 2])
+    assert repr(epochs)
+    assert len(queries) == 1
+    assert len(epochs["rt < 0.5"]) == 2
+    assert len(queries) == 2
+    # once handed out, the metadata can be modified in place at any time
+    md = epochs.metadata
+    assert len(epochs["rt > 0.5"]) == 2
+    assert len(queries) == 3
+    md.loc[:, "rt"] = 0.0
+    assert len(epochs["rt > 0.5"]) == 0
+    assert len(epochs["rt > 0.5"]) == 0
+    assert len(queries) == 5
+    # until new metadata are set
+    epochs.metadata = pd.DataFrame(dict(rt=[0.1, 0.6, 0.7, 0.8]))
+    del md
+    for _ in range(2):
+        assert len(epochs["rt > 0.5"]) == 3
+    assert len(queries) == 6
+    # the number of cached queries is limited
+    for ii in range(50):
+        assert len(epochs[f"rt > {ii + 1}"]) == 0
+    assert len(epochs._metadata_queries) == 32
+    assert len(queries) == 56
+    assert len(epochs["rt > 50"]) == 0
+    assert len(queries) == 56
+
+
 def test_events_list():
     """Test that events can be a list."""
     events = [[100, 0, 1], [200, 0, 1], [300, 0, 1]]
@@ -4712,6 +4976,80 @@ def test_make_fixed_length_epochs():
     assert "2" in epochs.event_id and len(epochs.event_id) == 1
 
 
+def test_make_fixed_length_epochs_view(tmp_path):
+    """Test fixed-length epochs as a read-only view of preloaded raw data."""
+    rng = np.random.default_rng(0)
+    info = create_info(3, 100.0, "eeg")
+    raw = RawArray(rng.standard_normal((3, 3000)), info)
+    # copies by default
+    epochs = make_fixed_length_epochs(raw, duration=2.0, overlap=1.0, preload=True)
+    assert epochs._data.flags.writeable
+    assert not np.shares_memory(epochs._data, raw._data)
+    want = epochs.get_data()
+    raw_2 = raw.copy()
+    epochs = make_fixed_length_epochs(raw_2, duration=2.0, overlap=1.0, preload=True)
+    raw_2._data[:] = 0.0  # does not modify the epochs
+    assert_array_equal(epochs.get_data(), want)
+    with pytest.raises(TypeError, match="copy must be"):
+        make_fixed_length_epochs(raw, preload=True, copy=None)
+    epochs = make_fixed_length_epochs(
+        raw, duration=2.0, overlap=1.0, preload=True, copy=False
+    )
+    epochs_copy = make_fixed_length_epochs(raw, duration=2.0, overlap=1.0)
+    epochs_copy.load_data()
+    assert epochs.preload
+    assert not epochs._data.flags.writeable
+    assert np.shares_memory(epochs._data, raw._data)
+    assert not np.shares_memory(epochs_copy._data, raw._data)
+    assert_array_equal(epochs.get_data(), epochs_copy.get_data())
+    assert_array_equal(epochs.get_data(picks=[2, 0]), epochs_copy.get_data([2, 0]))
+    assert epochs.drop_log == epochs_copy.drop_log
+    # copies share the view, modifying the data copies it first
+    epochs_2 = epochs.copy()
+    assert np.shares_memory(epochs_2._data, raw._data)
+    orig = raw.get_data()
+    epochs_2.filter(None, 20.0)
+    epochs_copy.filter(None, 20.0)
+    assert epochs_2._data.flags.writeable
+    assert not np.shares_memory(epochs_2._data, raw._data)
+    assert_array_equal(epochs_2.get_data(), epochs_copy.get_data())
+    assert_array_equal(raw.get_data(), orig)
+    epochs_2 = epochs.copy().apply_baseline((None, 0.5))
+    assert_allclose(epochs_2.get_data()[..., :51].mean(-1), 0, atol=1e-12)
+    assert_array_equal(raw.get_data(), orig)
+    # selecting epochs copies the data
+    assert epochs[1:3]._data.flags.writeable
+    # saving scales a copy of the data
+    epochs.save(tmp_path / "test-epo.fif")
+    assert np.shares_memory(epochs._data, raw._data)
+    assert_array_equal(raw.get_data(), orig)
+    epochs_read = read_epochs(tmp_path / "test-epo.fif")
+    assert_allclose(epochs_read.get_data(), epochs.get_data(), rtol=1e-6)
+    # rejection compacts a copy of the data
+    ptp = np.ptp(epochs.get_data(), axis=-1).max(-1)
+    reject = dict(eeg=np.median(ptp))
+    epochs_2 = epochs.copy().drop_bad(reject=reject)
+    want = make_fixed_length_epochs(raw, duration=2.0, overlap=1.0)
+    want.load_data().drop_bad(reject=reject)
+    assert 0 < len(epochs_2) < len(epochs)
+    assert_array_equal(epochs_2.get_data(), want.get_data())
+    assert_array_equal(raw.get_data(), orig)
+    # views returned by get_data can be modified without modifying raw
+    epochs_2 = epochs.copy()
+    data = epochs_2.get_data(copy=False)
+    assert data.flags.writeable
+    data[0] = 0.0
+    assert_array_equal(epochs_2.get_data()[0], 0.0)
+    assert_array_equal(raw.get_data(), orig)
+    # bad annotations fall back to copying
+    raw.set_annotations(Annotations([10.0], [1.0], ["BAD"]))
+    epochs = make_fixed_length_epochs(
+        raw, duration=2.0, overlap=1.0, preload=True, copy=False
+    )
+    assert not np.shares_memory(epochs._data, raw._data)
+    assert len(epochs) < len(epochs_copy)
+
+
 def test_epochs_huge_events(tmp_path):
     """Test epochs with event numbers that are too large."""
     data = np.zeros((1, 1, 1000))
@@ -14,6 +14,7 @@ from numpy.testing import (
     assert_equal,
 )
 
+import mne
 from mne import (
     Annotations,
     Epochs,
@@ -414,6 +415,55 @@ def test_find_events():
         find_events(raw)
 
 
+@pytest.mark.parametrize("chunk", (7, 10, 1000))
+def test_find_events_chunked(chunk, tmp_path, monkeypatch):
+    """Test finding events when reading the stim channels in chunks."""
+    rng = np.random.default_rng(0)
+    data = np.zeros((3, 500))
+    for ch in range(2):
+        for start in np.arange(10 + 3 * ch, 490, 12):
+            n = rng.integers(1, 8)
+            data[ch, start : start + n] = rng.integers(1, 5) + 4 * ch
+            data[ch, start + n // 2 : start + n] += rng.integers(0, 2)
+    data[0, :3] = 3  # non-zero initial value
+    data[2] = np.repeat(rng.integers(0, 3, 50), 10)
+    info = create_info(["STI1", "STI2", "MEG"], 1000.0, ["stim", "stim", "mag"])
+    raw = RawArray(data, info, first_samp=100)
+    raw.save(tmp_path / "test_raw.fif")
+    kwargs = [
+        dict(),
+        dict(consecutive=True, output="step", initial_event=True),
+        dict(consecutive=False, output="offset"),
+        dict(min_duration=0.003),
+        dict(mask=3, stim_channel="STI1"),
+    ]
+    stim_channels = ("STI1", ["STI1", "STI2"], "MEG")
+
+    def _find_all(raw):
+        events = [
+            find_events(
+                raw, **{"stim_channel": ["STI1", "STI2"], **kw}, shortest_event=1
+            )
+            for kw in kwargs
+        ]
+        steps = [
+            find_stim_steps(raw, stim_channel=ch, pad_start=0, pad_stop=0, merge=m)
+            for ch in stim_channels
+            for m in (0, -2, 2)
+        ]
+        return events + steps
+
+    # a single chunk is the same as working on the whole stim channel
+    monkeypatch.setattr(mne.event, "_STIM_CHUNK_SAMPLES", 10000)
+    want = _find_all(raw)
+    assert len(want[0]) > 20
+    assert_array_equal(want[-3][1:-1, 0] - 100, np.where(np.diff(data[2]))[0] + 1)
+    monkeypatch.setattr(mne.event, "_STIM_CHUNK_SAMPLES", chunk)
+    for this_raw in (raw, read_raw_fif(tmp_path / "test_raw.fif")):
+        for got, events in zip(_find_all(this_raw), want):
+            assert_array_equal(got, events)
+
+
 def test_pick_events():
     """Test pick events in a events ndarray."""
     events = np.array([[1, 0, 1], [2, 1, 0], [3, 0, 4], [4, 4, 2], [5, 2, 0]])
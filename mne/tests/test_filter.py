@@ -15,7 +15,7 @@ from numpy.testing import (
 from scipy.signal import butter, freqz, sosfreqz
 from scipy.signal import resample as sp_resample
 
-from mne import Epochs, create_info
+from mne import Epochs, EpochsArray, EvokedArray, create_info
 from mne._fiff.pick import _DATA_CH_TYPES_SPLIT
 from mne.filter import (
     _length_factors,
@@ -781,8 +781,13 @@ def test_filter_auto():
     # degenerate conditions
     pytest.raises(ValueError, filter_data, x, -sfreq, 1, 10)
     pytest.raises(ValueError, filter_data, x, sfreq, 1, sfreq * 0.75)
+    # single precision data are filtered in single precision
+    x_filt = filter_data(x, sfreq, None, 10)
+    x_filt_32 = filter_data(x.astype(np.float32), sfreq, None, 10)
+    assert x_filt_32.dtype == np.float32
+    assert_allclose(x_filt_32, x_filt, rtol=1e-4, atol=1e-5 * np.abs(x).max())
     with pytest.raises(ValueError, match="Data to be filtered must be real"):
-        filter_data(x.astype(np.float32), sfreq, None, 10)
+        filter_data(x.astype(np.float16), sfreq, None, 10)
     with pytest.raises(ValueError, match="Data to be filtered must be real"):
         filter_data([1j], 1000.0, None, 40.0)
     with pytest.raises(TypeError, match="instance of ndarray"):
@@ -1060,6 +1065,39 @@ def test_filter_picks():
                 assert_allclose(raw.get_data(), want)
 
 
+@resample_method_parametrize
+def test_filter_resample_chunk_size(method):
+    """Test filtering and resampling in blocks of epochs or channels."""
+    rng = np.random.RandomState(0)
+    info = create_info(["a", "b", "c", "d"], 1000.0, ["eeg", "eeg", "eeg", "stim"])
+    epochs = EpochsArray(rng.randn(7, 4, 500), info)
+    evoked = EvokedArray(rng.randn(4, 500), info)
+    raw = RawArray(rng.randn(4, 2000), info)
+    for inst in (epochs, evoked, raw):
+        for fir_method in ("fir", "iir"):
+            want = inst.copy().filter(None, 40.0, method=fir_method)
+            for chunk_size in (1, 2, 3, 100):
+                got = inst.copy().filter(
+                    None, 40.0, method=fir_method, chunk_size=chunk_size
+                )
+                assert_array_equal(got.get_data(), want.get_data())
+    # channels not picked are not filtered
+    want = raw.copy().filter(None, 40.0, picks=[0, 2])
+    got = raw.copy().filter(None, 40.0, picks=[0, 2], chunk_size=1)
+    assert_array_equal(got.get_data([1, 3]), raw.get_data([1, 3]))
+    assert_array_equal(got.get_data([0, 2]), want.get_data([0, 2]))
+    for inst in (epochs, evoked):
+        want = inst.copy().resample(300.0, method=method)
+        for chunk_size in (1, 3):
+            got = inst.copy().resample(300.0, method=method, chunk_size=chunk_size)
+            assert got.info["sfreq"] == want.info["sfreq"]
+            assert_allclose(got.get_data(), want.get_data(), atol=1e-12)
+    with pytest.raises(ValueError, match="positive integer"):
+        epochs.copy().filter(None, 40.0, chunk_size=0)
+    with pytest.raises(TypeError, match="chunk_size"):
+        epochs.copy().filter(None, 40.0, chunk_size=1.5)
+
+
 def test_filter_minimum_phase_bug():
     """Test gh-12267 is fixed."""
     sfreq = 1000.0
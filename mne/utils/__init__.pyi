@@ -67,6 +67,7 @@ __all__ = [
     "_empty_hash",
     "_ensure_events",
     "_ensure_int",
+    "_ensure_writeable",
     "_explain_exception",
     "_file_like",
     "_freq_mask",
@@ -256,6 +257,7 @@ from .check import (
     _check_time_format,
     _ensure_events,
     _ensure_int,
+    _ensure_writeable,
     _import_h5io_funcs,
     _import_h5py,
     _import_nibabel,
@@ -351,6 +351,13 @@ def _check_preload(inst, msg):
             inst._handle_empty("raise", msg)
 
 
+def _ensure_writeable(inst):
+    """Copy data that are a read-only view (e.g., of Raw data) to modify them."""
+    data = getattr(inst, "_data", None)
+    if isinstance(data, np.ndarray) and not data.flags.writeable:
+        inst._data = data.copy()
+
+
 def _check_compensation_grade(info1, info2, name1, name2="data", ch_names=None):
     """Ensure that objects have same compensation_grade."""
     from .._fiff.compensator import get_current_comp
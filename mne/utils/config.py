@@ -174,6 +174,12 @@ _known_config_types = {
     "MNE_DATASETS_REFMEG_NOISE_PATH": "str, path for refmeg_noise data",
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
+    "MNE_FIF_FID_POOL_SIZE": (
+        "int, maximum number of FIF file handles kept open between raw data reads"
+    ),
+    "MNE_FIF_INDEX_DIR": (
+        "str, path to a directory used to cache the parsed tag directory of FIF files"
+    ),
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function "
@@ -725,6 +725,17 @@ chpi_locs : dict
     "times", "rrs", "moments", and "gofs".
 """
 
+docdict["chunk_size_filter"] = """
+chunk_size : int | None
+    Number of epochs (for :class:`~mne.Epochs`) or channels (otherwise) to
+    process at once. Smaller blocks bound the memory used for temporary
+    arrays and parallel jobs, with the same results. If None (default), the
+    data are processed at once, except for memory-mapped epochs, which are
+    processed in blocks of epochs.
+
+    .. versionadded:: 1.10
+"""
+
 docdict["clim"] = """
 clim : str | dict
     Colorbar properties specification. If 'auto', set clim automatically
@@ -1192,6 +1203,16 @@ dtype : numpy.dtype
     (default) the data type is not modified.
 """
 
+docdict["dtype_data"] = """
+dtype : None | str | numpy.dtype
+    The floating point precision to hold the data in, ``'float64'`` or
+    ``'float32'`` (complex data are held in the corresponding complex type).
+    If None (default), the data type is not modified. Single precision halves
+    memory use; filtering, resampling, baseline correction and averaging keep
+    single precision data in single precision, using double precision
+    accumulators where needed.
+"""
+
 # %%
 # E
 
@@ -1289,7 +1310,12 @@ encoding : str
 docdict["epochs_preload"] = """
     Load all epochs from disk when creating the object
     or wait before accessing each epoch (more memory
-    efficient but can be slower).
+    efficient but can be slower). If path-like, the epochs are loaded
+    into a memory-mapped file at that location that is removed when the
+    object is deleted (slower, but requires less memory).
+
+    .. versionchanged:: 1.10
+       Support for loading into a memory-mapped file.
 """
 
 docdict["epochs_reject_tmin_tmax"] = """
@@ -2677,6 +2703,17 @@ docdict["method_tfr_epochs"] = _method_tfr_template.format(
     ":footcite:p:`Stockwell2007,MoukademEtAl2014,WheatEtAl2010,JonesEtAl2006`",
 )
 
+docdict["mmap_fif"] = """
+mmap : bool
+    If True (default False), the data are not preloaded, but the data buffers
+    of the (uncompressed) FIF file(s) are memory-mapped and on-demand reads are
+    served directly from the mapping, with calibration and projection applied
+    on access. This keeps memory usage low and lets the OS page cache be shared
+    between processes reading the same file. Requires ``preload=False``.
+
+    .. versionadded:: 1.10
+"""
+
 docdict["mode_eltc"] = """
 mode : str
     Extraction mode, see Notes.
@@ -2796,6 +2833,16 @@ n_jobs : int | str
     is installed properly and ``method='fir'``.
 """
 
+docdict["n_jobs_read"] = """
+n_jobs : int | None
+    The number of threads to use to read data that are not preloaded. The
+    read is split across files (e.g., the parts of a split FIF file) and
+    contiguous blocks of time, which are read concurrently directly into
+    the output array. This helps on storage that needs several outstanding
+    requests to reach its full throughput (e.g., NVMe or network file
+    systems). If ``-1``, it is set to the number of CPU cores. ``None``
+    (default) means ``n_jobs=1``. Has no effect for preloaded data."""
+
 docdict["n_pca_components_apply"] = """
 n_pca_components : int | float | None
     The number of PCA components to be kept, either absolute (int)
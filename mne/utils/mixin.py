@@ -19,6 +19,9 @@ from .numerics import _time_mask, object_hash, object_size
 logger = logging.getLogger("mne")  # one selection here used across mne-python
 logger.propagate = False  # don't propagate (in case of multiple imports)
 
+# Maximum number of metadata query results cached per instance
+_METADATA_QUERIES_CACHE_SIZE = 32
+
 
 class SizeMixin:
     """Estimate MNE object sizes."""
@@ -201,12 +204,26 @@ class GetEpochsMixin:
         `Epochs` or tuple(Epochs, np.ndarray) if `return_indices` is True
             subset of epochs (and optionally array with kept epoch indices)
         """
-        inst = self.copy() if copy else self
-        if self._data is not None:
-            np.copyto(inst._data, self._data, casting="no")
-        del self
+        from ..epochs import _is_memmap, _rewrite_memmap
+
+        # select before copying, so that cached metadata queries are reused
+        select = self._item_to_select(item)
+        data = self._data
+        # only the selected epochs of memory-mapped data are copied (below)
+        shared = copy and select_data and self.preload and _is_memmap(data)
+        if shared:
+            self._data = None
+            try:
+                inst = self.copy()
+            finally:
+                self._data = data
+            inst._data = data
+        else:
+            inst = self.copy() if copy else self
+            if data is not None:
+                np.copyto(inst._data, data, casting="no")
+        del self, data
 
-        select = inst._item_to_select(item)
         has_selection = hasattr(inst, "selection")
         if has_selection:
             key_selection = inst.selection[select]
@@ -226,21 +243,32 @@ class GetEpochsMixin:
             del drop_log
 
         inst.events = np.atleast_2d(inst.events[select])
-        if inst.metadata is not None:
+        if inst._metadata is not None:
             pd = _check_pandas_installed(strict=False)
             if pd:
-                metadata = inst.metadata.iloc[select]
+                metadata = inst._metadata.iloc[select]
                 if has_selection:
                     metadata.index = inst.selection
             else:
-                metadata = np.array(inst.metadata, "object")[select].tolist()
+                metadata = np.array(inst._metadata, "object")[select].tolist()
 
             # will reset the index for us
             GetEpochsMixin.metadata.fset(inst, metadata, verbose=False)
         if inst.preload and select_data:
-            # ensure that each Epochs instance owns its own data so we can
-            # resize later if necessary
-            inst._data = np.require(inst._data[select], requirements=["O"])
+            keep = np.arange(len(inst._data))[select]
+            if not shared and _is_memmap(inst._data) and (np.diff(keep) > 0).all():
+                # compact the memmap within its file instead of loading it
+                inst._data = _rewrite_memmap(
+                    inst._data, (len(keep),) + inst._data.shape[1:], select=keep
+                )
+            else:
+                # ensure that each Epochs instance owns its own data so we can
+                # resize later if necessary
+                data = inst._data[select]
+                if isinstance(data, np.memmap):  # a slice, copied to memory
+                    inst._data = np.array(data, subok=False)
+                else:
+                    inst._data = np.require(data, requirements=["O"])
         if drop_event_id:
             # update event id to reflect new content of inst
             inst.event_id = {
@@ -272,22 +300,17 @@ class GetEpochsMixin:
             )[0]
         except KeyError as err:
             # Could we in principle use metadata with these Epochs and keys?
-            if len(keys) != 1 or self.metadata is None:
+            if len(keys) != 1 or getattr(self, "_metadata", None) is None:
                 # If not, raise original error
                 raise
             msg = str(err.args[0])  # message for KeyError
             pd = _check_pandas_installed(strict=False)
             # See if the query can be done
             if pd:
-                md = self.metadata if hasattr(self, "_metadata") else None
-                self._check_metadata(metadata=md)
+                self._check_metadata(metadata=self._metadata)
                 try:
                     # Try metadata
-                    vals = (
-                        self.metadata.reset_index()
-                        .query(keys[0], engine="python")
-                        .index.values
-                    )
+                    vals = self._query_metadata(keys[0])
                 except Exception as exp:
                     msg += (
                         " The epochs.metadata Pandas query did not "
@@ -303,6 +326,28 @@ class GetEpochsMixin:
                 )
             raise KeyError(msg)
 
+    def _query_metadata(self, query):
+        """Get the indices of the epochs matching a metadata query.
+
+        The results are cached per query string and metadata version, but only
+        while nobody else can modify the metadata in place (see metadata).
+        """
+        _check_pandas_installed()
+        version = getattr(self, "_metadata_version", 0)
+        cache = self.__dict__.setdefault("_metadata_queries", OrderedDict())
+        entry = cache.get(query)
+        if entry is not None and entry[0] == version:
+            cache.move_to_end(query)
+            return entry[1].copy()
+        vals = self._metadata.reset_index().query(query, engine="python")
+        vals = vals.index.values
+        if getattr(self, "_metadata_private", False):
+            cache[query] = (version, vals.copy())
+            cache.move_to_end(query)
+            while len(cache) > _METADATA_QUERIES_CACHE_SIZE:
+                cache.popitem(last=False)
+        return vals
+
     def __len__(self):
         """Return the number of epochs.
 
@@ -384,7 +429,7 @@ class GetEpochsMixin:
             while not is_good:
                 if self._current >= len(self.events):
                     self._stop_iter()
-                epoch_noproj = self._get_epoch_from_raw(self._current)
+                epoch_noproj = self._get_next_epoch_from_raw()
                 epoch_noproj = self._detrend_offset_decim(
                     epoch_noproj, self._current_detrend_picks
                 )
@@ -403,6 +448,7 @@ class GetEpochsMixin:
     def _stop_iter(self):
         del self._current
         del self._current_detrend_picks
+        self.__dict__.pop("_current_raw_epochs", None)
         raise StopIteration  # signal the end
 
     next = __next__  # originally for Python2, now b/c public
@@ -437,6 +483,10 @@ class GetEpochsMixin:
     @property
     def metadata(self):
         """Get the metadata."""
+        # the DataFrame can now be modified in place, so do not trust or store
+        # cached queries until new metadata are set
+        self._metadata_version = getattr(self, "_metadata_version", 0) + 1
+        self._metadata_private = False
         return self._metadata
 
     @metadata.setter
@@ -458,6 +508,9 @@ class GetEpochsMixin:
             action = "Not setting" if metadata is None else "Adding"
         logger.info(f"{action} metadata{n_col}")
         self._metadata = metadata
+        # _check_metadata copied it, so only we can modify it
+        self._metadata_version = getattr(self, "_metadata_version", 0) + 1
+        self._metadata_private = metadata is not None
 
 
 def _check_decim(info, decim, offset, check_filter=True):
@@ -610,6 +663,8 @@ class ExtendedTimeMixin(TimeMixin):
         -----
         %(notes_tmax_included_by_default)s
         """
+        from ..epochs import _is_memmap, _rewrite_memmap
+
         t_vars = dict(tmin=tmin, tmax=tmax)
         for name, t_var in t_vars.items():
             _validate_type(
@@ -643,7 +698,14 @@ class ExtendedTimeMixin(TimeMixin):
         self._set_times(self.times[mask])
         self._raw_times = self._raw_times[mask]
         self._update_first_last()
-        self._data = self._data[..., mask]
+        if _is_memmap(self._data):
+            self._data = _rewrite_memmap(
+                self._data,
+                self._data.shape[:-1] + (mask.sum(),),
+                lambda data: data[..., mask],
+            )
+        else:
+            self._data = self._data[..., mask]
 
         return self
 
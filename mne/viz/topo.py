@@ -12,7 +12,15 @@ from scipy import ndimage
 
 from .._fiff.pick import _picks_to_idx, channel_type, pick_types
 from ..defaults import _handle_default
-from ..utils import Bunch, _check_option, _clean_names, _is_numeric, _to_rgb, fill_doc
+from ..utils import (
+    Bunch,
+    _check_option,
+    _clean_names,
+    _ensure_writeable,
+    _is_numeric,
+    _to_rgb,
+    fill_doc,
+)
 from .utils import (
     DraggableColorbar,
     _check_cov,
@@ -1235,6 +1243,7 @@ def plot_topo_image_epochs(
     ch_types = epochs.get_channel_types()
     scale_coeffs = [scalings.get(ch_type, 1) for ch_type in ch_types]
     # scale the data
+    _ensure_writeable(epochs)
     epochs._data *= np.array(scale_coeffs)[:, np.newaxis]
     data = epochs.get_data(copy=False)
     # get vlims for each channel type
@@ -0,0 +1,87 @@
+"""Benchmark processing raw data in single instead of double precision.
+
+Runs the usual preprocessing steps on synthetic EEG-like data (a random walk
+on top of large per-channel offsets, the worst case for single precision since
+the offsets get removed) held in float64 and in float32, and reports the time
+taken and the maximum error of the float32 result relative to the peak of the
+float64 result. Typical results::
+
+    operation   rel. error   float64   float32
+    fir           2.1e-06     0.90 s    0.64 s
+    iir           2.8e-06     0.70 s    0.63 s
+    notch         6.9e-08     0.82 s    0.72 s
+    resample      6.8e-08     1.15 s    1.11 s
+    polyphase     6.7e-08     0.35 s    0.40 s
+    epochs        7.4e-07
+    evoked        2.0e-06
+
+The errors are dominated by the rounding of the input data to single precision
+(about 6e-8 of the offsets), which becomes relatively larger once filtering or
+baseline correction has removed the offsets. Intermediate results are
+accumulated in double precision, so the errors do not grow with the length of
+the recording or the number of epochs.
+
+Usage::
+
+    python tools/dev/bench_float32.py [n_channels] [duration]
+"""
+
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import sys
+import time
+
+import numpy as np
+
+import mne
+
+mne.set_log_level("warning")
+n_channels = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+duration = float(sys.argv[2]) if len(sys.argv) > 2 else 600.0
+sfreq = 1000.0
+
+rng = np.random.default_rng(0)
+info = mne.create_info(n_channels, sfreq, "eeg")
+n_times = int(round(sfreq * duration))
+data = np.cumsum(rng.standard_normal((n_channels, n_times)), axis=1) * 1e-7
+data += 5e-5 * rng.standard_normal((n_channels, 1))
+raws = {
+    dtype: mne.io.RawArray(data, info).load_data(dtype=dtype)
+    for dtype in ("float64", "float32")
+}
+print(f"{n_channels} channels, {duration} s: ", end="")
+print(", ".join(f"{d} {raw._data.nbytes / 1e6:.0f} MB" for d, raw in raws.items()))
+
+
+def _rel_error(got, want):
+    return np.abs(got - want).max() / np.abs(want).max()
+
+
+operations = dict(
+    fir=lambda raw: raw.filter(1.0, 40.0),
+    iir=lambda raw: raw.filter(1.0, 40.0, method="iir"),
+    notch=lambda raw: raw.notch_filter(50.0),
+    resample=lambda raw: raw.resample(250.0),
+    polyphase=lambda raw: raw.resample(250.0, method="polyphase"),
+)
+print("operation   rel. error   float64   float32")
+for name, operation in operations.items():
+    out, dur = dict(), dict()
+    for dtype, raw in raws.items():
+        raw = raw.copy()
+        t0 = time.perf_counter()
+        operation(raw)
+        dur[dtype] = time.perf_counter() - t0
+        out[dtype] = raw.get_data()
+    err = _rel_error(out["float32"], out["float64"])
+    print(f"{name:10s}  {err:9.1e}  {dur['float64']:6.2f} s  {dur['float32']:6.2f} s")
+
+events = mne.make_fixed_length_events(raws["float64"], duration=1.0)
+out = dict()
+for dtype, raw in raws.items():
+    epochs = mne.Epochs(raw, events, tmin=-0.2, tmax=0.5, preload=True)
+    out[dtype] = (epochs.get_data(), epochs.average().data)
+for ii, name in enumerate(("epochs", "evoked")):
+    print(f"{name:10s}  {_rel_error(out['float32'][ii], out['float64'][ii]):9.1e}")